@@ -0,0 +1,119 @@
+# /// script
+# dependencies = []
+# ///
+"""Measure the memory of forked workers serving icons, with and without preload.
+
+For each mode, a master process imports tablerpy, optionally preloads it, and
+forks workers that serve every icon through `WSGIApp` and look up every icon
+name. Each worker then reports its memory from ``/proc/self/smaps_rollup``,
+while all workers are alive. Linux only.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import os
+import sys
+from typing import Sequence
+from wsgiref.util import setup_testing_defaults
+
+import tablerpy
+
+_FIELDS = ("Rss", "Pss", "Private_Clean", "Private_Dirty")
+_MODES = ("lazy", "preload", "preload+freeze")
+
+
+def main(args: Sequence[str] | None = None) -> int:
+    """Command line entry-point.
+
+    Returns:
+        Exit code.
+    """
+    namespace = parse_args(args)
+    sys.stdout.write(
+        f"{'mode':<16} {'rss':>10} {'pss':>10} {'private':>10}  per worker (KiB)\n",
+    )
+    for mode in _MODES:
+        read, write = os.pipe()
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover
+            os.close(read)
+            os.write(write, run_master(mode, namespace.workers).encode())
+            os._exit(0)
+        os.close(write)
+        with os.fdopen(read) as file:
+            sys.stdout.write(file.read())
+        os.waitpid(pid, 0)
+    return 0
+
+
+def parse_args(args: Sequence[str] | None) -> argparse.Namespace:  # noqa: D103
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Number of forked workers. (default: %(default)s)",
+    )
+    return parser.parse_args(args)
+
+
+def run_master(mode: str, workers: int) -> str:
+    """Fork ``workers`` after preparing tablerpy for ``mode``, return a report line."""
+    if mode.startswith("preload"):
+        tablerpy.preload()
+    if mode.endswith("freeze"):
+        gc.freeze()
+
+    barrier_read, barrier_write = os.pipe()
+    results_read, results_write = os.pipe()
+    pids = []
+    for _ in range(workers):
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover
+            os.close(barrier_write)
+            os.close(results_read)
+            serve()
+            memory = smaps_rollup()
+            os.write(results_write, (" ".join(map(str, memory)) + "\n").encode())
+            os.read(barrier_read, 1)  # Stay alive until every worker is measured.
+            os._exit(0)
+        pids.append(pid)
+    os.close(results_write)
+
+    with os.fdopen(results_read) as file:
+        samples = [list(map(int, file.readline().split())) for _ in pids]
+    os.write(barrier_write, b"x" * workers)
+    for pid in pids:
+        os.waitpid(pid, 0)
+
+    rss, pss, clean, dirty = (sum(column) // workers for column in zip(*samples))
+    return f"{mode:<16} {rss:>10,} {pss:>10,} {clean + dirty:>10,}\n"
+
+
+def serve() -> None:
+    """Serve every icon through `WSGIApp` and look up every icon name."""
+    app = tablerpy.WSGIApp()
+    table = tablerpy.load_table()
+    for row in range(len(table)):
+        name = f"{table.style(row)}/{table.name(row)}"
+        environ = {"PATH_INFO": f"/{name}.svg"}
+        setup_testing_defaults(environ)
+        for _ in app(environ, lambda *_: lambda _: None):  # type: ignore[arg-type]
+            pass
+        tablerpy.lookup(name)
+
+
+def smaps_rollup() -> tuple[int, ...]:
+    """Return the process memory fields of `_FIELDS`, in KiB."""
+    values = {}
+    with open("/proc/self/smaps_rollup", encoding="ascii") as file:  # noqa: PTH123
+        for line in file:
+            key, _, value = line.partition(":")
+            values[key] = value.split()[0] if value.strip() else "0"
+    return tuple(int(values[field]) for field in _FIELDS)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
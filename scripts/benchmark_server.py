@@ -0,0 +1,183 @@
+# /// script
+# dependencies = []
+# ///
+"""Measure the throughput of the tablerpy icon server applications."""
+
+from __future__ import annotations
+
+import argparse
+import http.client
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from socketserver import ThreadingMixIn
+from typing import TYPE_CHECKING, Sequence
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
+from wsgiref.util import setup_testing_defaults
+
+from tablerpy import WSGIApp, load_table
+
+if TYPE_CHECKING:
+    from typing import Callable
+
+    from _typeshed import OptExcInfo
+    from _typeshed.wsgi import WSGIEnvironment
+
+
+def main(args: Sequence[str] | None = None) -> int:
+    """Command line entry-point.
+
+    Returns:
+        Exit code.
+    """
+    namespace = parse_args(args)
+    app = WSGIApp()
+    table = load_table()
+    rng = random.Random(namespace.seed)  # noqa: S311
+    paths = [
+        f"/{table.style(row)}/{table.name(row)}.svg"
+        for row in rng.choices(range(len(table)), k=namespace.paths)
+    ]
+    etags = {path: request(app, path)[1] for path in paths}
+
+    requests, clients = namespace.requests, namespace.clients
+    for label, conditions in (("full", {}), ("conditional", etags)):
+        duration = bench_app(app, paths, conditions, requests)
+        report(f"in-process {label}", requests, duration)
+        duration = bench_http(app, paths, conditions, requests, clients)
+        report(f"http {label}", requests, duration)
+    return 0
+
+
+def parse_args(args: Sequence[str] | None) -> argparse.Namespace:  # noqa: D103
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--requests",
+        type=int,
+        default=20_000,
+        help="Number of requests per scenario. (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--clients",
+        type=int,
+        default=8,
+        help="Number of concurrent HTTP clients. (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--paths",
+        type=int,
+        default=1000,
+        help="Number of distinct icons requested. (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Random seed of the requested icons. (default: %(default)s)",
+    )
+    return parser.parse_args(args)
+
+
+def request(app: WSGIApp, path: str, etag: str | None = None) -> tuple[str, str]:
+    """Call ``app`` in-process and return the response status and ETag."""
+    environ: WSGIEnvironment = {"PATH_INFO": path}
+    if etag is not None:
+        environ["HTTP_IF_NONE_MATCH"] = etag
+    setup_testing_defaults(environ)
+    response: list[str] = []
+
+    def start_response(
+        status: str,
+        headers: list[tuple[str, str]],
+        exc_info: OptExcInfo | None = None,  # noqa: ARG001
+    ) -> Callable[[bytes], object]:
+        response.append(status)
+        response.append(dict(headers).get("ETag", ""))
+        return lambda _: None
+
+    for _ in app(environ, start_response):
+        pass
+    return response[0], response[1]
+
+
+def bench_app(
+    app: WSGIApp,
+    paths: Sequence[str],
+    etags: dict[str, str],
+    requests: int,
+) -> float:
+    """Return the duration of ``requests`` in-process calls to ``app``."""
+    start = time.perf_counter()
+    for index in range(requests):
+        path = paths[index % len(paths)]
+        request(app, path, etags.get(path))
+    return time.perf_counter() - start
+
+
+class ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
+    """WSGI reference server handling each request in a thread."""
+
+    daemon_threads = True
+
+
+class QuietHandler(WSGIRequestHandler):
+    """Request handler not logging requests."""
+
+    def log_message(self, *args: object) -> None:
+        """Ignore the request log."""
+
+
+def bench_http(
+    app: WSGIApp,
+    paths: Sequence[str],
+    etags: dict[str, str],
+    requests: int,
+    clients: int,
+) -> float:
+    """Return the duration of ``requests`` HTTP requests to ``app``.
+
+    ``app`` is served by the threading WSGI reference server and the requests
+    are sent by ``clients`` concurrent threads.
+    """
+    server = make_server(
+        "127.0.0.1",
+        0,
+        app,
+        server_class=ThreadingWSGIServer,
+        handler_class=QuietHandler,
+    )
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address[:2]
+
+    def client(offset: int) -> None:
+        for index in range(offset, requests, clients):
+            path = paths[index % len(paths)]
+            headers = {"If-None-Match": etags[path]} if path in etags else {}
+            connection = http.client.HTTPConnection(str(host), port)
+            connection.request("GET", path, headers=headers)
+            connection.getresponse().read()
+            connection.close()
+
+    try:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(clients) as executor:
+            list(executor.map(client, range(clients)))
+        return time.perf_counter() - start
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def report(label: str, requests: int, duration: float) -> None:
+    """Print the throughput of a scenario."""
+    sys.stdout.write(
+        f"{label:<24} {requests / duration:>10,.0f} req/s"
+        f" {duration / requests * 1e6:>8.1f} us/req\n",
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+# /// script
+# dependencies = []
+# ///
+"""Measure the memory of worker processes caching icons, shared or not.
+
+Workers are started with the ``spawn`` method, so nothing is shared through
+copy-on-write. In the ``bundle`` mode, workers read icons from the memory-mapped
+bundle file. In the ``private`` mode, each worker copies every icon in its own
+memory with `IconTable.preload`. In the ``shared`` mode, the parent opens a
+`SharedIconCache` and workers attach to it. Each worker then reads every icon
+and reports its memory from ``/proc/self/smaps_rollup``, while all workers are
+alive. Linux only.
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import sys
+from typing import TYPE_CHECKING, Sequence
+
+import tablerpy
+
+if TYPE_CHECKING:
+    from multiprocessing.queues import Queue
+    from multiprocessing.synchronize import Barrier
+
+_FIELDS = ("Pss", "Private_Clean", "Private_Dirty")
+
+
+def main(args: Sequence[str] | None = None) -> int:
+    """Command line entry-point.
+
+    Returns:
+        Exit code.
+    """
+    namespace = parse_args(args)
+    sys.stdout.write(
+        f"{'mode':<8} {'workers':>8} {'total pss':>10} {'private':>10}  (KiB)\n",
+    )
+    for mode in ("bundle", "private", "shared"):
+        for workers in namespace.workers:
+            if mode == "shared":
+                with tablerpy.SharedIconCache():
+                    pss, private = run_workers(mode, workers)
+            else:
+                pss, private = run_workers(mode, workers)
+            sys.stdout.write(f"{mode:<8} {workers:>8} {pss:>10,} {private:>10,}\n")
+    return 0
+
+
+def parse_args(args: Sequence[str] | None) -> argparse.Namespace:  # noqa: D103
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=[1, 2, 4, 8],
+        help="Numbers of workers. (default: %(default)s)",
+    )
+    return parser.parse_args(args)
+
+
+def run_workers(mode: str, workers: int) -> tuple[int, int]:
+    """Run ``workers`` processes, return their total PSS and private memory."""
+    context = multiprocessing.get_context("spawn")
+    barrier = context.Barrier(workers + 1)
+    queue: Queue[tuple[int, ...]] = context.Queue()
+    processes = [
+        context.Process(target=work, args=(mode, barrier, queue))
+        for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    barrier.wait()  # Every worker is measured, and stays alive until now.
+    samples = [queue.get() for _ in processes]
+    for process in processes:
+        process.join()
+    pss = sum(sample[0] for sample in samples)
+    private = sum(sample[1] + sample[2] for sample in samples)
+    return pss, private
+
+
+def work(mode: str, barrier: Barrier, queue: Queue[tuple[int, ...]]) -> None:
+    """Read every icon after caching them for ``mode``, put memory fields."""
+    table = tablerpy.load_table()
+    cache = tablerpy.SharedIconCache()
+    if mode == "shared":
+        cache.open()
+    elif mode == "private":
+        table.preload(range(len(table)))
+    for row in range(len(table)):
+        table.data(row).tobytes()
+    queue.put(smaps_rollup())
+    barrier.wait()
+    cache.close()
+
+
+def smaps_rollup() -> tuple[int, ...]:
+    """Return the process memory fields of `_FIELDS`, in KiB."""
+    values = {}
+    with open("/proc/self/smaps_rollup", encoding="ascii") as file:  # noqa: PTH123
+        for line in file:
+            key, _, value = line.partition(":")
+            values[key] = value.split()[0] if value.strip() else "0"
+    return tuple(int(values[field]) for field in _FIELDS)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
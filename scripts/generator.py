@@ -4,28 +4,66 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
+import http
+import http.client
+import importlib
+import json
 import logging
-import shutil
+import os
+import py_compile
+import re
+import sys
+import tarfile
 import tempfile
 import time
 import urllib.request
+import xml.etree.ElementTree as ET
 import zipfile
 from collections import deque
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait
+from contextlib import contextmanager, suppress
+from dataclasses import asdict, dataclass, field, replace
 from functools import partial
-from pathlib import Path
-from typing import TYPE_CHECKING, Callable, Iterator, Sequence
-from urllib.error import HTTPError
+from itertools import chain
+from pathlib import Path, PurePosixPath
+from typing import (
+    TYPE_CHECKING,
+    BinaryIO,
+    Callable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+from urllib.error import ContentTooShortError, HTTPError, URLError
+
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None  # type: ignore[assignment]
 
 if TYPE_CHECKING:
+    from types import ModuleType
+
     from _typeshed import StrPath
 
 
 logger = logging.getLogger("tablerpy-generator")
 
+T = TypeVar("T")
+R = TypeVar("R")
+
 
-def main(args: Sequence[str] | None = None) -> None:
-    """Command line entry-point."""
+def main(args: Sequence[str] | None = None) -> int:
+    """Command line entry-point.
+
+    Returns:
+        Exit code, ``1`` if icons fail validation.
+    """
     logging.basicConfig(
         format="%(asctime)s %(levelname)-8s %(name)s :: %(message)s",
         datefmt="%H:%M:%S",
@@ -33,7 +71,6 @@ def main(args: Sequence[str] | None = None) -> None:
     )
 
     namespace = parse_args(args)
-    version: str = namespace.version
     package: Path = namespace.package
     packs = [
         IconPack(
@@ -41,26 +78,124 @@ def main(args: Sequence[str] | None = None) -> None:
             icons_extract_dir=package / "icons" / "filled",
             enum_name="FilledIcon",
             enum_py=package / "filled.py",
+            icons_npm_dir=Path("icons/filled"),
         ),
         IconPack(
             icons_archive_dir=Path("svg/outline"),
             icons_extract_dir=package / "icons" / "outline",
             enum_name="OutlineIcon",
             enum_py=package / "outline.py",
+            icons_npm_dir=Path("icons/outline"),
         ),
     ]
 
-    download_tabler_icons(version=version, packs=packs)
+    workers = Workers(jobs=namespace.jobs, processes=namespace.processes)
+    metrics = Metrics()
+    try:
+        return _generate(namespace, packs, workers, metrics)
+    finally:
+        content = metrics.to_json()
+        logger.debug("Metrics: %s", json.dumps(json.loads(content)))
+        if namespace.metrics is not None:
+            logger.info("Writing metrics '%s'", namespace.metrics)
+            namespace.metrics.write_text(content, encoding="utf-8")
 
-    for pack in packs:
-        logger.info("Writing enum file '%s'", pack.enum_py)
-        pack.enum_py.parent.mkdir(parents=True, exist_ok=True)
-        with pack.enum_py.open("wt") as f:
-            f.write(f"import enum\n\n\nclass {pack.enum_name}(enum.Enum):\n")
-            for svg in sorted(pack.icons_extract_dir.glob("*.svg")):
-                key = svg.stem.upper().replace("-", "_")
-                value = svg.name
-                f.write(f'    {key} = "{value}"\n')
+
+def _generate(
+    namespace: argparse.Namespace,
+    packs: Sequence[IconPack],
+    workers: Workers,
+    metrics: Metrics,
+) -> int:
+    package: Path = namespace.package
+    manifest = package / "icons" / MANIFEST
+    metadata = namespace.metadata.read_bytes() if namespace.metadata else None
+    report = None
+    # Icons are validated before being extracted, not to leave the package
+    # half updated, or only once extracted when not updating them.
+    validation = None if namespace.no_validate else ValidationReport()
+    if namespace.source is not None:
+        with metrics.phase("extract") as phase:
+            report = extract_icons(
+                namespace.source,
+                packs,
+                manifest,
+                workers=workers,
+                metrics=phase,
+                validation=validation,
+            )
+        metadata = metadata or read_source_metadata(namespace.source)
+    elif namespace.version is not None:
+        report = download_tabler_icons(
+            version=namespace.version,
+            packs=packs,
+            manifest=manifest,
+            workers=workers,
+            cache_dir=None if namespace.no_cache else namespace.cache_dir,
+            sha256=namespace.sha256,
+            policy=DownloadPolicy(
+                retries=namespace.retries,
+                segments=namespace.segments,
+            ),
+            metrics=metrics,
+            validation=validation,
+        )
+
+    if validation is not None:
+        if report is None:
+            with metrics.phase("validation") as phase:
+                validation = validate_icons(packs, workers=workers, metrics=phase)
+        for style, filename, message in validation:
+            logger.error("Invalid icon '%s/%s': %s", style, filename, message)
+        logger.info("Validation: %s", validation.summary())
+        if namespace.validation_report is not None:
+            logger.info("Writing validation report '%s'", namespace.validation_report)
+            namespace.validation_report.write_text(
+                validation.to_json(),
+                encoding="utf-8",
+            )
+        if validation.violations:
+            return 1
+
+    if report is not None:
+        logger.info("Icon changes: %s", report.summary())
+        if namespace.report is not None:
+            logger.info("Writing change report '%s'", namespace.report)
+            namespace.report.write_text(report.to_json(), encoding="utf-8")
+
+        with metrics.phase("enums") as phase:
+            written = write_enums(packs, pyc=namespace.pyc)
+            phase.files_in = sum(
+                len(hashes) for hashes in read_manifest(manifest).values()
+            )
+            phase.files_out = len(written)
+            phase.bytes_out = sum(path.stat().st_size for path in written)
+
+    _build_artifacts(package, metadata, metrics)
+    return 0
+
+
+def _build_artifacts(package: Path, metadata: bytes | None, metrics: Metrics) -> None:
+    build = import_build_module(package)
+    with metrics.phase("transform") as phase:
+        if metadata is not None:
+            build.write_metadata(
+                build.parse_metadata(metadata),
+                package / "icons" / build.METADATA,
+            )
+        records, icons_metadata = build.read_package(package)
+        artifacts = build.compile_artifacts(records, icons_metadata)
+        phase.files_in = len(records)
+        phase.bytes_in = sum(len(record.data) for record in records)
+        phase.files_out = len(artifacts)
+        phase.bytes_out = sum(map(len, artifacts.values()))
+
+    with metrics.phase("bundle") as phase:
+        written = build.write_artifacts(package, artifacts)
+        phase.files_in = len(artifacts)
+        phase.bytes_in = sum(map(len, artifacts.values()))
+        phase.files_out = len(written)
+        phase.bytes_out = sum(path.stat().st_size for path in written)
 
 
 def parse_args(args: Sequence[str] | None) -> argparse.Namespace:  # noqa: D103
@@ -70,24 +205,165 @@ def parse_args(args: Sequence[str] | None) -> argparse.Namespace:  # noqa: D103
             "and generate Python files."
         ),
     )
-    parser.add_argument(
+    origin = parser.add_mutually_exclusive_group()
+    origin.add_argument(
         "--version",
-        required=True,
         help="Tabler Icons release version",
     )
+    origin.add_argument(
+        "--source",
+        type=Path,
+        help=(
+            "Local release zip, @tabler/icons npm tarball or unpacked directory "
+            "to generate from instead of a downloaded release"
+        ),
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=default_cache_dir(),
+        help="Directory of downloaded releases, keyed by version",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Download the release to a temporary directory",
+    )
+    parser.add_argument(
+        "--sha256",
+        help="Expected SHA-256 of the release archive",
+    )
+    parser.add_argument(
+        "--retries",
+        type=int,
+        default=DownloadPolicy.retries,
+        help="Number of consecutive download failures retried, resuming the download",
+    )
+    parser.add_argument(
+        "--segments",
+        type=int,
+        default=DownloadPolicy.segments,
+        help="Number of parallel range requests for large downloads",
+    )
     parser.add_argument(
         "--package",
         type=Path,
         default=Path(__file__).parent.parent / "src" / "tablerpy",
         help="Target package directory",
     )
-    return parser.parse_args(args)
+    parser.add_argument(
+        "--metadata",
+        type=Path,
+        help="Tabler icons metadata file (icons.json) with tags and categories",
+    )
+    parser.add_argument(
+        "--report",
+        type=Path,
+        help="Write added, removed and modified icons per style to a JSON file",
+    )
+    parser.add_argument(
+        "--pyc",
+        choices=["checked", "unchecked"],
+        help="Compile enum modules to hash-based .pyc files (PEP 552)",
+    )
+    parser.add_argument(
+        "--validation-report",
+        type=Path,
+        help="Write icons validation violations per style to a JSON file",
+    )
+    parser.add_argument(
+        "--no-validate",
+        action="store_true",
+        help="Skip icons validation",
+    )
+    parser.add_argument(
+        "--metrics",
+        type=Path,
+        help="Write per-phase time, I/O and peak memory metrics to a JSON file",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        help="Number of workers for per-icon work. Default to the number of CPUs",
+    )
+    parser.add_argument(
+        "--processes",
+        action="store_true",
+        help="Run per-icon work on a process pool instead of a thread pool",
+    )
+    parser.add_argument(
+        "--artifacts-only",
+        action="store_true",
+        help="Only rebuild runtime artifacts from the package icons",
+    )
+    namespace = parser.parse_args(args)
+    if (
+        namespace.version is None
+        and namespace.source is None
+        and not namespace.artifacts_only
+    ):
+        parser.error(
+            "one of the arguments --version --source --artifacts-only is required",
+        )
+    return namespace
+
+
+def write_enums(packs: Sequence[IconPack], pyc: str | None = None) -> list[Path]:
+    """Write ``packs`` enum modules, optionally compiled (see `compile_pyc`).
+
+    Returns:
+        Paths to the changed enum modules.
+    """
+    written = []
+    for pack in packs:
+        build = import_build_module(pack.enum_py.parent)
+        names = [svg.stem for svg in pack.icons_extract_dir.glob("*.svg")]
+        source = build.render_enum(pack.enum_name, names)
+        if build.write_if_changed(pack.enum_py, source.encode("utf-8")):
+            logger.info("Wrote enum file '%s'", pack.enum_py)
+            written.append(pack.enum_py)
+        else:
+            logger.info("Enum file '%s' is up to date", pack.enum_py)
+        if pyc is not None:
+            compile_pyc(pack.enum_py, pyc)
+    return written
+
+
+def compile_pyc(path: Path, mode: str) -> None:
+    """Compile ``path`` to a hash-based ``.pyc`` (``checked`` or ``unchecked``).
+
+    Hash-based pycs are validated against the source content rather than its
+    modification time (PEP 552), and ``unchecked`` ones are not validated at all.
+    """
+    invalidation_mode = {
+        "checked": py_compile.PycInvalidationMode.CHECKED_HASH,
+        "unchecked": py_compile.PycInvalidationMode.UNCHECKED_HASH,
+    }[mode]
+    cfile = py_compile.compile(str(path), invalidation_mode=invalidation_mode)
+    logger.debug("Compiled '%s' (%s hash)", cfile, mode)
+
+
+def import_build_module(package: Path) -> ModuleType:
+    """Import ``package`` own build module, compiling its runtime artifacts."""
+    sys.path.insert(0, str(package.parent))
+    try:
+        return importlib.import_module(f"{package.name}._build")
+    finally:
+        sys.path.pop(0)
 
 
 class TagNotFoundError(Exception):
     """Raised when a tag is requested but is not available."""
 
 
+class ChecksumError(Exception):
+    """Raised when a downloaded file does not match its expected SHA-256."""
+
+
+class DownloadError(Exception):
+    """Raised when a server response cannot be used to download a file."""
+
+
 @dataclass(frozen=True)
 class IconPack:
     """Icons pack information."""
@@ -104,9 +380,434 @@ class IconPack:
     enum_py: Path
     """Python file to write generated enum."""
 
+    icons_npm_dir: Path | None = None
+    """Relative path to icon directory in the ``@tabler/icons`` npm package."""
+
+    @property
+    def style(self) -> str:
+        """Icons style, the extraction directory name."""
+        return self.icons_extract_dir.name
+
+
+@dataclass
+class ChangeReport:
+    """Icon files added, removed and modified by an extraction, per style."""
+
+    added: dict[str, list[str]] = field(default_factory=dict)
+    removed: dict[str, list[str]] = field(default_factory=dict)
+    modified: dict[str, list[str]] = field(default_factory=dict)
+
+    def record(self, change: str, style: str, filename: str) -> None:
+        """Record ``filename`` of ``style`` as ``change`` (e.g. ``added``)."""
+        changes: dict[str, list[str]] = getattr(self, change)
+        changes.setdefault(style, []).append(filename)
+
+    def summary(self) -> str:
+        """Return a one line summary of the changes."""
+        return ", ".join(
+            f"{sum(map(len, getattr(self, change).values()))} {change}"
+            for change in ("added", "removed", "modified")
+        )
+
+    def to_json(self) -> str:
+        """Return the report as JSON, with sorted file names per style."""
+        content = {
+            change: {
+                style: sorted(filenames)
+                for style, filenames in sorted(getattr(self, change).items())
+            }
+            for change in ("added", "removed", "modified")
+        }
+        return json.dumps(content, indent=2) + "\n"
+
+
+@dataclass
+class PhaseMetrics:
+    """Resources used by a generator phase."""
+
+    name: str
+    wall_time: float = 0.0
+    """Elapsed time in seconds."""
+
+    cpu_time: float = 0.0
+    """User and system CPU time in seconds, including terminated worker processes."""
+
+    bytes_in: int = 0
+    bytes_out: int = 0
+    files_in: int = 0
+    files_out: int = 0
+
+    peak_memory: int | None = None
+    """Peak resident memory in bytes. Measured per phase on Linux, elsewhere the
+    process peak so far. `None` if unavailable."""
+
+
+class Metrics:
+    """Per-phase metrics of a generator run."""
+
+    def __init__(self) -> None:
+        self.phases: list[PhaseMetrics] = []
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[PhaseMetrics]:
+        """Measure a phase, whose inputs and outputs are counted by the caller."""
+        phase = PhaseMetrics(name)
+        _reset_peak_memory()
+        start_time, start_cpu = time.perf_counter(), _cpu_time()
+        try:
+            yield phase
+        finally:
+            phase.wall_time = time.perf_counter() - start_time
+            phase.cpu_time = _cpu_time() - start_cpu
+            phase.peak_memory = _peak_memory()
+            self.phases.append(phase)
+            logger.debug(
+                "Phase %s: %.2fs wall, %.2fs cpu, %d files in, %d files out",
+                name,
+                phase.wall_time,
+                phase.cpu_time,
+                phase.files_in,
+                phase.files_out,
+            )
+
+    def to_json(self) -> str:
+        """Return phases metrics as JSON, in run order."""
+        content = {"phases": [asdict(phase) for phase in self.phases]}
+        return json.dumps(content, indent=2) + "\n"
+
+
+def _cpu_time() -> float:
+    times = os.times()
+    return times.user + times.system + times.children_user + times.children_system
+
+
+def _reset_peak_memory() -> None:
+    # Linux resets the peak resident set size (VmHWM) on "5".
+    with suppress(OSError):
+        Path("/proc/self/clear_refs").write_text("5", encoding="ascii")
+
+
+def _peak_memory() -> int | None:
+    with suppress(OSError):
+        status = Path("/proc/self/status").read_text(encoding="ascii")
+        match = re.search(r"^VmHWM:\s+(\d+) kB$", status, re.MULTILINE)
+        if match:
+            return int(match[1]) * 1024
+    if resource is None:
+        return None
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+
+SVG_NAMESPACE = "http://www.w3.org/2000/svg"
+
+SVG_ELEMENTS = frozenset(
+    {"svg", "g", "path", "circle", "ellipse", "line", "polyline", "polygon", "rect"},
+)
+"""Elements allowed in icons."""
+
+SVG_ATTRIBUTES = frozenset(
+    {
+        "class",
+        "width",
+        "height",
+        "viewBox",
+        "fill",
+        "stroke",
+        "stroke-width",
+        "stroke-linecap",
+        "stroke-linejoin",
+        "opacity",
+        "fill-opacity",
+        "stroke-opacity",
+        "transform",
+        "d",
+        "cx",
+        "cy",
+        "r",
+        "rx",
+        "ry",
+        "x",
+        "y",
+        "x1",
+        "y1",
+        "x2",
+        "y2",
+        "points",
+    },
+)
+"""Attributes allowed in icons."""
+
+ROOT_ATTRIBUTES = {
+    "outline": {
+        "width": "24",
+        "height": "24",
+        "viewBox": "0 0 24 24",
+        "fill": "none",
+        "stroke": "currentColor",
+        "stroke-width": "2",
+        "stroke-linecap": "round",
+        "stroke-linejoin": "round",
+    },
+    "filled": {
+        "width": "24",
+        "height": "24",
+        "viewBox": "0 0 24 24",
+        "fill": "currentColor",
+    },
+}
+"""Required ``<svg>`` attributes, per style."""
+
+_PAINTS = frozenset({"none", "currentColor"})
+
+
+@dataclass
+class ValidationReport:
+    """Icons validation violations, per style and file name."""
+
+    icons: int = 0
+    """Number of validated icons."""
+
+    violations: dict[str, dict[str, list[str]]] = field(default_factory=dict)
+
+    def __iter__(self) -> Iterator[tuple[str, str, str]]:
+        """Iterate over ``(style, filename, message)`` violations."""
+        for style, files in sorted(self.violations.items()):
+            for filename, messages in sorted(files.items()):
+                for message in messages:
+                    yield style, filename, message
+
+    def summary(self) -> str:
+        """Return a one line summary of the validation."""
+        invalid = sum(map(len, self.violations.values()))
+        return f"{self.icons} icons, {invalid} invalid, {len(list(self))} violations"
+
+    def to_json(self) -> str:
+        """Return the report as JSON, with sorted styles and file names."""
+        content = {
+            "icons": self.icons,
+            "violations": {
+                style: dict(sorted(files.items()))
+                for style, files in sorted(self.violations.items())
+            },
+        }
+        return json.dumps(content, indent=2) + "\n"
+
+
+def validate_icons(
+    packs: Sequence[IconPack],
+    *,
+    workers: Workers | None = None,
+    metrics: PhaseMetrics | None = None,
+) -> ValidationReport:
+    """Validate ``packs`` extracted icons (see `validate_icon`).
+
+    Icons are parsed in contiguous chunks on a process pool, parsing being CPU
+    bound, with ``workers`` number of workers.
+    """
+    workers = replace(workers or Workers(), processes=True)
+    files = [
+        (str(path), pack.style)
+        for pack in packs
+        for path in sorted(pack.icons_extract_dir.glob("*.svg"))
+    ]
+    report = ValidationReport(icons=len(files))
+    results = chain.from_iterable(workers.map(_validate_files, workers.chunks(files)))
+    for (path, style), (size, messages) in zip(files, results):
+        if messages:
+            report.violations.setdefault(style, {})[Path(path).name] = messages
+        if metrics is not None:
+            metrics.files_in += 1
+            metrics.bytes_in += size
+    return report
+
+
+def _validate_files(files: Sequence[tuple[str, str]]) -> list[tuple[int, list[str]]]:
+    """Return size and violations of each ``(path, style)`` icon file."""
+    results = []
+    for path, style in files:
+        data = Path(path).read_bytes()
+        results.append((len(data), validate_icon(data, style, Path(path).stem)))
+    return results
+
+
+def validate_icon(data: bytes, style: str, name: str) -> list[str]:
+    """Return violations of Tabler conventions in ``style`` icon ``name`` svg.
+
+    Checks the svg is well-formed, only uses `SVG_ELEMENTS` and
+    `SVG_ATTRIBUTES`, has the `ROOT_ATTRIBUTES` of its style (e.g. a
+    ``0 0 24 24`` viewBox), the icon classes, and only paints with ``none``
+    or ``currentColor``.
+    """
+    try:
+        root = ET.fromstring(data)  # noqa: S314
+    except ET.ParseError as exc:
+        return [f"Malformed svg: {exc}"]
+
+    return _root_violations(root, style, name) + _element_violations(root)
+
+
+def _root_violations(root: ET.Element, style: str, name: str) -> list[str]:
+    violations = []
+    if root.tag != f"{{{SVG_NAMESPACE}}}svg":
+        violations.append(f"Unexpected root element {root.tag}")
+    for attribute, expected in ROOT_ATTRIBUTES[style].items():
+        value = root.get(attribute)
+        if value != expected:
+            violations.append(f"<svg> {attribute} is {value!r}, expected {expected!r}")
+    classes = set(root.get("class", "").split())
+    violations.extend(
+        f"<svg> class is missing {expected!r}"
+        for expected in (f"icons-tabler-{style}", f"icon-tabler-{name}")
+        if expected not in classes
+    )
+    return violations
+
+
+def _element_violations(root: ET.Element) -> list[str]:
+    violations = []
+    for element in root.iter():
+        namespace, _, tag = element.tag.rpartition("}")
+        if namespace != f"{{{SVG_NAMESPACE}" or tag not in SVG_ELEMENTS:
+            violations.append(f"Unexpected element <{element.tag}>")
+            continue
+        for attribute, value in element.attrib.items():
+            if attribute not in SVG_ATTRIBUTES:
+                violations.append(f"Unexpected attribute {attribute!r} on <{tag}>")
+            elif attribute in {"fill", "stroke"} and value not in _PAINTS:
+                violations.append(f"Hardcoded {attribute} {value!r} on <{tag}>")
+    return violations
+
+
+MIN_CHUNK_SIZE = 64 * 1024
+MAX_CHUNK_SIZE = 4 * 1024 * 1024
+"""Bounds of download read sizes, doubled on fast reads and halved on slow ones."""
+
+MIN_SEGMENT_SIZE = 1024 * 1024
+"""Minimum size of a parallel download segment."""
+
+_FAST_READ = 0.05
+_SLOW_READ = 1.0
+_RETRY_STATUS = frozenset({408, 425, 429, 500, 502, 503, 504})
+_CONTENT_RANGE = re.compile(r"bytes (\d+)-(\d+)/(\d+|\*)")
+
+NPM_ROOT = "package"
+"""Root directory of npm package tarballs."""
+
+ICONS_METADATA = "icons.json"
+"""Tabler icons metadata file, with tags and categories."""
+
+MANIFEST = "manifest.json"
+"""Icons content hashes file, in the icons directory."""
+
+
+def read_manifest(path: Path) -> dict[str, dict[str, str]]:
+    """Return ``{style: {filename: sha256}}`` from manifest ``path``, if it exists."""
+    if not path.exists():
+        return {}
+    content = json.loads(path.read_text(encoding="utf-8"))
+    return content["icons"]
+
 
-def download_tabler_icons(version: str, packs: list[IconPack]) -> None:
-    """Download tabler-icons ``version`` and extract ``packs``."""
+def write_manifest(path: Path, hashes: dict[str, dict[str, str]]) -> None:
+    """Write ``{style: {filename: sha256}}`` ``hashes`` to manifest ``path``."""
+    content = {
+        "version": 1,
+        "icons": {
+            style: dict(sorted(files.items())) for style, files in hashes.items()
+        },
+    }
+    logger.info("Writing manifest '%s'", path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(content, indent=1, sort_keys=True) + "\n", "utf-8")
+
+
+@dataclass(frozen=True)
+class Workers:
+    """Pool configuration for per-icon work."""
+
+    jobs: int | None = None
+    """Number of workers. Default to the number of CPUs."""
+
+    processes: bool = False
+    """Use a process pool instead of a thread pool."""
+
+    @property
+    def count(self) -> int:
+        """Effective number of workers."""
+        return max(1, self.jobs or os.cpu_count() or 1)
+
+    def map(self, func: Callable[[T], R], items: Sequence[T]) -> Iterator[R]:
+        """Apply ``func`` to ``items`` on the pool, yielding results in order."""
+        if self.count == 1 or len(items) <= 1:
+            yield from map(func, items)
+            return
+
+        executor = ProcessPoolExecutor if self.processes else ThreadPoolExecutor
+        with executor(max_workers=self.count) as pool:
+            yield from pool.map(func, items)
+
+    def chunks(self, items: Sequence[T]) -> list[Sequence[T]]:
+        """Split ``items`` in contiguous chunks, a few per worker."""
+        size = max(1, -(-len(items) // (self.count * 4)))
+        return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+@dataclass(frozen=True)
+class DownloadPolicy:
+    """Retry and transfer configuration for downloads."""
+
+    retries: int = 5
+    """Number of consecutive failed requests retried, resuming the download."""
+
+    backoff: float = 0.5
+    """Delay before the first retry in seconds, doubled on each consecutive retry."""
+
+    max_backoff: float = 30.0
+    """Maximum delay between retries in seconds."""
+
+    timeout: float = 30.0
+    """Socket timeout in seconds."""
+
+    segments: int = 1
+    """Number of parallel range requests, for files of at least `MIN_SEGMENT_SIZE`
+    per segment."""
+
+    def delay(self, failures: int) -> float:
+        """Return delay in seconds before retrying after ``failures`` failures."""
+        return min(self.backoff * 2.0 ** (failures - 1), self.max_backoff)
+
+
+def download_tabler_icons(  # noqa: PLR0913
+    version: str,
+    packs: Sequence[IconPack],
+    manifest: Path,
+    workers: Workers | None = None,
+    *,
+    cache_dir: Path | None = None,
+    sha256: str | None = None,
+    policy: DownloadPolicy | None = None,
+    metrics: Metrics | None = None,
+    validation: ValidationReport | None = None,
+) -> ChangeReport:
+    """Download tabler-icons ``version`` and extract ``packs``.
+
+    Args:
+        version: Tabler Icons release version.
+        packs: Icon packs to extract.
+        manifest: Icons content hashes file.
+        workers: Optional workers for per-icon work.
+        cache_dir: Optional download cache directory (see `cached_download`).
+            Default to a temporary directory.
+        sha256: Optional expected SHA-256 of the release archive.
+        policy: Optional download retry and transfer configuration.
+        metrics: Optional metrics of the ``download`` and ``extract`` phases.
+        validation: Optional report the icons are validated into before being
+            extracted (see `extract_icons`).
+
+    Returns:
+        Icon files changes.
+    """
     github_api = "https://github.com/{owner}/{repo}/releases/download/{tag}/{asset}"
     url = github_api.format(
         owner="tabler",
@@ -115,39 +816,123 @@ def download_tabler_icons(version: str, packs: list[IconPack]) -> None:
         asset=f"tabler-icons-{version}.zip",
     )
 
+    metrics = metrics or Metrics()
     with tempfile.TemporaryDirectory(prefix="tabler-") as tmpdir:
-        try:
-            archive = download(
-                url=url,
-                directory=tmpdir,
-                filename="tabler-icons.zip",
-                overwrite=False,
+        with metrics.phase("download") as phase:
+
+            def progression(current: int, _: int) -> None:
+                phase.bytes_in = current
+
+            try:
+                archive = cached_download(
+                    url=url,
+                    directory=Path(cache_dir or tmpdir, version),
+                    filename=f"tabler-icons-{version}.zip",
+                    sha256=sha256,
+                    policy=policy,
+                    progression=progression,
+                )
+            except HTTPError as exc:
+                if exc.code == 404:  # noqa: PLR2004
+                    raise TagNotFoundError(version) from exc
+                raise
+            phase.files_out = 1
+            phase.bytes_out = archive.stat().st_size
+
+        with metrics.phase("extract") as phase:
+            return extract_icons(
+                archive=archive,
+                packs=packs,
+                manifest=manifest,
+                workers=workers,
+                metrics=phase,
+                validation=validation,
             )
-        except HTTPError as exc:
-            if exc.code == 404:  # noqa: PLR2004
-                raise TagNotFoundError(version) from exc
-            raise
 
-        unzip(archive=archive, directory=tmpdir, overwrite=True)
 
-        for pack in packs:
-            src = Path(tmpdir) / pack.icons_archive_dir
-            dst = pack.icons_extract_dir
+def default_cache_dir() -> Path:
+    """Return the user download cache directory (``$XDG_CACHE_HOME/tablerpy``)."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home, "tablerpy")
+
+
+def cached_download(  # noqa: PLR0913
+    url: str,
+    directory: StrPath,
+    filename: str,
+    *,
+    sha256: str | None = None,
+    policy: DownloadPolicy | None = None,
+    progression: Callable[[int, int], None] | None = None,
+) -> Path:
+    """Download file at ``url`` to ``directory``, unless already there.
+
+    The SHA-256 of a completed download is recorded next to it, in a
+    ``<filename>.sha256`` file, and verified on every cache hit.
+    Files are downloaded to ``<filename>.part`` first: an interrupted, truncated
+    or corrupt download is never used and is replaced by the next call.
+
+    Args:
+        url: File to download.
+        directory: Cache entry directory (e.g. keyed by version).
+        filename: Name of the downloaded file.
+        sha256: Optional expected SHA-256 hex digest of the file.
+        policy: Optional retry and transfer configuration.
+        progression: Optional callback for progression report (see `download`).
+
+    Raises:
+        ChecksumError: Downloaded file does not match ``sha256``.
+
+    Returns:
+        Path to the verified file.
+    """
+    sha256 = sha256.lower() if sha256 else None
+    filepath = Path(directory, filename)
+    checksum = filepath.with_name(f"{filename}.sha256")
+    if filepath.exists() and checksum.exists():
+        expected = checksum.read_text(encoding="ascii").strip()
+        if file_sha256(filepath) == expected and sha256 in {None, expected}:
+            logger.info("Using cached '%s'", filepath)
+            return filepath
+        logger.warning("Discarding invalid cached '%s'", filepath)
+    checksum.unlink(missing_ok=True)
+    filepath.unlink(missing_ok=True)
 
-            if dst.exists():
-                shutil.rmtree(dst)
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    part = download(
+        url,
+        filepath.parent,
+        f"{filename}.part",
+        policy=policy,
+        progression=progression,
+    )
+    digest = file_sha256(part)
+    if sha256 is not None and digest != sha256:
+        part.unlink()
+        msg = f"{url}: expected SHA-256 {sha256}, got {digest}"
+        raise ChecksumError(msg)
 
-            logger.info("Moving '%s' to '%s'", src, dst)
-            dst.parent.mkdir(parents=True, exist_ok=True)
-            shutil.move(src, dst)
+    part.replace(filepath)
+    checksum.write_text(f"{digest}\n", encoding="ascii")
+    return filepath
 
 
-def download(
+def file_sha256(path: StrPath) -> str:
+    """Return SHA-256 hex digest of file at ``path``."""
+    sha256 = hashlib.sha256()
+    with Path(path).open("rb") as file:
+        for data in iter(partial(file.read, 1024 * 1024), b""):
+            sha256.update(data)
+    return sha256.hexdigest()
+
+
+def download(  # noqa: PLR0913
     url: str,
     directory: StrPath,
     filename: str | None = None,
     *,
     overwrite: bool = True,
+    policy: DownloadPolicy | None = None,
     progression: Callable[[int, int], None] | None = None,
 ) -> Path:
     """Download file at ``url`` to ``directory``.
@@ -157,12 +942,14 @@ def download(
         directory: Destination directory.
         filename: Optional name for downloaded file. Default to name from url.
         overwrite: Overwrite existing file. Default to `True`.
+        policy: Optional retry and transfer configuration.
         progression: Optional callback for progression report.
             Callback takes 2 `int` arguments for ``current`` and ``total``
             downloaded bytes.
 
     Raises:
         FileExistsError: File already exists. Only raised if ``overwrite`` is `True`.
+        DownloadError: Server response cannot be used.
 
     Returns:
         Path to downloaded file.
@@ -173,7 +960,7 @@ def download(
     if not overwrite and filepath.exists():
         raise FileExistsError(filepath)
 
-    iterator = _download_iterator(url, filepath)
+    iterator = _download_iterator(url, filepath, policy or DownloadPolicy())
     if progression:
         for current, total in iterator:
             progression(current, total)
@@ -183,92 +970,500 @@ def download(
     return filepath
 
 
-def _download_iterator(url: str, filepath: Path) -> Iterator[tuple[int, int]]:
-    chunk_size = 1024 * 32
-
+def _download_iterator(
+    url: str,
+    filepath: Path,
+    policy: DownloadPolicy,
+) -> Iterator[tuple[int, int]]:
     logger.debug("Downloading '%s'", url)
     start_time = time.time()
 
-    with urllib.request.urlopen(url) as response, filepath.open("wb") as file:  # noqa: S310
-        # TODO: check status
-        total_bytes = int(response.headers.get("Content-Length", 0))
-        downloaded_bytes = 0
-
-        for data in iter(partial(response.read, chunk_size), b""):
-            file.write(data)
-            downloaded_bytes += len(data)
-            yield (downloaded_bytes, total_bytes)
+    size = _ranged_size(url, policy) if policy.segments > 1 else None
+    if size is not None and size >= policy.segments * MIN_SEGMENT_SIZE:
+        yield from _download_segments(url, filepath, size, policy)
+    else:
+        with filepath.open("wb") as file:
+            yield from _download_range(url, file, 0, None, policy)
 
     elapsed_time = time.time() - start_time
     logger.debug("Downloaded '%s' in %.2f seconds", filepath.name, elapsed_time)
 
 
-def unzip(
+def _ranged_size(url: str, policy: DownloadPolicy) -> int | None:
+    """Return ``url`` size if the server accepts range requests."""
+    request = urllib.request.Request(url, method="HEAD")  # noqa: S310
+    try:
+        with urllib.request.urlopen(request, timeout=policy.timeout) as response:  # noqa: S310
+            headers = response.headers
+    except (URLError, OSError, http.client.HTTPException) as exc:
+        logger.debug("Cannot probe '%s' for range requests: %s", url, exc)
+        return None
+    if headers.get("Accept-Ranges") != "bytes" or not headers.get("Content-Length"):
+        return None
+    return int(headers["Content-Length"])
+
+
+def _download_segments(
+    url: str,
+    filepath: Path,
+    size: int,
+    policy: DownloadPolicy,
+) -> Iterator[tuple[int, int]]:
+    bounds = [size * index // policy.segments for index in range(policy.segments + 1)]
+    progress = [0] * policy.segments
+    logger.debug("Downloading '%s' in %d segments", url, policy.segments)
+
+    with filepath.open("wb") as file:
+        file.truncate(size)
+
+    def fetch(index: int) -> None:
+        with filepath.open("r+b") as file:
+            start, stop = bounds[index], bounds[index + 1]
+            for current, _ in _download_range(url, file, start, stop, policy):
+                progress[index] = current
+
+    with ThreadPoolExecutor(max_workers=policy.segments) as pool:
+        futures = [pool.submit(fetch, index) for index in range(policy.segments)]
+        pending = set(futures)
+        while pending:
+            _, pending = wait(pending, timeout=0.1)
+            yield (sum(progress), size)
+        for future in futures:
+            future.result()
+
+
+def _download_range(
+    url: str,
+    file: BinaryIO,
+    start: int,
+    stop: int | None,
+    policy: DownloadPolicy,
+) -> Iterator[tuple[int, int]]:
+    """Write ``url`` bytes ``start`` to ``stop`` (end of file if `None`) to ``file``.
+
+    Failed requests are retried following ``policy``, resuming from the last
+    received byte with a ``Range`` request. ``If-Range`` ensures the resource
+    did not change in-between, otherwise a full download starts over.
+
+    Yields:
+        Received and expected (``0`` if unknown) bytes of the range.
+    """
+    position = start
+    length = None if stop is None else stop - start
+    validator = None
+    failures = 0
+
+    while True:
+        resumed = position
+        try:
+            with _open_range(url, position, stop, validator, policy) as response:
+                position, size = _check_range(response, url, start, stop, position)
+                if stop is None:
+                    length = None if size is None else size - start
+                    file.truncate(position)
+                validator = response.headers.get("ETag") or response.headers.get(
+                    "Last-Modified",
+                )
+                file.seek(position)
+                for data in _read_chunks(response):
+                    file.write(data)
+                    position += len(data)
+                    yield (position - start, length or 0)
+
+                received = position - start
+                if length is not None and received < length:
+                    msg = f"Retrieval incomplete: got {received} of {length} bytes"
+                    raise ContentTooShortError(msg, (url, response.headers))
+                return
+        except HTTPError as exc:
+            if exc.code not in _RETRY_STATUS:
+                raise
+            error: Exception = exc
+            retry_after = exc.headers.get("Retry-After", "")
+        except (URLError, OSError, http.client.HTTPException) as exc:
+            error, retry_after = exc, ""
+
+        failures = 1 if position > resumed else failures + 1
+        if failures > policy.retries:
+            raise error
+        delay = policy.delay(failures)
+        if retry_after.isdigit():
+            delay = max(delay, min(int(retry_after), policy.max_backoff))
+        logger.warning(
+            "Download of '%s' failed at byte %d (%s), retrying in %.1f seconds",
+            url,
+            position,
+            error,
+            delay,
+        )
+        time.sleep(delay)
+
+
+def _open_range(
+    url: str,
+    position: int,
+    stop: int | None,
+    validator: str | None,
+    policy: DownloadPolicy,
+) -> http.client.HTTPResponse:
+    request = urllib.request.Request(url)  # noqa: S310
+    if position > 0 or stop is not None:
+        last = "" if stop is None else stop - 1
+        request.add_header("Range", f"bytes={position}-{last}")
+        if validator:
+            request.add_header("If-Range", validator)
+    return urllib.request.urlopen(request, timeout=policy.timeout)  # type: ignore[no-any-return]  # noqa: S310
+
+
+def _check_range(
+    response: http.client.HTTPResponse,
+    url: str,
+    start: int,
+    stop: int | None,
+    position: int,
+) -> tuple[int, int | None]:
+    """Validate ``response`` status.
+
+    Returns:
+        Position the response body starts at, and full file size if known.
+    """
+    if response.status == http.HTTPStatus.PARTIAL_CONTENT:
+        match = _CONTENT_RANGE.fullmatch(response.headers.get("Content-Range", ""))
+        if match is None or int(match[1]) != position:
+            msg = f"{url}: unexpected Content-Range for byte {position}"
+            raise DownloadError(msg)
+        return position, None if match[3] == "*" else int(match[3])
+
+    if response.status != http.HTTPStatus.OK:
+        msg = f"{url}: unexpected HTTP status {response.status} {response.reason}"
+        raise DownloadError(msg)
+    if start > 0 or stop is not None:
+        msg = f"{url}: range requests are not supported"
+        raise DownloadError(msg)
+    if position > 0:
+        logger.debug("Restarting download of '%s', range request ignored", url)
+    content_length = response.headers.get("Content-Length")
+    return 0, int(content_length) if content_length else None
+
+
+def _read_chunks(response: http.client.HTTPResponse) -> Iterator[bytes]:
+    """Yield ``response`` body, adapting chunk size to the transfer rate."""
+    chunk_size = MIN_CHUNK_SIZE
+    while True:
+        start_time = time.perf_counter()
+        data = response.read(chunk_size)
+        if not data:
+            return
+        elapsed_time = time.perf_counter() - start_time
+        yield data
+        if len(data) == chunk_size and elapsed_time < _FAST_READ:
+            chunk_size = min(chunk_size * 2, MAX_CHUNK_SIZE)
+        elif elapsed_time > _SLOW_READ:
+            chunk_size = max(chunk_size // 2, MIN_CHUNK_SIZE)
+
+
+def extract_icons(  # noqa: PLR0913
     archive: StrPath,
-    directory: StrPath,
+    packs: Sequence[IconPack],
+    manifest: Path,
     *,
-    key: Callable[[zipfile.ZipInfo], bool] | None = None,
-    overwrite: bool = True,
+    workers: Workers | None = None,
+    metrics: PhaseMetrics | None = None,
     progression: Callable[[int, int], None] | None = None,
-) -> Path:
-    """Extract the content of ``archive`` archive to ``destination``.
+    validation: ValidationReport | None = None,
+) -> ChangeReport:
+    """Stream ``packs`` icons from ``archive`` to their extraction directory.
+
+    ``archive`` is a release zip, an ``@tabler/icons`` npm tarball or a
+    directory with either layout (see `IconPack`). Only the svg members of each
+    pack are read, from the zip central directory or in a single pass over
+    the tarball. Extraction is incremental: files whose content hash matches
+    ``manifest`` are left untouched, and files missing from the archive are
+    removed. ``manifest`` is updated with the new hashes.
 
     Args:
-        archive: Zip archive to extract.
-        directory: Destination directory.
-        key: Optional filtering function.
-            Takes one argument of type `zipfile.ZipInfo` and must return a bool.
-        overwrite: Overwrite existing ``directory``. Default to `True`.
+        archive: Archive or directory to extract.
+        packs: Icon packs to extract.
+        manifest: Icons content hashes file.
+        workers: Optional pool configuration. Zip and directory members are
+            split in contiguous chunks, each worker reading its chunk with its
+            own archive handle.
+        metrics: Optional phase metrics, counting read and written icons.
         progression: Optional callback for progression report.
             Callback takes 2 `int` arguments for ``current`` and ``total``
             extracted bytes.
+        validation: Optional report the archive icons are validated into
+            (see `validate_icon`) before anything is written. Nothing is
+            extracted, and no change reported, if any icon is invalid.
 
     Raises:
-        FileExistsError: ``directory`` already exists.
-            Only raised if ``overwrite`` is `True`.
+        ValueError: ``archive`` is not a supported source.
 
-    Return:
-        Path to ``directory``.
+    Returns:
+        Icon files changes.
     """
-    destination = Path(directory)
-    if not overwrite and destination.exists():
-        raise FileExistsError(destination)
-
-    iterator = _unzip_iterator(archive, str(destination), key)
+    report = ChangeReport()
+    iterator = _extract_iterator(
+        archive,
+        packs,
+        manifest,
+        workers or Workers(),
+        report,
+        metrics or PhaseMetrics("extract"),
+        validation,
+    )
     if progression:
         for current, total in iterator:
             progression(current, total)
     else:
         deque(iterator, maxlen=0)  # consume iterator
+    return report
 
-    return destination
 
+def read_source_metadata(source: StrPath) -> bytes | None:
+    """Return ``icons.json`` content of an icons source, if it has one."""
+    names = {ICONS_METADATA, f"{NPM_ROOT}/{ICONS_METADATA}"}
+    source = Path(source)
+    if source.is_dir():
+        paths = [source / name for name in sorted(names)]
+        return next((path.read_bytes() for path in paths if path.is_file()), None)
+    if zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as openzip:
+            found = sorted(names.intersection(openzip.namelist()))
+            return openzip.read(found[0]) if found else None
+    members = _read_tar(source, names.__contains__)
+    return next((data for _, data in members), None)
 
-def _unzip_iterator(
-    zip_path: StrPath,
-    destination: StrPath,
-    key: Callable[[zipfile.ZipInfo], bool] | None = None,
+
+def _extract_iterator(  # noqa: PLR0913, PLR0917
+    source: StrPath,
+    packs: Sequence[IconPack],
+    manifest: Path,
+    workers: Workers,
+    report: ChangeReport,
+    metrics: PhaseMetrics,
+    validation: ValidationReport | None,
 ) -> Iterator[tuple[int, int]]:
-    logger.info("Extracting '%s'", zip_path)
+    logger.info("Extracting '%s'", source)
     start_time = time.time()
 
-    with zipfile.ZipFile(zip_path) as openzip:
-        content = [info for info in openzip.infolist() if not key or key(info)]
-        total_bytes = sum(zinfo.file_size for zinfo in content)
-        extracted_bytes = 0
+    members, loaded = _read_members(source, packs)
+    total_bytes = sum(size for _, size, _ in members)
+    extracted_bytes = 0
+
+    previous = read_manifest(manifest)
+    hashes: dict[str, dict[str, str]] = {pack.style: {} for pack in packs}
+    content = []
+    for name, _, pack in members:
+        filename = PurePosixPath(name).name
+        destination = pack.icons_extract_dir / filename
+        known = previous.get(pack.style, {}).get(filename)
+        content.append((name, str(destination), known))
+
+    validate = validation is not None
+    results: Iterator[_MemberResult]
+    if loaded is None:
+        extract = partial(_extract_members, str(source), validate=validate)
+        results = chain.from_iterable(workers.map(extract, workers.chunks(content)))
+    else:
+        # Compressed tarballs are read sequentially, in a single pass.
+        results = iter(_extract_loaded(loaded, content, validate=validate))
+    changed: list[tuple[IconPack, str, str, bytes]] = []
+    for (name, size, pack), (digest, change, data, violations) in zip(
+        members,
+        results,
+    ):
+        filename = PurePosixPath(name).name
+        hashes[pack.style][filename] = digest
+        if change:
+            changed.append((pack, filename, change, data))
+        if violations and validation is not None:
+            validation.violations.setdefault(pack.style, {})[filename] = violations
+        metrics.files_in += 1
+        metrics.bytes_in += size
+        extracted_bytes += size
+        yield (extracted_bytes, total_bytes)
+
+    if validation is not None:
+        validation.icons += len(members)
+        if validation.violations:
+            logger.warning("Invalid icons, nothing extracted from '%s'", source)
+            return
 
-        for zip_info in content:
-            openzip.extract(zip_info.filename, destination)
-            extracted_bytes += zip_info.file_size
-            yield (extracted_bytes, total_bytes)
+    _write_changes(packs, changed, hashes, report, metrics)
+    write_manifest(manifest, hashes)
 
     elapsed_time = time.time() - start_time
     logger.debug(
-        "Extracted to '%s' in %.2f seconds",
-        Path(destination).name,
+        "Extracted %d icons in %.2f seconds with %d workers",
+        len(content),
         elapsed_time,
+        workers.count,
     )
 
 
+def _write_changes(
+    packs: Sequence[IconPack],
+    changed: Sequence[tuple[IconPack, str, str, bytes]],
+    hashes: Mapping[str, Mapping[str, str]],
+    report: ChangeReport,
+    metrics: PhaseMetrics,
+) -> None:
+    """Write ``changed`` icons and remove the ones missing from ``hashes``."""
+    for pack in packs:
+        pack.icons_extract_dir.mkdir(parents=True, exist_ok=True)
+    for pack, filename, change, data in changed:
+        (pack.icons_extract_dir / filename).write_bytes(data)
+        report.record(change, pack.style, filename)
+        metrics.files_out += 1
+        metrics.bytes_out += len(data)
+
+    for pack in packs:
+        for path in sorted(pack.icons_extract_dir.glob("*.svg")):
+            if path.name not in hashes[pack.style]:
+                path.unlink()
+                report.record("removed", pack.style, path.name)
+
+
+def _read_members(
+    source: StrPath,
+    packs: Sequence[IconPack],
+) -> tuple[list[tuple[str, int, IconPack]], dict[str, bytes] | None]:
+    """Return ``(name, size, pack)`` of ``source`` icons.
+
+    Tarball icons content is read as well, other sources are read on demand.
+    """
+    loaded = None
+    if Path(source).is_dir() or zipfile.is_zipfile(source):
+        listing = _list_source(source)
+    else:
+        loaded = dict(_read_tar(source, lambda name: bool(_icon_pack(name, packs))))
+        listing = [(name, len(data)) for name, data in loaded.items()]
+
+    members = []
+    for name, size in listing:
+        pack = _icon_pack(name, packs)
+        if pack is not None:
+            members.append((name, size, pack))
+    return members, loaded
+
+
+def _list_source(source: StrPath) -> list[tuple[str, int]]:
+    """Return ``(name, size)`` of zip or directory ``source`` files."""
+    if Path(source).is_dir():
+        return [
+            (path.relative_to(source).as_posix(), path.stat().st_size)
+            for path in sorted(Path(source).rglob("*.svg"))
+            if path.is_file()
+        ]
+    with zipfile.ZipFile(source) as openzip:
+        return [
+            (zip_info.filename, zip_info.file_size)
+            for zip_info in openzip.infolist()
+            if not zip_info.is_dir()
+        ]
+
+
+def _read_tar(
+    source: StrPath,
+    predicate: Callable[[str], bool],
+) -> Iterator[tuple[str, bytes]]:
+    """Yield ``(name, data)`` of tarball files matching ``predicate``, in one pass.
+
+    Raises:
+        ValueError: ``source`` is not a tarball.
+    """
+    try:
+        opentar = tarfile.open(source, mode="r|*")  # noqa: SIM115
+    except tarfile.TarError as exc:
+        msg = (
+            f"Unsupported icons source '{source}', expected a zip, tarball or directory"
+        )
+        raise ValueError(msg) from exc
+    with opentar:
+        for member in opentar:
+            if member.isfile() and predicate(member.name):
+                file = opentar.extractfile(member)
+                if file is not None:
+                    yield member.name, file.read()
+
+
+def _extract_members(
+    source: str,
+    members: Sequence[tuple[str, str, str | None]],
+    *,
+    validate: bool = False,
+) -> list[_MemberResult]:
+    """Read ``(name, destination, known digest)`` members of ``source``.
+
+    Returns:
+        Each member result (see `_read_icon`).
+    """
+    if Path(source).is_dir():
+        return [
+            _read_icon(Path(source, name).read_bytes(), destination, known, validate)
+            for name, destination, known in members
+        ]
+    with zipfile.ZipFile(source) as openzip:
+        return [
+            _read_icon(openzip.read(name), destination, known, validate)
+            for name, destination, known in members
+        ]
+
+
+def _extract_loaded(
+    loaded: Mapping[str, bytes],
+    members: Sequence[tuple[str, str, str | None]],
+    *,
+    validate: bool = False,
+) -> list[_MemberResult]:
+    """Read ``(name, destination, known digest)`` members of ``loaded``."""
+    return [
+        _read_icon(loaded[name], destination, known, validate)
+        for name, destination, known in members
+    ]
+
+
+_MemberResult = Tuple[str, Optional[str], bytes, List[str]]
+
+
+def _read_icon(
+    data: bytes,
+    destination: str,
+    known: str | None,
+    validate: bool,  # noqa: FBT001
+) -> _MemberResult:
+    """Compare ``data`` to ``destination`` and ``known`` digest, and validate it.
+
+    Returns:
+        ``data`` SHA-256 digest, change (``added``, ``modified`` or `None`),
+        ``data`` if changed (empty otherwise) and its violations, if
+        ``validate``.
+    """
+    digest = hashlib.sha256(data).hexdigest()
+    path = Path(destination)
+    change = None
+    if not path.exists():
+        change = "added"
+    elif digest != (known or hashlib.sha256(path.read_bytes()).hexdigest()):
+        change = "modified"
+    violations = validate_icon(data, path.parent.name, path.stem) if validate else []
+    return digest, change, data if change else b"", violations
+
+
+def _icon_pack(name: str, packs: Sequence[IconPack]) -> IconPack | None:
+    """Return pack of svg archive member ``name``, if any."""
+    path = PurePosixPath(name)
+    if path.suffix != ".svg":
+        return None
+    if path.parts[0] == NPM_ROOT:
+        path = PurePosixPath(*path.parts[1:])
+    for pack in packs:
+        directories = {pack.icons_archive_dir, pack.icons_npm_dir}
+        if any(path.parent == PurePosixPath(d.as_posix()) for d in directories if d):
+            return pack
+    return None
+
+
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
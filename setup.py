@@ -0,0 +1,57 @@
+"""Setuptools hook compiling the ``tablerpy/data`` runtime artifacts into wheels.
+
+Project metadata lives in ``pyproject.toml``.
+"""
+
+from __future__ import annotations
+
+import shutil
+import sys
+from pathlib import Path
+
+from setuptools import setup
+from setuptools.command.build_py import build_py
+
+PACKAGE = Path(__file__).parent / "src" / "tablerpy"
+
+
+class BuildPy(build_py):
+    """Build package, compiling artifacts from ``src/tablerpy/icons``.
+
+    Compiled artifacts are cached in the build directory, keyed by the digest
+    of their inputs, and only rebuilt when icons or build modules change.
+    Editable installs use the artifacts committed in ``src/tablerpy/data``.
+    """
+
+    def run(self) -> None:  # noqa: D102
+        super().run()
+        if not getattr(self, "editable_mode", False):
+            self.build_artifacts()
+
+    def build_artifacts(self) -> None:
+        """Copy compiled artifacts to the built package ``data`` directory."""
+        sys.path.insert(0, str(PACKAGE.parent))
+        try:
+            from tablerpy import _build  # noqa: PLC0415
+        finally:
+            sys.path.pop(0)
+
+        build_base = self.get_finalized_command("build").build_base
+        cache = Path(build_base, "tablerpy-artifacts")
+        stamp = cache / "inputs.sha256"
+        digest = _build.source_digest(PACKAGE)
+        if stamp.is_file() and stamp.read_text(encoding="ascii") == digest:
+            self.announce(f"reusing cached artifacts {cache}", level=2)
+        else:
+            shutil.rmtree(cache, ignore_errors=True)
+            records, metadata = _build.read_package(PACKAGE)
+            _build.write_artifacts(cache, _build.compile_artifacts(records, metadata))
+            stamp.write_text(digest, encoding="ascii")
+
+        target = Path(self.build_lib, "tablerpy", "data")
+        target.mkdir(parents=True, exist_ok=True)
+        for path in sorted(Path(cache, "data").iterdir()):
+            self.copy_file(str(path), str(target / path.name))
+
+
+setup(cmdclass={"build_py": BuildPy})
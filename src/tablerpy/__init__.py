@@ -1,20 +1,89 @@
 from __future__ import annotations
 
+import importlib
 import sys
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
+from tablerpy._fingerprint import icon_url
+from tablerpy._gzip import gzip_data, gzip_length
+from tablerpy._lookup import lookup, lookup_many
+from tablerpy._render import render
+from tablerpy._search import search
+from tablerpy._table import IconTable, load_table
+from tablerpy._tags import icons_by_category, icons_by_tag
+from tablerpy._usage import UsageRecorder, read_usage, record
+from tablerpy._variants import (
+    base_icon,
+    family,
+    filled_counterpart,
+    off_variant,
+    outline_counterpart,
+    variants,
+)
+from tablerpy._zip import stream_zip
 from tablerpy.filled import FilledIcon
 from tablerpy.outline import OutlineIcon
 
 if TYPE_CHECKING:
     from importlib.abc import Traversable
 
+    from tablerpy._asgi import ASGIApp
+    from tablerpy._preload import preload
+    from tablerpy._shared import SharedIconCache
+    from tablerpy._wsgi import WSGIApp
+
 if sys.version_info < (3, 10):
     import importlib_resources
 else:
     import importlib.resources as importlib_resources
 
-__all__ = ["FilledIcon", "OutlineIcon", "get_icon"]
+__all__ = [
+    "ASGIApp",
+    "FilledIcon",
+    "IconTable",
+    "OutlineIcon",
+    "SharedIconCache",
+    "UsageRecorder",
+    "WSGIApp",
+    "base_icon",
+    "family",
+    "filled_counterpart",
+    "get_icon",
+    "gzip_data",
+    "gzip_length",
+    "icon_url",
+    "icons_by_category",
+    "icons_by_tag",
+    "load_table",
+    "lookup",
+    "lookup_many",
+    "off_variant",
+    "outline_counterpart",
+    "preload",
+    "read_usage",
+    "render",
+    "search",
+    "stream_zip",
+    "variants",
+]
+
+# Server-only attributes, imported on first access (see `__getattr__`).
+_LAZY = {
+    "ASGIApp": "tablerpy._asgi",
+    "SharedIconCache": "tablerpy._shared",
+    "WSGIApp": "tablerpy._wsgi",
+    "preload": "tablerpy._preload",
+}
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Import server-only attributes, e.g. asyncio for `ASGIApp`, on first access."""
+    if name not in _LAZY:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(_LAZY[name]), name)
+    globals()[name] = value
+    return value
 
 
 def get_icon(icon: FilledIcon | OutlineIcon) -> Traversable:
@@ -26,6 +95,7 @@ def get_icon(icon: FilledIcon | OutlineIcon) -> Traversable:
         icon_dir = "outline"
     else:  # pragma: no cover
         raise TypeError(type(icon))
+    record(icon)
 
     # https://github.com/python/importlib_resources/issues/257#issuecomment-1192863274
     return (
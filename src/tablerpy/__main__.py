@@ -0,0 +1,184 @@
+"""Command line tools, run with ``python -m tablerpy``."""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, Pattern, Sequence
+
+from tablerpy._lookup import lookup
+from tablerpy._scan import TEMPLATE_GLOBS, compile_pattern, scan_paths
+from tablerpy._table import load_table
+from tablerpy._usage import read_usage, write_usage
+
+if TYPE_CHECKING:
+    from tablerpy.filled import FilledIcon
+    from tablerpy.outline import OutlineIcon
+
+logger = logging.getLogger("tablerpy")
+
+
+def main(args: Sequence[str] | None = None) -> int:
+    """Command line entry-point.
+
+    Returns:
+        Exit code.
+    """
+    logging.basicConfig(format="%(levelname)-8s %(message)s", level=logging.INFO)
+    namespace = parse_args(args)
+    return namespace.command(namespace)  # type: ignore[no-any-return]
+
+
+def parse_args(args: Sequence[str] | None) -> argparse.Namespace:  # noqa: D103
+    parser = argparse.ArgumentParser(prog="python -m tablerpy", description=__doc__)
+    commands = parser.add_subparsers(title="commands", required=True)
+
+    scan = commands.add_parser(
+        "scan",
+        help="List the icons referenced by Python files and templates",
+        description=(
+            "Find the icons referenced by Python files (enum members and "
+            "lookups with literal names) and templates, and write them to a "
+            "usage manifest accepted by 'subset --manifest'."
+        ),
+    )
+    scan.set_defaults(command=scan_command)
+    scan.add_argument("paths", nargs="+", type=Path, help="Files or directories")
+    scan.add_argument(
+        "--pattern",
+        action="append",
+        type=_pattern,
+        default=[],
+        help=(
+            "Regex matching icon names in templates, with a 'name' group and "
+            "optional 'style' group, or a single group (repeatable)"
+        ),
+    )
+    scan.add_argument(
+        "--template-glob",
+        action="append",
+        help=(
+            "Template file name pattern (repeatable, default: "
+            f"{' '.join(TEMPLATE_GLOBS)})"
+        ),
+    )
+    scan.add_argument(
+        "--jobs",
+        type=int,
+        help="Number of processes (default: number of CPUs)",
+    )
+    scan.add_argument(
+        "--output",
+        type=Path,
+        help="Usage manifest to write, print icon names if omitted",
+    )
+
+    subset = commands.add_parser(
+        "subset",
+        help="Build a tablerpy distribution restricted to a subset of icons",
+        description=(
+            "Build a tablerpy package directory or wheel containing only the "
+            "given icons, with enums and indexes restricted to match."
+        ),
+    )
+    subset.set_defaults(command=subset_command)
+    subset.add_argument(
+        "icons",
+        nargs="*",
+        help="Icon names, resolved with tablerpy.lookup (e.g. 'filled/home')",
+    )
+    subset.add_argument(
+        "--manifest",
+        type=Path,
+        action="append",
+        default=[],
+        help="Usage manifest written by tablerpy.UsageRecorder (repeatable)",
+    )
+    subset.add_argument(
+        "--check",
+        type=Path,
+        action="append",
+        default=[],
+        help=(
+            "Python file or directory whose icon references must be in the "
+            "subset, fail otherwise (repeatable)"
+        ),
+    )
+    subset.add_argument(
+        "--output",
+        type=Path,
+        required=True,
+        help="Directory to write the 'tablerpy' package or the wheel to",
+    )
+    subset.add_argument(
+        "--wheel",
+        action="store_true",
+        help="Build a wheel instead of a package directory",
+    )
+    return parser.parse_args(args)
+
+
+def _pattern(value: str) -> Pattern[str]:
+    try:
+        return compile_pattern(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from None
+
+
+def scan_command(namespace: argparse.Namespace) -> int:
+    """Run the ``scan`` command."""
+    references = scan_paths(
+        namespace.paths,
+        patterns=namespace.pattern,
+        template_globs=namespace.template_glob or TEMPLATE_GLOBS,
+        jobs=namespace.jobs,
+    )
+    usage: dict[FilledIcon | OutlineIcon, int] = {}
+    for reference in references:
+        if reference.icon is None:
+            logger.warning("Unknown icon %s", reference)
+        else:
+            usage[reference.icon] = usage.get(reference.icon, 0) + 1
+
+    if namespace.output is None:
+        table = load_table()
+        for row in sorted(map(table.row, usage)):
+            sys.stdout.write(f"{table.style(row)}/{table.name(row)}\n")
+    else:
+        write_usage(namespace.output, usage)
+        logger.info("Found %d icons: '%s'", len(usage), namespace.output)
+    return 0
+
+
+def subset_command(namespace: argparse.Namespace) -> int:
+    """Run the ``subset`` command."""
+    from tablerpy._subset import SubsetError, build_subset  # noqa: PLC0415
+
+    icons: set[FilledIcon | OutlineIcon] = set()
+    for name in namespace.icons:
+        icon = lookup(name)
+        if icon is None:
+            logger.error("Unknown icon '%s'", name)
+            return 2
+        icons.add(icon)
+    for manifest in namespace.manifest:
+        icons.update(read_usage(manifest))
+
+    try:
+        path = build_subset(
+            icons,
+            namespace.output,
+            check=namespace.check,
+            wheel=namespace.wheel,
+        )
+    except (SubsetError, FileExistsError) as exc:
+        logger.error("%s", exc)  # noqa: TRY400
+        return 1
+    logger.info("Built subset of %d icons: '%s'", len(icons), path)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
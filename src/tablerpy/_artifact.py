@@ -0,0 +1,206 @@
+"""Binary container for the derived artifacts shipped in ``tablerpy/data``.
+
+An artifact is a small header followed by named sections.
+Each section is a little-endian array of one `array` typecode (``B``, ``H``,
+``I`` or ``Q``) aligned on 8 bytes, so it can be viewed in place from a
+memory-mapped file with `memoryview.cast` or `numpy.frombuffer`.
+"""
+
+from __future__ import annotations
+
+import array
+import importlib
+import mmap
+import struct
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Mapping, Union
+
+if sys.version_info < (3, 10):
+    import importlib_resources
+else:
+    import importlib.resources as importlib_resources
+
+STYLES = ("outline", "filled")
+"""Icon styles, indexed by the ``style`` column code."""
+
+BUNDLE = "bundle.bin"
+"""Concatenated svg files, addressed by the table ``offset`` and ``length``."""
+
+TABLE = "table.bin"
+"""Columnar metadata table, one row per icon."""
+
+SEARCH = "search.bin"
+"""Sorted icon names and their trigram inverted index."""
+
+TAGS = "tags.bin"
+"""Tags and categories inverted indexes."""
+
+VARIANTS = "variants.bin"
+"""Variant relationships between icons (counterpart, off, base, family)."""
+
+GZIP = "gzip.bin"
+"""Icons compressed with gzip, for the icons compression saves bytes on."""
+
+FINGERPRINTS = "fingerprints.json"
+"""Fingerprinted file name of every icon, for static deployments."""
+
+FINGERPRINT_SIZE = 6
+"""Number of hex digits of the content hash in fingerprinted file names."""
+
+MISSING = 0xFFFFFFFF
+"""Sentinel row value for a missing icon."""
+
+MAGIC = b"TBPY"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sHH")  # magic, version, section count
+_NAME_SIZE = 16
+_SECTION = struct.Struct(f"<{_NAME_SIZE}sc3xII")  # name, typecode, offset, count
+_ALIGN = 8
+
+Buffer = Union[bytes, mmap.mmap]
+
+
+class ArtifactError(Exception):
+    """Raised when an artifact is missing or malformed."""
+
+
+def style_code(style: str) -> int:
+    """Return ``style`` index in `STYLES`.
+
+    Raises:
+        ValueError: ``style`` is not a valid style.
+    """
+    try:
+        return STYLES.index(style)
+    except ValueError:
+        msg = f"Invalid style {style!r}, expected one of {', '.join(STYLES)}"
+        raise ValueError(msg) from None
+
+
+def fingerprint(content_hash: int) -> str:
+    """Return the short fingerprint of a table ``hash`` column value."""
+    return f"{content_hash:016x}"[:FINGERPRINT_SIZE]
+
+
+def pack_artifact(sections: Mapping[str, array.array]) -> bytes:
+    """Serialize ``sections`` into an artifact container."""
+    table_size = _HEADER.size + _SECTION.size * len(sections)
+    header = bytearray(_HEADER.pack(MAGIC, VERSION, len(sections)))
+    body = bytearray(_padding(table_size))
+
+    for name, values in sections.items():
+        if len(name) > _NAME_SIZE:
+            msg = f"Section name too long: {name!r}"
+            raise ValueError(msg)
+        if values.typecode not in "BHIQ":
+            raise ValueError(values.typecode)
+        header += _SECTION.pack(
+            name.encode("ascii"),
+            values.typecode.encode("ascii"),
+            table_size + len(body),
+            len(values),
+        )
+        data = values
+        if sys.byteorder == "big":  # pragma: no cover
+            data = array.array(values.typecode, values)
+            data.byteswap()
+        body += data.tobytes()
+        body += bytes(_padding(len(body)))
+
+    return bytes(header + body)
+
+
+def _padding(size: int) -> int:
+    return -size % _ALIGN
+
+
+class Artifact:
+    """Read-only view over an artifact container."""
+
+    def __init__(self, buffer: Buffer) -> None:
+        self._buffer = memoryview(buffer)
+
+        try:
+            magic, version, count = _HEADER.unpack_from(self._buffer)
+        except struct.error as exc:
+            raise ArtifactError(str(exc)) from exc
+        if magic != MAGIC:
+            msg = f"Invalid artifact magic {magic!r}"
+            raise ArtifactError(msg)
+        if version != VERSION:
+            msg = f"Unsupported artifact version {version}"
+            raise ArtifactError(msg)
+
+        self._sections: dict[str, tuple[str, int, int]] = {}
+        for index in range(count):
+            name, typecode, offset, length = _SECTION.unpack_from(
+                self._buffer,
+                _HEADER.size + index * _SECTION.size,
+            )
+            key = name.rstrip(b"\0").decode("ascii")
+            self._sections[key] = (typecode.decode("ascii"), offset, length)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._sections
+
+    def sections(self) -> tuple[str, ...]:
+        """Return section names, in file order."""
+        return tuple(self._sections)
+
+    def section(self, name: str) -> memoryview:
+        """Return section ``name`` as a `memoryview` of its typecode."""
+        typecode, offset, length = self._sections[name]
+        itemsize = array.array(typecode).itemsize
+        raw = self._buffer[offset : offset + length * itemsize]
+        if sys.byteorder == "big" and itemsize > 1:  # pragma: no cover
+            values = array.array(typecode, raw.tobytes())
+            values.byteswap()
+            return memoryview(values)
+        return raw.cast(typecode)  # type: ignore[call-overload, no-any-return]
+
+    def column(self, name: str) -> Any:  # noqa: ANN401
+        """Return section ``name`` as a NumPy array, or a `memoryview` without NumPy.
+
+        Both are zero-copy views over the artifact buffer.
+        """
+        np = import_numpy()
+        if np is None:
+            return self.section(name)
+        typecode, offset, length = self._sections[name]
+        dtype = np.dtype(f"<u{array.array(typecode).itemsize}")
+        return np.frombuffer(self._buffer, dtype=dtype, count=length, offset=offset)
+
+    def strings(self, name: str) -> list[str]:
+        """Return ``name`` byte section decoded as newline-separated strings."""
+        blob = self.section(name).tobytes().decode("utf-8")
+        return blob.split("\n") if blob else []
+
+
+def import_numpy() -> Any:  # noqa: ANN401
+    """Return the `numpy` module, or `None` if it is not installed."""
+    try:
+        return importlib.import_module("numpy")
+    except ImportError:
+        return None
+
+
+@lru_cache(maxsize=None)
+def open_resource(filename: str) -> Buffer:
+    """Return ``filename`` content from ``tablerpy/data``, memory-mapped if possible."""
+    resource = importlib_resources.files("tablerpy.data").joinpath(filename)
+    try:
+        if isinstance(resource, Path):
+            with resource.open("rb") as file:
+                return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        return resource.read_bytes()
+    except FileNotFoundError as exc:
+        raise ArtifactError(filename) from exc
+
+
+@lru_cache(maxsize=None)
+def load_artifact(filename: str) -> Artifact:
+    """Return `Artifact` for ``filename`` in ``tablerpy/data``."""
+    return Artifact(open_resource(filename))
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Tuple
+from urllib.parse import parse_qsl
+
+from tablerpy._http import (
+    CACHE_CONTROL,
+    CONTENT_TYPE,
+    IMMUTABLE_CACHE_CONTROL,
+    accepts_gzip,
+    etag_matches,
+    load_store,
+)
+from tablerpy._render import Params, load_template, render_params
+from tablerpy._usage import record_row
+
+if TYPE_CHECKING:
+    from typing import Awaitable, Callable, MutableMapping
+
+    Scope = MutableMapping[str, Any]
+    Message = MutableMapping[str, Any]
+    Receive = Callable[[], Awaitable[Message]]
+    Send = Callable[[Message], Awaitable[None]]
+
+_Key = Tuple[int, Params]
+
+
+class ASGIApp:
+    """ASGI application serving icons at ``/<style>/<name>.svg``.
+
+    The ``size``, ``color`` and ``stroke`` query parameters render the icon
+    through its template (e.g. ``/outline/home.svg?size=32&color=%23f00``).
+    Rendered variants are kept in a bounded LRU cache, concurrent requests for
+    the same variant share a single render, and their ETag is derived from the
+    icon ETag without rendering. Icons without parameters are served as
+    `WSGIApp` does: gzip encoded when accepted, and fingerprinted paths (see
+    `icon_url`) with an ``immutable`` ``Cache-Control``.
+
+    Does not depend on any framework. Mount it under a prefix with the ASGI
+    server or framework, which sets ``root_path``.
+
+    Args:
+        cache_control: ``Cache-Control`` header value of icon responses.
+        maxsize: Maximum number of rendered variants cached.
+    """
+
+    def __init__(
+        self,
+        cache_control: str = CACHE_CONTROL,
+        maxsize: int = 1024,
+    ) -> None:
+        self.cache_control = cache_control
+        self.maxsize = maxsize
+        self._store = load_store()
+        self._cache: OrderedDict[_Key, bytes] = OrderedDict()
+        self._pending: dict[_Key, asyncio.Future[bytes]] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle an ASGI connection."""
+        if scope["type"] == "lifespan":
+            await _lifespan(receive, send)
+        elif scope["type"] == "http":
+            await self._http(scope, send)
+        else:  # pragma: no cover
+            msg = f"Unsupported ASGI scope {scope['type']!r}"
+            raise ValueError(msg)
+
+    async def _http(self, scope: Scope, send: Send) -> None:
+        method = scope["method"]
+        if method not in {"GET", "HEAD"}:
+            await _error(send, 405, headers=[(b"allow", b"GET, HEAD")])
+            return
+
+        path: str = scope["path"]
+        root_path: str = scope.get("root_path", "")
+        if root_path and path.startswith(root_path):
+            path = path[len(root_path) :]
+        route = self._store.route(path)
+        if route is None:
+            await _error(send, 404)
+            return
+        row, fingerprinted = route
+        record_row(row)
+
+        query = dict(parse_qsl(scope.get("query_string", b"").decode("latin-1")))
+        try:
+            params = render_params(
+                query.get("size"),
+                query.get("color"),
+                query.get("stroke"),
+            )
+        except ValueError as exc:
+            await _error(send, 400, str(exc).encode("utf-8"))
+            return
+
+        rendered = any(value is not None for value in params)
+        negotiated = not rendered and self._store.has_gzip(row)
+        gzip = negotiated and accepts_gzip(_header(scope, b"accept-encoding") or "")
+        etag = (
+            self._store.variant_etag(row, params)
+            if rendered
+            else self._store.etag(row, gzip=gzip)
+        )
+        cache_control = IMMUTABLE_CACHE_CONTROL if fingerprinted else self.cache_control
+        headers = [
+            (b"etag", etag.encode("ascii")),
+            (b"cache-control", cache_control.encode("latin-1")),
+        ]
+        if negotiated:
+            headers.append((b"vary", b"Accept-Encoding"))
+        if_none_match = _header(scope, b"if-none-match")
+        if if_none_match and etag_matches(if_none_match, etag):
+            await _respond(send, 304, headers)
+            return
+
+        body = (
+            await self.render(row, params)
+            if rendered
+            else self._store.body(row, gzip=gzip)
+        )
+        headers.append((b"content-type", CONTENT_TYPE.encode("ascii")))
+        if gzip:
+            headers.append((b"content-encoding", b"gzip"))
+        headers.append((b"content-length", str(len(body)).encode("ascii")))
+        await _respond(send, 200, headers, b"" if method == "HEAD" else body)
+
+    async def render(self, row: int, params: Params) -> bytes:
+        """Return icon at table ``row`` rendered with ``params``, cached."""
+        key = (row, params)
+        body = self._cache.get(key)
+        if body is not None:
+            self._cache.move_to_end(key)
+            return body
+
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(None, _render, row, params)
+            self._pending[key] = future
+            future.add_done_callback(lambda done: self._rendered(key, done))
+        # Cancelling a request must not cancel the render shared with others.
+        return await asyncio.shield(future)
+
+    def _rendered(self, key: _Key, future: asyncio.Future[bytes]) -> None:
+        del self._pending[key]
+        if future.cancelled() or future.exception() is not None:
+            return
+        self._cache[key] = future.result()
+        if len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+
+
+def _render(row: int, params: Params) -> bytes:
+    return load_template(row).render(params)
+
+
+def _header(scope: Scope, name: bytes) -> str | None:
+    for key, value in scope["headers"]:
+        if key == name:
+            return value.decode("latin-1")  # type: ignore[no-any-return]
+    return None
+
+
+async def _error(
+    send: Send,
+    status: int,
+    body: bytes = b"",
+    headers: list[tuple[bytes, bytes]] | None = None,
+) -> None:
+    headers = [
+        *(headers or []),
+        (b"content-type", b"text/plain; charset=utf-8"),
+        (b"content-length", str(len(body)).encode("ascii")),
+    ]
+    await _respond(send, status, headers, body)
+
+
+async def _respond(
+    send: Send,
+    status: int,
+    headers: list[tuple[bytes, bytes]],
+    body: bytes = b"",
+) -> None:
+    await send({"type": "http.response.start", "status": status, "headers": headers})
+    await send({"type": "http.response.body", "body": body})
+
+
+async def _lifespan(receive: Receive, send: Send) -> None:
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            await send({"type": "lifespan.shutdown.complete"})
+            return
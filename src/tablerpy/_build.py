@@ -0,0 +1,505 @@
+"""Compile the runtime artifacts in ``tablerpy/data`` from the icons tree."""
+
+from __future__ import annotations
+
+import array
+import gzip
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Mapping, Sequence
+
+from tablerpy._artifact import (
+    BUNDLE,
+    FINGERPRINTS,
+    GZIP,
+    MISSING,
+    SEARCH,
+    STYLES,
+    TABLE,
+    TAGS,
+    VARIANTS,
+    fingerprint,
+    pack_artifact,
+)
+from tablerpy._search import trigrams
+
+if TYPE_CHECKING:
+    from _typeshed import StrPath
+
+logger = logging.getLogger(__name__)
+
+METADATA = "metadata.json"
+"""Icons metadata file, in the icons directory."""
+
+_BUILD_MODULES = ("_artifact.py", "_build.py", "_search.py")
+_NUMBER_SUFFIX = re.compile(r"-\d+$")
+_PATH_COMMAND = re.compile(rb"[MmLlHhVvCcSsQqTtAaZz]")
+_PATH_DATA = re.compile(rb'\sd="([^"]*)"')
+
+
+@dataclass(frozen=True)
+class IconRecord:
+    """Source icon and the statistics derived from it."""
+
+    style: str
+    """Icon style, one of `STYLES`."""
+
+    name: str
+    """Icon name, without style nor extension (e.g. ``brand-github``)."""
+
+    data: bytes
+    """Raw svg file content."""
+
+    @property
+    def filename(self) -> str:
+        """Svg file name, matching the icon enum member value."""
+        return f"{self.name}.svg"
+
+    @property
+    def digest(self) -> bytes:
+        """SHA-256 of ``data``."""
+        return hashlib.sha256(self.data).digest()
+
+    @property
+    def content_hash(self) -> int:
+        """First 8 bytes of `digest`, as stored in the table ``hash`` column."""
+        return int.from_bytes(self.digest[:8], "big")
+
+
+@dataclass(frozen=True)
+class IconMetadata:
+    """Tabler metadata of an icon name, shared by every style."""
+
+    category: str = ""
+    """Lowercase category, empty if uncategorized."""
+
+    tags: tuple[str, ...] = ()
+    """Sorted lowercase tags."""
+
+
+def read_metadata(path: StrPath) -> dict[str, IconMetadata]:
+    """Read icons metadata from ``path``.
+
+    Accepts Tabler ``icons.json`` / ``tags.json`` files, either a mapping or
+    a list of objects with ``name``, ``category`` and ``tags`` keys, as well
+    as the normalized `METADATA` file written by `write_metadata`.
+    """
+    return parse_metadata(Path(path).read_bytes())
+
+
+def parse_metadata(content: str | bytes) -> dict[str, IconMetadata]:
+    """Parse icons metadata JSON ``content`` (see `read_metadata`)."""
+    data = json.loads(content)
+    entries = (
+        [{"name": key, **value} for key, value in data.items()]
+        if isinstance(data, dict)
+        else data
+    )
+    return {
+        str(entry["name"]): IconMetadata(
+            category=_term(entry.get("category")),
+            tags=tuple(sorted({_term(tag) for tag in entry.get("tags") or ()} - {""})),
+        )
+        for entry in entries
+    }
+
+
+def write_metadata(metadata: Mapping[str, IconMetadata], path: StrPath) -> None:
+    """Write ``metadata`` to ``path``, in the normalized `METADATA` format."""
+    content = {
+        name: {"category": meta.category, "tags": list(meta.tags)}
+        for name, meta in sorted(metadata.items())
+    }
+    logger.info("Writing metadata '%s' (%d icons)", path, len(content))
+    Path(path).write_text(json.dumps(content, indent=1) + "\n", encoding="utf-8")
+
+
+def _term(value: object) -> str:
+    return str(value or "").strip().lower()
+
+
+def collect_icons(icons_dir: StrPath) -> list[IconRecord]:
+    """Return icons found in ``icons_dir``, ordered by style then file name.
+
+    The order is the one of the generated enums, and defines the table rows.
+    """
+    records: list[IconRecord] = []
+    for style in STYLES:
+        files = sorted(Path(icons_dir, style).glob("*.svg"), key=lambda p: p.name)
+        records.extend(
+            IconRecord(style, file.stem, file.read_bytes()) for file in files
+        )
+    return records
+
+
+def build_artifacts(package: StrPath) -> list[Path]:
+    """Compile ``package`` icons into its ``data`` directory.
+
+    Unchanged artifacts are left untouched, others are atomically replaced.
+
+    Returns:
+        Paths to the artifacts.
+    """
+    records, metadata = read_package(package)
+    artifacts = compile_artifacts(records, metadata)
+    write_artifacts(package, artifacts)
+    return [Path(package, "data", filename) for filename in artifacts]
+
+
+def source_digest(package: StrPath) -> str:
+    """Return SHA-256 hex digest of every input of ``package`` artifacts.
+
+    Inputs are the icons directory files and the modules compiling them.
+    """
+    package = Path(package)
+    paths = sorted(
+        [path for path in Path(package, "icons").rglob("*") if path.is_file()]
+        + [package / module for module in _BUILD_MODULES],
+    )
+    sha256 = hashlib.sha256()
+    for path in paths:
+        sha256.update(path.relative_to(package).as_posix().encode("utf-8") + b"\0")
+        sha256.update(hashlib.sha256(path.read_bytes()).digest())
+    return sha256.hexdigest()
+
+
+def read_package(package: StrPath) -> tuple[list[IconRecord], dict[str, IconMetadata]]:
+    """Return ``package`` icons (see `collect_icons`) and their metadata."""
+    records = collect_icons(Path(package, "icons"))
+    metadata_path = Path(package, "icons", METADATA)
+    metadata = read_metadata(metadata_path) if metadata_path.exists() else {}
+    return records, metadata
+
+
+def compile_artifacts(
+    records: Sequence[IconRecord],
+    metadata: Mapping[str, IconMetadata],
+) -> dict[str, bytes]:
+    """Return the content of every artifact, by file name."""
+    return {
+        BUNDLE: build_bundle(records),
+        GZIP: build_gzip_bundle(records),
+        TABLE: build_table(records),
+        SEARCH: build_search_index(records),
+        TAGS: build_tag_index(records, metadata),
+        VARIANTS: build_variant_index(records),
+        FINGERPRINTS: build_fingerprints(records),
+    }
+
+
+def write_artifacts(package: StrPath, artifacts: Mapping[str, bytes]) -> list[Path]:
+    """Write changed ``artifacts`` to ``package`` data directory.
+
+    Returns:
+        Paths to the written artifacts.
+    """
+    directory = Path(package, "data")
+    directory.mkdir(parents=True, exist_ok=True)
+    written = []
+    for filename, content in artifacts.items():
+        path = directory / filename
+        if write_if_changed(path, content):
+            logger.info("Wrote artifact '%s' (%d bytes)", path, len(content))
+            written.append(path)
+        else:
+            logger.info("Artifact '%s' is up to date", path)
+    return written
+
+
+def write_if_changed(path: Path, content: bytes) -> bool:
+    """Atomically replace ``path`` with ``content``, unless already identical.
+
+    Files are never rewritten in place, as artifacts are memory-mapped by
+    running processes, and unchanged files keep their modification time, so
+    bytecode and other mtime based caches stay valid.
+
+    Returns:
+        Whether ``path`` was written.
+    """
+    if path.exists() and path.read_bytes() == content:
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    mode = path.stat().st_mode & 0o777 if path.exists() else 0o644
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(content)
+        Path(tmp).chmod(mode)
+        Path(tmp).replace(path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    return True
+
+
+def render_enum(class_name: str, names: Iterable[str]) -> str:
+    """Return the source of enum module ``class_name`` with icons ``names``."""
+    members = [
+        f'    {name[:-4].upper().replace("-", "_")} = "{name}"\n'
+        for name in sorted(f"{name}.svg" for name in names)
+    ]
+    header = f"import enum\n\n\nclass {class_name}(enum.Enum):\n"
+    return header + "".join(members or ["    pass\n"])
+
+
+def build_bundle(records: Sequence[IconRecord]) -> bytes:
+    """Concatenate every icon data, in record order."""
+    return b"".join(record.data for record in records)
+
+
+def build_gzip_bundle(records: Sequence[IconRecord]) -> bytes:
+    """Build the gzip artifact, compressing every icon at maximum level.
+
+    Compressed data is only kept when smaller than the icon, other icons have
+    a zero ``length``. The gzip header has no timestamp, for reproducible
+    builds.
+    """
+    offsets = array.array("I")
+    lengths = array.array("I")
+    data = bytearray()
+    for record in records:
+        compressed = gzip.compress(record.data, compresslevel=9, mtime=0)
+        offsets.append(len(data))
+        if len(compressed) < len(record.data):
+            lengths.append(len(compressed))
+            data += compressed
+        else:
+            lengths.append(0)
+    return pack_artifact(
+        {"offset": offsets, "length": lengths, "data": array.array("B", data)},
+    )
+
+
+def build_table(records: Sequence[IconRecord]) -> bytes:
+    """Build the columnar metadata table artifact, one row per record."""
+    columns = {
+        "id": array.array("I"),
+        "style": array.array("B"),
+        "name_offset": array.array("I"),
+        "name_length": array.array("H"),
+        "offset": array.array("I"),
+        "length": array.array("I"),
+        "hash": array.array("Q"),
+        "elements": array.array("H"),
+        "paths": array.array("H"),
+        "commands": array.array("H"),
+    }
+    names = bytearray()
+    offset = 0
+
+    for row, record in enumerate(records):
+        name = record.name.encode("utf-8")
+        elements, paths, commands = geometry_stats(record.data)
+        columns["id"].append(row)
+        columns["style"].append(STYLES.index(record.style))
+        columns["name_offset"].append(len(names))
+        columns["name_length"].append(len(name))
+        columns["offset"].append(offset)
+        columns["length"].append(len(record.data))
+        columns["hash"].append(record.content_hash)
+        columns["elements"].append(elements)
+        columns["paths"].append(paths)
+        columns["commands"].append(commands)
+        names += name + b"\n"
+        offset += len(record.data)
+
+    sections: dict[str, array.array] = {"names": array.array("B", names[:-1])}
+    sections.update(columns)
+    return pack_artifact(sections)
+
+
+def build_fingerprints(records: Sequence[IconRecord]) -> bytes:
+    """Build the fingerprints manifest, mapping icon paths to fingerprinted paths.
+
+    Paths are relative to the icons directory (e.g. ``outline/home.svg`` to
+    ``outline/home.3f9a1c.svg``).
+    """
+    content = {
+        f"{record.style}/{record.filename}": (
+            f"{record.style}/{record.name}.{fingerprint(record.content_hash)}.svg"
+        )
+        for record in records
+    }
+    return (json.dumps(content, indent=1) + "\n").encode("utf-8")
+
+
+def build_search_index(records: Sequence[IconRecord]) -> bytes:
+    """Build the name search index artifact.
+
+    Sections:
+        keys: Sorted unique icon names.
+        rows: Table row of each key per style, or `MISSING`.
+        counts: Number of trigrams of each key.
+        trigrams: Sorted trigrams found in keys.
+        trigram_offsets: Bounds of each trigram keys in ``postings``.
+        postings: Keys containing each trigram.
+    """
+    rows: dict[str, list[int]] = {}
+    for row, record in enumerate(records):
+        styles = rows.setdefault(record.name, [MISSING] * len(STYLES))
+        styles[STYLES.index(record.style)] = row
+    keys = sorted(rows)
+
+    index: dict[str, list[int]] = {}
+    counts = array.array("H")
+    for key, name in enumerate(keys):
+        name_trigrams = trigrams(name)
+        counts.append(len(name_trigrams))
+        for trigram in name_trigrams:
+            index.setdefault(trigram, []).append(key)
+
+    offsets = array.array("I", [0])
+    postings = array.array("I")
+    for trigram in sorted(index):
+        postings.extend(index[trigram])
+        offsets.append(len(postings))
+
+    return pack_artifact(
+        {
+            "keys": array.array("B", "\n".join(keys).encode("utf-8")),
+            "rows": array.array("I", (row for key in keys for row in rows[key])),
+            "counts": counts,
+            "trigrams": array.array("B", "\n".join(sorted(index)).encode("utf-8")),
+            "trigram_offsets": offsets,
+            "postings": postings,
+        },
+    )
+
+
+def build_tag_index(
+    records: Sequence[IconRecord],
+    metadata: Mapping[str, IconMetadata],
+) -> bytes:
+    """Build the tags and categories inverted indexes artifact.
+
+    Each index maps a sorted term list (``tag``, ``category``) to the bounds
+    (``<name>_index``) of its sorted table rows in ``<name>_rows``.
+    """
+    tags: dict[str, list[int]] = {}
+    categories: dict[str, list[int]] = {}
+    for row, record in enumerate(records):
+        meta = metadata.get(record.name, IconMetadata())
+        for tag in meta.tags:
+            tags.setdefault(tag, []).append(row)
+        if meta.category:
+            categories.setdefault(meta.category, []).append(row)
+
+    return pack_artifact(
+        {
+            **_inverted_index("tag", tags),
+            **_inverted_index("category", categories),
+        },
+    )
+
+
+def build_variant_index(records: Sequence[IconRecord]) -> bytes:
+    """Build the variant relationships artifact.
+
+    Sections:
+        counterpart: Row of the same name in the other style, or `MISSING`.
+        off: Row of the ``<name>-off`` icon in the same style, or `MISSING`.
+        base: Row of the icon this one is an ``-off`` or numbered variant of
+            (e.g. ``armchair-2`` for ``armchair-2-off``, ``armchair`` for
+            ``armchair-2``), or `MISSING`. Numbered icons are only variants
+            when no ``-0`` or ``-1`` icon exists, other numbers being values
+            (e.g. ``number-1`` or ``battery-2``).
+        variant_index: Bounds of each row variants in ``variant_rows``.
+        variant_rows: Rows whose ``base`` is the row.
+        family: Sorted ``<style>/<first name segment>`` family terms,
+            with ``family_index`` bounds into ``family_rows``.
+        family_id: Index of each row family term.
+    """
+    rows = {(record.style, record.name): row for row, record in enumerate(records)}
+    counterpart = array.array("I")
+    off = array.array("I")
+    base = array.array("I")
+    variants: list[list[int]] = [[] for _ in records]
+    families: dict[str, list[int]] = {}
+
+    for row, record in enumerate(records):
+        other = STYLES[1 - STYLES.index(record.style)]
+        counterpart.append(rows.get((other, record.name), MISSING))
+        off.append(rows.get((record.style, f"{record.name}-off"), MISSING))
+
+        base_row = _base_row(rows, record.style, record.name)
+        if base_row != MISSING:
+            variants[base_row].append(row)
+        base.append(base_row)
+
+        family = record.name.split("-", 1)[0]
+        families.setdefault(f"{record.style}/{family}", []).append(row)
+
+    family_ids = array.array("I", [0] * len(records))
+    for index, term in enumerate(sorted(families)):
+        for row in families[term]:
+            family_ids[row] = index
+
+    variant_index = array.array("I", [0])
+    variant_rows = array.array("I")
+    for row_variants in variants:
+        variant_rows.extend(row_variants)
+        variant_index.append(len(variant_rows))
+
+    return pack_artifact(
+        {
+            "counterpart": counterpart,
+            "off": off,
+            "base": base,
+            "variant_index": variant_index,
+            "variant_rows": variant_rows,
+            **_inverted_index("family", families),
+            "family_id": family_ids,
+        },
+    )
+
+
+def _base_row(rows: Mapping[tuple[str, str], int], style: str, name: str) -> int:
+    """Return row of the icon ``name`` is an ``-off`` or numbered variant of."""
+    stem = name[:-4] if name.endswith("-off") else name
+    if stem != name and (style, stem) in rows:
+        return rows[(style, stem)]
+    numbered = _NUMBER_SUFFIX.sub("", stem)
+    if numbered == stem or any(
+        (style, f"{numbered}-{number}") in rows for number in (0, 1)
+    ):
+        return MISSING
+    return rows.get((style, numbered), MISSING)
+
+
+def _inverted_index(
+    name: str,
+    postings: Mapping[str, Iterable[int]],
+) -> dict[str, array.array]:
+    terms = sorted(postings)
+    bounds = array.array("I", [0])
+    rows = array.array("I")
+    for term in terms:
+        rows.extend(postings[term])
+        bounds.append(len(rows))
+    return {
+        name: array.array("B", "\n".join(terms).encode("utf-8")),
+        f"{name}_index": bounds,
+        f"{name}_rows": rows,
+    }
+
+
+def geometry_stats(data: bytes) -> tuple[int, int, int]:
+    """Return ``(elements, paths, commands)`` counts for svg ``data``.
+
+    ``elements`` counts the shapes drawn by the icon, excluding the root
+    ``<svg>`` and ``<g>`` groups, ``paths`` the ``<path>`` elements and
+    ``commands`` the drawing commands across every path ``d`` attribute.
+    """
+    root = ET.fromstring(data)  # noqa: S314
+    tags = [element.tag.rpartition("}")[2] for element in root.iter()]
+    elements = sum(tag not in {"svg", "g"} for tag in tags)
+    paths = tags.count("path")
+    commands = sum(len(_PATH_COMMAND.findall(d)) for d in _PATH_DATA.findall(data))
+    return elements, paths, commands
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from tablerpy._artifact import fingerprint
+from tablerpy._table import load_table
+from tablerpy._usage import record_row
+
+if TYPE_CHECKING:
+    from tablerpy.filled import FilledIcon
+    from tablerpy.outline import OutlineIcon
+
+
+@lru_cache(maxsize=None)
+def fingerprinted_paths() -> list[str]:
+    """Return the fingerprinted path of every icon, indexed by table row."""
+    table = load_table()
+    return [
+        f"{table.style(row)}/{table.name(row)}.{fingerprint(content_hash)}.svg"
+        for row, content_hash in enumerate(table["hash"].tolist())
+    ]
+
+
+def icon_url(icon: FilledIcon | OutlineIcon, base: str = "") -> str:
+    """Return ``icon`` URL, fingerprinted with its content hash.
+
+    The URL changes only when the icon content changes (e.g.
+    ``{base}/outline/home.3f9a1c.svg``), so it can be cached as immutable.
+    Fingerprinted paths are listed in ``tablerpy/data/fingerprints.json`` for
+    static deployments, and served by `WSGIApp` and `ASGIApp`.
+
+    Args:
+        icon: Icon.
+        base: URL prefix the icons are served from.
+    """
+    row = load_table().row(icon)
+    record_row(row)
+    return f"{base.rstrip('/')}/{fingerprinted_paths()[row]}"
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from tablerpy._artifact import GZIP, Artifact, load_artifact
+from tablerpy._table import load_table
+from tablerpy._usage import record_row
+
+if TYPE_CHECKING:
+    from tablerpy.filled import FilledIcon
+    from tablerpy.outline import OutlineIcon
+
+
+class GzipBundle:
+    """Icons precompressed with gzip by the generator, by table row.
+
+    Icons compression does not save bytes on have no compressed data.
+    """
+
+    def __init__(self, artifact: Artifact) -> None:
+        self._offsets = artifact.section("offset")
+        self._lengths = artifact.section("length")
+        self._data = artifact.section("data")
+
+    def length(self, row: int) -> int:
+        """Return length of compressed data at ``row``, ``0`` if uncompressed."""
+        return self._lengths[row]
+
+    def data(self, row: int) -> memoryview | None:
+        """Return compressed data at ``row``, as a view over the bundle."""
+        length = self._lengths[row]
+        if not length:
+            return None
+        offset = self._offsets[row]
+        return self._data[offset : offset + length]
+
+
+@lru_cache(maxsize=None)
+def load_gzip_bundle() -> GzipBundle:
+    """Return the gzip bundle, loaded once from ``tablerpy/data``."""
+    return GzipBundle(load_artifact(GZIP))
+
+
+def gzip_data(icon: FilledIcon | OutlineIcon) -> memoryview | None:
+    """Return ``icon`` svg data compressed with gzip, at maximum level.
+
+    Returns `None` when compression does not make the icon smaller.
+    """
+    row = load_table().row(icon)
+    record_row(row)
+    return load_gzip_bundle().data(row)
+
+
+def gzip_length(icon: FilledIcon | OutlineIcon) -> int:
+    """Return length of ``icon`` gzip data, ``0`` when it is not compressed."""
+    return load_gzip_bundle().length(load_table().row(icon))
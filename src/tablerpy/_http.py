@@ -0,0 +1,138 @@
+"""Icon responses shared by the WSGI and ASGI applications."""
+
+from __future__ import annotations
+
+import hashlib
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from tablerpy._fingerprint import fingerprinted_paths
+from tablerpy._gzip import load_gzip_bundle
+from tablerpy._table import load_table
+
+if TYPE_CHECKING:
+    from tablerpy._render import Params
+
+CONTENT_TYPE = "image/svg+xml"
+
+CACHE_CONTROL = "public, max-age=31536000"
+"""Default ``Cache-Control`` of icon responses, one year."""
+
+IMMUTABLE_CACHE_CONTROL = f"{CACHE_CONTROL}, immutable"
+"""``Cache-Control`` of fingerprinted icon responses."""
+
+
+class IconStore:
+    """Icon bodies and validators, addressed by ``/<style>/<name>.svg`` paths.
+
+    Icons are also addressed by their fingerprinted path (e.g.
+    ``/outline/home.3f9a1c.svg``), which can be cached as immutable.
+    Routes and strong ETags are computed once from the metadata table, whose
+    ``hash`` column is the content hash computed by the generator. Bodies are
+    read with `IconTable.data`, from the preloaded data or the memory-mapped
+    bundle, or from the gzip bundle for the gzip encoded representation,
+    which has its own ETag.
+    """
+
+    def __init__(self) -> None:
+        table = self._table = load_table()
+        self._routes = {
+            f"/{table.style(row)}/{table.name(row)}.svg": (row, False)
+            for row in range(len(table))
+        }
+        self._routes.update(
+            (f"/{path}", (row, True)) for row, path in enumerate(fingerprinted_paths())
+        )
+        self._etags = [f'"{value:016x}"' for value in table["hash"].tolist()]
+        self._gzip = load_gzip_bundle()
+        self._gzip_etags = [
+            f'"{value:016x}-gzip"' if self._gzip.length(row) else None
+            for row, value in enumerate(table["hash"].tolist())
+        ]
+
+    def __len__(self) -> int:
+        return len(self._etags)
+
+    def route(self, path: str) -> tuple[int, bool] | None:
+        """Return table row of icon at ``path`` and whether it is fingerprinted.
+
+        Returns `None` for unknown paths.
+        """
+        return self._routes.get(path)
+
+    def has_gzip(self, row: int) -> bool:
+        """Return whether icon at ``row`` has a gzip encoded representation."""
+        return self._gzip_etags[row] is not None
+
+    def etag(self, row: int, *, gzip: bool = False) -> str:
+        """Return quoted strong ETag of icon at ``row``.
+
+        Args:
+            row: Table row.
+            gzip: Return the ETag of the gzip encoded representation.
+        """
+        return (self._gzip_etags[row] if gzip else None) or self._etags[row]
+
+    def variant_etag(self, row: int, params: Params) -> str:
+        """Return quoted strong ETag of icon at ``row`` rendered with ``params``.
+
+        Derived from the icon ETag and the normalized parameters, so it is
+        known without rendering the icon.
+        """
+        key = "\0".join(value or "" for value in params).encode("ascii")
+        digest = hashlib.blake2b(key, digest_size=4).hexdigest()
+        return f'{self._etags[row][:-1]}-{digest}"'
+
+    def body(self, row: int, *, gzip: bool = False) -> bytes:
+        """Return svg data of icon at ``row``.
+
+        Args:
+            row: Table row.
+            gzip: Return the gzip encoded data, if `has_gzip`.
+        """
+        data = self._gzip.data(row) if gzip else None
+        if data is not None:
+            return data.tobytes()
+        return self._table.data(row).tobytes()
+
+
+@lru_cache(maxsize=None)
+def load_store() -> IconStore:
+    """Return the icon store, loaded once."""
+    return IconStore()
+
+
+@lru_cache(maxsize=256)
+def accepts_gzip(accept_encoding: str) -> bool:
+    """Return whether an ``Accept-Encoding`` header value accepts gzip.
+
+    Results are cached, clients send a handful of distinct values.
+    """
+    accepted = {}
+    for coding in accept_encoding.lower().split(","):
+        name, _, params = coding.partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[name.strip()] = quality
+    quality = accepted.get("gzip", accepted.get("x-gzip", accepted.get("*", 0.0)))
+    return quality > 0
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Return whether an ``If-None-Match`` header value matches ``etag``.
+
+    Uses the weak comparison required for ``If-None-Match`` (RFC 9110).
+    """
+    if if_none_match == etag or if_none_match.strip() == "*":
+        return True
+    for candidate in if_none_match.split(","):
+        tag = candidate.strip()
+        if tag[2:] == etag if tag.startswith("W/") else tag == etag:
+            return True
+    return False
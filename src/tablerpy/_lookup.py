@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Iterable, Optional, Tuple
+
+from tablerpy._artifact import STYLES, style_code
+from tablerpy._table import ENUMS
+from tablerpy.filled import FilledIcon
+from tablerpy.outline import OutlineIcon
+
+_Entry = Tuple[Optional[OutlineIcon], Optional[FilledIcon]]
+
+
+@lru_cache(maxsize=None)
+def _lookup_table() -> dict[str, _Entry]:
+    """Return every accepted spelling of every icon name, indexed by style."""
+    entries: dict[str, list[OutlineIcon | FilledIcon | None]] = {}
+    prefixed: dict[str, list[OutlineIcon | FilledIcon | None]] = {}
+    for code, style in enumerate(STYLES):
+        for icon in ENUMS[style]:
+            name = icon.value[:-4]
+            snake = name.replace("-", "_")
+            for key in {name, name.upper(), snake, icon.name}:
+                for spelling in (key, f"{key}.svg"):
+                    entries.setdefault(spelling, [None, None])[code] = icon
+            for spelling in (f"{style}/{name}", f"{style}/{icon.value}"):
+                prefixed.setdefault(spelling, [None, None])[code] = icon
+    entries.update(prefixed)
+    return {key: (value[0], value[1]) for key, value in entries.items()}  # type: ignore[misc]
+
+
+def _normalize(name: str) -> str:
+    key = name.strip().lower().replace("_", "-").replace("\\", "/")
+    return key[:-4] if key.endswith(".svg") else key
+
+
+def lookup(
+    name: str,
+    style: str | None = None,
+) -> FilledIcon | OutlineIcon | None:
+    """Return icon spelled ``name``, or `None` if there is no such icon.
+
+    Accepts names as listed on tabler.io (``brand-github``), enum member names
+    (``BRAND_GITHUB``), file names (``brand-github.svg``) and style-prefixed
+    names (``outline/brand-github``), in any case and with ``-`` or ``_``.
+    Common spellings are resolved with a single hash lookup.
+
+    Args:
+        name: Icon name.
+        style: Optional style (``outline`` or ``filled``).
+            Defaults to the prefixed style, or outline when available.
+
+    Raises:
+        ValueError: ``style`` is not a valid style.
+    """
+    table = _lookup_table()
+    entry = table.get(name) or table.get(_normalize(name))
+    if entry is None:
+        return None
+    if style is None:
+        return entry[0] or entry[1]
+    return entry[style_code(style)]
+
+
+def lookup_many(
+    names: Iterable[str],
+    style: str | None = None,
+) -> list[FilledIcon | OutlineIcon | None]:
+    """Return icons spelled ``names``, or `None` for unknown names.
+
+    Batch version of `lookup`, for instance to parse a configuration file.
+
+    Raises:
+        ValueError: ``style`` is not a valid style.
+    """
+    table = _lookup_table()
+    get = table.get
+    code = None if style is None else style_code(style)
+    icons: list[FilledIcon | OutlineIcon | None] = []
+    append = icons.append
+    for name in names:
+        entry = get(name) or get(_normalize(name))
+        if entry is None:
+            append(None)
+        elif code is None:
+            append(entry[0] or entry[1])
+        else:
+            append(entry[code])
+    return icons
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import logging
+import os
+from typing import TYPE_CHECKING, Iterable, Union
+
+from tablerpy._fingerprint import fingerprinted_paths
+from tablerpy._gzip import load_gzip_bundle
+from tablerpy._http import load_store
+from tablerpy._lookup import _lookup_table
+from tablerpy._search import load_search_index
+from tablerpy._table import load_table
+from tablerpy._tags import load_category_index, load_tag_index
+from tablerpy._usage import read_usage
+from tablerpy._variants import load_variant_index
+
+if TYPE_CHECKING:
+    from _typeshed import StrPath
+
+    from tablerpy.filled import FilledIcon
+    from tablerpy.outline import OutlineIcon
+
+logger = logging.getLogger(__name__)
+
+Icons = Union[Iterable["FilledIcon | OutlineIcon"], "StrPath", None]
+"""Icons, a usage manifest path, or `None` for all icons."""
+
+
+def icon_rows(icons: Icons) -> Iterable[int]:
+    """Return table rows of ``icons`` (see `Icons`).
+
+    Raises:
+        ValueError: ``icons`` is not a valid usage manifest.
+    """
+    table = load_table()
+    if icons is None:
+        return range(len(table))
+    if isinstance(icons, (str, os.PathLike)):
+        return map(table.row, read_usage(icons))
+    return map(table.row, icons)
+
+
+def preload(icons: Icons = None) -> int:
+    """Load icons data and indexes in memory, to share them with forked workers.
+
+    Meant to be called before forking worker processes (e.g. from a gunicorn
+    ``--preload`` application module). The svg data of ``icons`` is copied
+    into one contiguous `bytes` object, addressed by an offsets `array`, and
+    the table, lookup, search, tags, variants and HTTP indexes are built, so
+    workers share them instead of loading their own copy.
+
+    Reading the preloaded data does not write to its pages, but the indexes
+    are Python objects whose reference counts are updated when accessed.
+    Calling `gc.freeze` after `preload` keeps the garbage collector from also
+    writing to them.
+
+    Args:
+        icons: Icons to preload, or a usage manifest path (see `read_usage`).
+            Defaults to all icons.
+
+    Returns:
+        Size of the preloaded svg data, in bytes.
+
+    Raises:
+        ValueError: ``icons`` is not a valid usage manifest.
+    """
+    table = load_table()
+    size = table.preload(icon_rows(icons))
+
+    table.row(table.icon(0))  # Builds the icon to row mapping.
+    _lookup_table()
+    load_search_index()
+    load_tag_index()
+    load_category_index()
+    load_variant_index()
+    load_gzip_bundle()
+    fingerprinted_paths()
+    load_store()
+    logger.debug("Preloaded %d bytes of icon data", size)
+    return size
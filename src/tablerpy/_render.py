@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, Tuple, Union
+
+from tablerpy._table import load_table
+from tablerpy._usage import record_row
+
+if TYPE_CHECKING:
+    from tablerpy.filled import FilledIcon
+    from tablerpy.outline import OutlineIcon
+
+Params = Tuple[Optional[str], Optional[str], Optional[str]]
+"""Normalized ``(size, color, stroke)`` render parameters."""
+
+_Value = Union[float, str, None]
+
+_ROOT_ATTRIBUTE = re.compile(
+    rb'\s(?P<name>width|height|stroke-width)="(?P<value>[^"]*)"',
+)
+_CURRENT_COLOR = re.compile(rb'="(?P<value>currentColor)"')
+_NUMBER = re.compile(r"\d{1,4}(\.\d{1,4})?")
+_COLOR = re.compile(r"#[0-9a-f]{3,8}|[a-z]{1,32}")
+
+_SIZE, _COLOR_SLOT, _STROKE = range(3)
+
+
+class IconTemplate:
+    """Svg data of an icon split around its parameterized attribute values.
+
+    Size and stroke width are root element attributes, the color replaces
+    every ``currentColor`` value, child elements included. Rendering joins the
+    literal parts with the parameter values, the icon is parsed once.
+    """
+
+    def __init__(self, data: bytes) -> None:
+        end = data.index(b">")
+        matches = [
+            (match, _STROKE if match["name"] == b"stroke-width" else _SIZE)
+            for match in _ROOT_ATTRIBUTE.finditer(data, 0, end)
+        ]
+        matches += [(match, _COLOR_SLOT) for match in _CURRENT_COLOR.finditer(data)]
+        matches.sort(key=lambda item: item[0].start())
+
+        self._parts: list[bytes] = []
+        self._slots: list[tuple[int, bytes]] = []
+        position = 0
+        for match, slot in matches:
+            self._parts.append(data[position : match.start("value")])
+            self._slots.append((slot, match["value"]))
+            position = match.end("value")
+        self._parts.append(data[position:])
+
+    def render(self, params: Params) -> bytes:
+        """Return svg data with ``params`` substituted."""
+        chunks = []
+        for part, (slot, default) in zip(self._parts, self._slots):
+            value = params[slot]
+            chunks.append(part)
+            chunks.append(default if value is None else value.encode("ascii"))
+        chunks.append(self._parts[-1])
+        return b"".join(chunks)
+
+
+@lru_cache(maxsize=None)
+def load_template(row: int) -> IconTemplate:
+    """Return the template of icon at table ``row``, parsed once."""
+    return IconTemplate(load_table().data(row).tobytes())
+
+
+def render_params(
+    size: _Value = None,
+    color: str | None = None,
+    stroke: _Value = None,
+) -> Params:
+    """Return validated and normalized render parameters.
+
+    Raises:
+        ValueError: A parameter is not a valid number or color.
+    """
+    return (
+        _number("size", size),
+        _color(color),
+        _number("stroke", stroke),
+    )
+
+
+def _number(name: str, value: _Value) -> str | None:
+    if value is None:
+        return None
+    text = str(value).strip()
+    if not _NUMBER.fullmatch(text):
+        msg = f"Invalid {name} {value!r}, expected a number"
+        raise ValueError(msg)
+    return f"{float(text):g}"
+
+
+def _color(value: str | None) -> str | None:
+    if value is None:
+        return None
+    text = value.strip().lower()
+    if not _COLOR.fullmatch(text) or (text[0] == "#" and len(text) not in {4, 7, 9}):
+        msg = f"Invalid color {value!r}, expected a hex or named color"
+        raise ValueError(msg)
+    return "currentColor" if text == "currentcolor" else text
+
+
+def render(
+    icon: FilledIcon | OutlineIcon,
+    *,
+    size: float | str | None = None,
+    color: str | None = None,
+    stroke: float | str | None = None,
+) -> bytes:
+    """Return ``icon`` svg data with custom size, color and stroke width.
+
+    Parameters left to `None` keep the icon default. The stroke width only
+    applies to outline icons.
+
+    Args:
+        icon: Icon to render.
+        size: Width and height, in pixels.
+        color: Hex (``#f00``, ``#ff0000``) or named (``red``) color, replacing
+            every ``currentColor`` of the icon.
+        stroke: Stroke width.
+
+    Raises:
+        ValueError: A parameter is not a valid number or color.
+    """
+    params = render_params(size, color, stroke)
+    row = load_table().row(icon)
+    record_row(row)
+    return load_template(row).render(params)
@@ -0,0 +1,364 @@
+"""Find the icons referenced by Python source code and templates."""
+
+from __future__ import annotations
+
+import ast
+import logging
+import os
+import re
+import sys
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from fnmatch import fnmatch
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Iterator, Pattern, Sequence
+
+from tablerpy._lookup import lookup
+from tablerpy._table import ENUMS
+
+if TYPE_CHECKING:
+    from _typeshed import StrPath
+
+    from tablerpy.filled import FilledIcon
+    from tablerpy.outline import OutlineIcon
+
+logger = logging.getLogger(__name__)
+
+TEMPLATE_GLOBS = ("*.html", "*.jinja", "*.jinja2", "*.j2")
+"""Default file name patterns of the templates scanned with regexes."""
+
+_STYLES = {enum.__name__: style for style, enum in ENUMS.items()}
+_MEMBER = re.compile(r"[A-Z][A-Z0-9_]*")
+_LOOKUPS = {"lookup", "lookup_many"}
+# Names resolved by the scanner, by tablerpy module defining them.
+_MODULES = {
+    "tablerpy": {*_STYLES, *_LOOKUPS},
+    **{enum.__module__: {enum.__name__} for enum in ENUMS.values()},
+}
+# Python files without it are not parsed, as they cannot import tablerpy.
+_MARKER = b"tablerpy"
+_SKIPPED_DIRS = {"__pycache__", "node_modules"}
+# Below this number of files, a process pool costs more than it saves.
+_PARALLEL_THRESHOLD = 256
+
+
+@dataclass(frozen=True)
+class Reference:
+    """Icon referenced in a source file."""
+
+    path: str
+    """Source file path."""
+
+    line: int
+    """Line number of the reference."""
+
+    text: str
+    """Reference as written (e.g. ``OutlineIcon.HOME`` or ``'filled/home'``)."""
+
+    icon: FilledIcon | OutlineIcon | None
+    """Referenced icon, or `None` if there is no such icon."""
+
+    def __str__(self) -> str:
+        return f"{self.path}:{self.line}: {self.text}"
+
+
+def scan_source(source: str | bytes, path: str = "<string>") -> list[Reference]:
+    """Return icons referenced in Python ``source``.
+
+    Finds attribute accesses on the enum classes, by name or through their
+    module (``OutlineIcon.HOME``, ``tablerpy.FilledIcon.HOME``), enum calls
+    and subscripts (``OutlineIcon("home.svg")``, ``OutlineIcon["HOME"]``) and
+    `lookup` and `lookup_many` calls with literal names and style.
+    Only names imported from tablerpy are resolved, wherever they are
+    imported in ``source``.
+
+    Raises:
+        SyntaxError: ``source`` is not valid Python.
+    """
+    tree = ast.parse(source, filename=path)
+    data = source.encode("utf-8") if isinstance(source, str) else source
+    imports = _Imports(_walk(tree, _lines(data, re.escape(_MARKER))))
+    if not imports:
+        return []
+
+    words = b"|".join(re.escape(name.encode("utf-8")) for name in imports.bound())
+    references = []
+    for node in _walk(tree, _lines(data, rb"\b(?:%s)\b" % words)):
+        if isinstance(node, ast.Attribute):
+            references.extend(_attribute(node, imports, path))
+        elif isinstance(node, ast.Subscript):
+            references.extend(_subscript(node, imports, path))
+        elif isinstance(node, ast.Call):
+            references.extend(_call(node, imports, path))
+    return sorted(references, key=lambda reference: reference.line)
+
+
+class _Imports:
+    """Local names bound to tablerpy modules and to the names it resolves."""
+
+    def __init__(self, nodes: Iterable[ast.AST]) -> None:
+        self.names: dict[str, str] = {}
+        self.modules: dict[str, str] = {}
+        for node in nodes:
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    if alias.name in _MODULES and alias.asname:
+                        self.modules[alias.asname] = alias.name
+                    elif alias.name.split(".")[0] == "tablerpy":
+                        self.modules["tablerpy"] = "tablerpy"
+            elif isinstance(node, ast.ImportFrom) and not node.level:
+                for alias in node.names:
+                    local = alias.asname or alias.name
+                    if alias.name in _MODULES.get(node.module or "", ()):
+                        self.names[local] = alias.name
+                    elif f"{node.module}.{alias.name}" in _MODULES:
+                        self.modules[local] = f"{node.module}.{alias.name}"
+
+    def __bool__(self) -> bool:
+        return bool(self.names or self.modules)
+
+    def bound(self) -> set[str]:
+        """Return the local names bound by the imports."""
+        return {*self.names, *self.modules}
+
+    def resolve(self, node: ast.expr) -> str | None:
+        """Return the tablerpy name ``node`` refers to, or `None`."""
+        if isinstance(node, ast.Name):
+            return self.names.get(node.id)
+        if isinstance(node, ast.Attribute):
+            module = self._module(node.value)
+            if node.attr in _MODULES.get(module or "", ()):
+                return node.attr
+        return None
+
+    def _module(self, node: ast.expr) -> str | None:
+        if isinstance(node, ast.Name):
+            return self.modules.get(node.id)
+        if isinstance(node, ast.Attribute):
+            parent = self._module(node.value)
+            return None if parent is None else f"{parent}.{node.attr}"
+        return None
+
+
+def _lines(data: bytes, pattern: bytes) -> list[int]:
+    # Numbers of the lines matching ``pattern``.
+    return sorted(
+        {
+            data.count(b"\n", 0, match.start()) + 1
+            for match in re.finditer(pattern, data)
+        },
+    )
+
+
+def _walk(tree: ast.AST, lines: list[int]) -> Iterator[ast.AST]:
+    # Like `ast.walk`, without descending into nodes outside ``lines``, as
+    # walking whole trees takes several times longer than parsing them.
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        yield node
+        for child in reversed(list(ast.iter_child_nodes(node))):
+            end = getattr(child, "end_lineno", None)
+            if end is not None:
+                index = bisect_left(lines, child.lineno)  # type: ignore[attr-defined]
+                if index == len(lines) or lines[index] > end:
+                    continue
+            stack.append(child)
+
+
+def _string(node: ast.expr | None) -> str | None:
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    return None
+
+
+def _attribute(node: ast.Attribute, imports: _Imports, path: str) -> list[Reference]:
+    style = _STYLES.get(imports.resolve(node.value) or "")
+    if style is None or not _MEMBER.fullmatch(node.attr):
+        return []
+    enum = ENUMS[style]
+    icon = enum.__members__.get(node.attr)
+    return [Reference(path, node.lineno, f"{enum.__name__}.{node.attr}", icon)]
+
+
+def _subscript(node: ast.Subscript, imports: _Imports, path: str) -> list[Reference]:
+    style = _STYLES.get(imports.resolve(node.value) or "")
+    key = node.slice
+    if sys.version_info < (3, 9):  # pragma: no cover
+        key = key.value  # type: ignore[attr-defined]
+    member = _string(key)
+    if style is None or member is None:
+        return []
+    enum = ENUMS[style]
+    icon = enum.__members__.get(member)
+    return [Reference(path, node.lineno, f"{enum.__name__}[{member!r}]", icon)]
+
+
+def _call(node: ast.Call, imports: _Imports, path: str) -> list[Reference]:
+    function = imports.resolve(node.func) or ""
+    style = _STYLES.get(function)
+    if style is not None:
+        value = _string(node.args[0]) if node.args else None
+        if value is None:
+            return []
+        try:
+            icon: FilledIcon | OutlineIcon | None = ENUMS[style](value)
+        except ValueError:
+            icon = None
+        return [Reference(path, node.lineno, f"{function}({value!r})", icon)]
+    if function not in _LOOKUPS or not node.args:
+        return []
+
+    style_node = node.args[1] if len(node.args) > 1 else None
+    for keyword in node.keywords:
+        if keyword.arg == "style":
+            style_node = keyword.value
+    lookup_style = _string(style_node)
+    if style_node is not None and lookup_style not in ENUMS:
+        return []  # Dynamic or invalid style.
+
+    names = node.args[0]
+    elements = names.elts if isinstance(names, (ast.List, ast.Tuple)) else [names]
+    references = []
+    for element in elements:
+        name = _string(element)
+        if name is not None:
+            icon = lookup(name, style=lookup_style)
+            references.append(Reference(path, element.lineno, repr(name), icon))
+    return references
+
+
+def scan_text(
+    text: str,
+    patterns: Sequence[Pattern[str]],
+    path: str = "<string>",
+) -> list[Reference]:
+    """Return icons matched by ``patterns`` in ``text``, such as a template.
+
+    Each match is resolved with `lookup`, from the pattern ``name`` group and
+    optional ``style`` group, or from its single group (see `compile_pattern`).
+    """
+    references = []
+    for pattern in patterns:
+        for match in pattern.finditer(text):
+            groups = match.groupdict()
+            name = groups.get("name") or match.group(1)
+            style = groups.get("style")
+            line = text.count("\n", 0, match.start()) + 1
+            icon = lookup(name, style=style if style in ENUMS else None)
+            references.append(Reference(path, line, repr(name), icon))
+    return sorted(references, key=lambda reference: reference.line)
+
+
+def compile_pattern(pattern: str | Pattern[str]) -> Pattern[str]:
+    """Compile template ``pattern``, checking its groups (see `scan_text`).
+
+    Raises:
+        ValueError: ``pattern`` is not a valid regex, or has neither a ``name``
+            group nor a single group.
+    """
+    try:
+        compiled = re.compile(pattern)
+    except re.error as exc:
+        msg = f"Invalid pattern {_source(pattern)!r}: {exc}"
+        raise ValueError(msg) from None
+    if "name" not in compiled.groupindex and compiled.groups != 1:
+        msg = (
+            f"Invalid pattern {_source(pattern)!r}: "
+            "expected a 'name' group or a single group"
+        )
+        raise ValueError(msg)
+    return compiled
+
+
+def _source(pattern: str | Pattern[str]) -> str:
+    return pattern if isinstance(pattern, str) else pattern.pattern
+
+
+def scan_file(
+    path: StrPath,
+    patterns: Sequence[Pattern[str]] = (),
+) -> list[Reference]:
+    """Return icons referenced in Python file or template ``path``.
+
+    Python files not mentioning ``tablerpy`` are not parsed.
+
+    Raises:
+        SyntaxError: ``path`` is a Python file with invalid syntax.
+    """
+    data = Path(path).read_bytes()
+    if str(path).endswith(".py"):
+        if _MARKER not in data:
+            return []
+        return scan_source(data, str(path))
+    return scan_text(data.decode("utf-8", errors="replace"), patterns, str(path))
+
+
+def iter_sources(
+    paths: Iterable[StrPath],
+    template_globs: Sequence[str] = (),
+) -> Iterator[Path]:
+    """Yield Python files and templates in ``paths``, searching directories.
+
+    Hidden, ``__pycache__`` and ``node_modules`` directories are skipped.
+    """
+    for path in map(Path, paths):
+        if not path.is_dir():
+            yield path
+            continue
+        for root, dirs, files in os.walk(path):
+            dirs[:] = sorted(
+                name
+                for name in dirs
+                if not name.startswith(".") and name not in _SKIPPED_DIRS
+            )
+            for name in sorted(files):
+                if name.endswith(".py") or any(
+                    fnmatch(name, glob) for glob in template_globs
+                ):
+                    yield Path(root, name)
+
+
+def scan_paths(
+    paths: Iterable[StrPath],
+    *,
+    patterns: Sequence[str | Pattern[str]] = (),
+    template_globs: Sequence[str] = TEMPLATE_GLOBS,
+    jobs: int | None = None,
+) -> list[Reference]:
+    """Return icons referenced in Python files and templates in ``paths``.
+
+    Files are scanned on a process pool when there are many of them. Files
+    with invalid syntax are logged and skipped.
+
+    Args:
+        paths: Files and directories to scan.
+        patterns: Regexes finding icon names in templates (see `scan_text`).
+            Templates are only scanned when patterns are given.
+        template_globs: File name patterns of the templates.
+        jobs: Maximum number of processes. Defaults to the number of CPUs.
+
+    Raises:
+        ValueError: A pattern is invalid (see `compile_pattern`).
+    """
+    compiled = [compile_pattern(pattern) for pattern in patterns]
+    files = list(iter_sources(paths, template_globs if compiled else ()))
+    scan = partial(_scan_file, patterns=compiled)
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(files) < _PARALLEL_THRESHOLD:
+        return [reference for path in files for reference in scan(path)]
+
+    chunksize = max(1, len(files) // (jobs * 8))
+    with ProcessPoolExecutor(jobs) as executor:
+        results = executor.map(scan, files, chunksize=chunksize)
+        return [reference for result in results for reference in result]
+
+
+def _scan_file(path: Path, patterns: Sequence[Pattern[str]]) -> list[Reference]:
+    try:
+        return scan_file(path, patterns)
+    except (SyntaxError, ValueError) as exc:
+        logger.warning("Skipping '%s': %s", path, exc)
+        return []
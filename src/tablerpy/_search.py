@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import heapq
+from bisect import bisect_left
+from collections import Counter
+from functools import lru_cache
+from itertools import chain
+from typing import TYPE_CHECKING
+
+from tablerpy._artifact import (
+    MISSING,
+    SEARCH,
+    STYLES,
+    Artifact,
+    load_artifact,
+    style_code,
+)
+from tablerpy._table import load_table
+
+if TYPE_CHECKING:
+    from typing import Iterable, Iterator, Sequence
+
+    from tablerpy.filled import FilledIcon
+    from tablerpy.outline import OutlineIcon
+
+# Rank of each kind of match, lower is better.
+_EXACT, _PREFIX, _WORD, _SUBSTRING, _FUZZY = range(5)
+
+
+def normalize(query: str) -> str:
+    """Return ``query`` normalized to an icon name (e.g. ``brand-github``)."""
+    name = query.strip().lower().replace("_", "-").replace(" ", "-")
+    if name.endswith(".svg"):
+        name = name[:-4]
+    return name
+
+
+def trigrams(name: str) -> set[str]:
+    """Return trigrams of ``name``, padded with word separators."""
+    padded = f"-{name}-"
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class SearchIndex:
+    """Name search index, built by the generator.
+
+    Names are kept sorted for prefix matching with `bisect`, and a trigram
+    inverted index is used for substring and typo-tolerant matching.
+    """
+
+    def __init__(self, artifact: Artifact) -> None:
+        self._keys = artifact.strings("keys")
+        self._lengths = [len(key) for key in self._keys]
+        self._rows = artifact.section("rows")
+        self._counts = artifact.section("counts")
+        self._postings = artifact.section("postings")
+        offsets = artifact.section("trigram_offsets")
+        self._trigrams = {
+            trigram: (offsets[index], offsets[index + 1])
+            for index, trigram in enumerate(artifact.strings("trigrams"))
+        }
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def search(
+        self,
+        query: str,
+        style: str | None = None,
+        limit: int = 20,
+    ) -> list[FilledIcon | OutlineIcon]:
+        """Return icons whose name best match ``query``.
+
+        Matches are ranked as exact, prefix, word prefix, substring and
+        finally fuzzy (trigram similarity) matches.
+
+        Args:
+            query: Searched name, in any case, with ``-``, ``_`` or spaces.
+            style: Optional style to restrict results to (e.g. ``outline``).
+            limit: Maximum number of icons returned.
+
+        Raises:
+            ValueError: ``style`` is not a valid style.
+        """
+        styles = range(len(STYLES)) if style is None else (style_code(style),)
+        name = normalize(query)
+        if not name or limit <= 0:
+            return []
+
+        ranked = self._rank(name, styles, limit)
+        table = load_table()
+        icons = []
+        for key in ranked:
+            for code in styles:
+                row = self._rows[key * len(STYLES) + code]
+                if row != MISSING:
+                    icons.append(table.icon(row))
+        return icons[:limit]
+
+    def _rank(self, name: str, styles: Sequence[int], limit: int) -> list[int]:
+        scores: dict[int, tuple[int, float, int, str]] = {}
+
+        def add(key: int, rank: int, similarity: float = 0.0) -> None:
+            if key not in scores and self._has_style(key, styles):
+                candidate = self._keys[key]
+                scores[key] = (rank, -similarity, len(candidate), candidate)
+
+        for key in self._prefixes(name, styles, limit):
+            add(key, _EXACT if self._keys[key] == name else _PREFIX)
+        if len(scores) >= limit:
+            return sorted(scores, key=scores.__getitem__)
+
+        for key, rank in self._substrings(name):
+            add(key, rank)
+        if len(scores) < limit:
+            for key, similarity in self._fuzzy(trigrams(name), styles, limit):
+                add(key, _FUZZY, similarity)
+
+        return heapq.nsmallest(limit, scores, key=scores.__getitem__)
+
+    def _prefixes(self, name: str, styles: Sequence[int], limit: int) -> list[int]:
+        start = bisect_left(self._keys, name)
+        end = bisect_left(self._keys, name + "\uffff", start)
+        keys: Iterable[int] = range(start, end)
+        if len(styles) != len(STYLES):
+            keys = (key for key in keys if self._has_style(key, styles))
+        return heapq.nsmallest(limit, keys, key=self._lengths.__getitem__)
+
+    def _substrings(self, name: str) -> Iterator[tuple[int, int]]:
+        if len(name) < 3:  # noqa: PLR2004
+            # Too short for inner trigrams, only match words starting with name.
+            candidates = [f"-{name}"]
+        else:
+            candidates = [t for t in trigrams(name) if "-" not in t]
+            if not all(trigram in self._trigrams for trigram in candidates):
+                return
+        if not candidates:
+            return
+
+        # Every key containing name contains its rarest trigram.
+        start, end = min(
+            (self._trigrams.get(trigram, (0, 0)) for trigram in candidates),
+            key=lambda bounds: bounds[1] - bounds[0],
+        )
+        for key in self._postings[start:end]:
+            candidate = self._keys[key]
+            if name in candidate:
+                is_word = candidate.startswith(name) or f"-{name}" in candidate
+                yield key, _WORD if is_word else _SUBSTRING
+
+    def _fuzzy(
+        self,
+        query_trigrams: set[str],
+        styles: Sequence[int],
+        limit: int,
+    ) -> list[tuple[int, float]]:
+        shared = Counter(
+            chain.from_iterable(
+                self._postings[slice(*self._trigrams[trigram])].tolist()
+                for trigram in query_trigrams
+                if trigram in self._trigrams
+            ),
+        )
+
+        size = len(query_trigrams)
+        threshold = max(1, size // 3)
+        all_styles = len(styles) == len(STYLES)
+        counts, lengths = self._counts, self._lengths
+        candidates = [
+            (-count / size - count / (size + counts[key] - count), lengths[key], key)
+            for key, count in shared.items()
+            if count >= threshold and (all_styles or self._has_style(key, styles))
+        ]
+        return [(key, -score) for score, _, key in heapq.nsmallest(limit, candidates)]
+
+    def _has_style(self, key: int, styles: Sequence[int]) -> bool:
+        return any(self._rows[key * len(STYLES) + code] != MISSING for code in styles)
+
+
+@lru_cache(maxsize=None)
+def load_search_index() -> SearchIndex:
+    """Return the name search index, loaded once from ``tablerpy/data``."""
+    return SearchIndex(load_artifact(SEARCH))
+
+
+def search(
+    query: str,
+    style: str | None = None,
+    limit: int = 20,
+) -> list[FilledIcon | OutlineIcon]:
+    """Return icons whose name best match ``query``.
+
+    Matches are ranked as exact, prefix, word prefix (e.g. ``github`` for
+    ``brand-github``), substring and finally fuzzy matches, tolerant to typos.
+
+    Args:
+        query: Searched name, in any case, with ``-``, ``_`` or spaces.
+        style: Optional style to restrict results to (``outline`` or ``filled``).
+        limit: Maximum number of icons returned.
+
+    Raises:
+        ValueError: ``style`` is not a valid style.
+    """
+    return load_search_index().search(query, style=style, limit=limit)
@@ -0,0 +1,219 @@
+"""Icon data shared between processes through a shared memory segment."""
+
+from __future__ import annotations
+
+import array
+import hashlib
+import os
+import struct
+import sys
+import time
+from multiprocessing import resource_tracker, shared_memory
+from typing import TYPE_CHECKING, cast
+
+from tablerpy._preload import Icons, icon_rows
+from tablerpy._table import IconTable, load_table
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+MAGIC = b"TBSC"
+VERSION = 1
+
+# Magic (written last, once populated), version, table digest, row count.
+_HEADER = struct.Struct("<4sH2x8sQ")
+_OFFSET = struct.Struct("<q")
+_POLL_INTERVAL = 0.01
+
+
+class SharedIconCache:
+    """Icons svg data in a shared memory segment, read in place by every process.
+
+    The first process to `open` the cache creates the segment and copies the
+    data of ``icons`` into it, the others attach to it. While open,
+    `IconTable.data`, and so rendering and the WSGI and ASGI applications,
+    read icons data from the segment without copying it, so memory does not
+    grow with the number of processes.
+
+    The segment holds a header, a fixed-layout index of the data offset of
+    every table row (negative for icons read from the bundle), then the data.
+
+    Leaving the context manager closes the cache, and removes the segment if
+    this process created it. The segment is also removed when the process
+    that created it exits, so it should be opened first by a process
+    outliving the others, e.g. before starting a `multiprocessing.Pool`.
+
+    Args:
+        icons: Icons to cache (see `preload`), when creating the segment.
+        name: Segment name. Defaults to a name unique to the icons version.
+        timeout: Seconds to wait for another process populating the segment.
+    """
+
+    def __init__(
+        self,
+        icons: Icons = None,
+        *,
+        name: str | None = None,
+        timeout: float = 10.0,
+    ) -> None:
+        self.icons = icons
+        self.name = name or f"tablerpy-{table_digest(load_table()).hex()}"
+        self.timeout = timeout
+        self.created = False
+        self._memory: shared_memory.SharedMemory | None = None
+        self._offsets: memoryview | None = None
+        self._buffer: memoryview | None = None
+
+    def __enter__(self) -> SharedIconCache:  # noqa: PYI034
+        self.open()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+        if self.created:
+            self.unlink()
+
+    @property
+    def size(self) -> int:
+        """Size of the cached icons data in bytes, 0 when closed."""
+        return 0 if self._buffer is None else len(self._buffer)
+
+    def open(self) -> None:
+        """Attach to the segment, creating it if needed, and read icons from it.
+
+        Raises:
+            TimeoutError: Another process is still populating the segment.
+            ValueError: Segment ``name`` is not a cache of these icons.
+        """
+        if self._memory is not None:
+            return
+        table = load_table()
+        try:
+            memory = _attach(self.name)
+        except FileNotFoundError:
+            try:
+                memory = self._create(table)
+            except FileExistsError:  # Created by another process meanwhile.
+                memory = _attach(self.name)
+
+        try:
+            count = self._wait(memory, table)
+        except BaseException:
+            memory.close()
+            raise
+        index = _HEADER.size + _OFFSET.size * count
+        self._memory = memory
+        self._offsets = _view(memory)[_HEADER.size : index].cast("q")
+        self._buffer = _view(memory)[index:]
+        table.use_data(self._buffer, self._offsets)
+
+    def close(self) -> None:
+        """Stop reading icons from the segment and detach from it.
+
+        Raises:
+            BufferError: Views returned by `IconTable.data` are still
+                referenced. Close again once they are released.
+        """
+        if self._memory is None:
+            return
+        table = load_table()
+        if table.data_buffer is self._buffer:
+            table.use_data(None)
+        if self._offsets is not None:
+            self._offsets.release()
+        if self._buffer is not None:
+            self._buffer.release()
+        self._memory.close()
+        self._memory = self._offsets = self._buffer = None
+
+    def unlink(self) -> None:
+        """Remove the segment.
+
+        Processes attached to it keep reading it until they close it, the
+        next process to `open` the cache creates a new segment.
+
+        Raises:
+            FileNotFoundError: The segment does not exist.
+        """
+        memory = self._memory or _attach(self.name)
+        if not self.created and _UNTRACKED:
+            # Unregistered by `unlink`.
+            resource_tracker.register(f"/{memory.name}", "shared_memory")
+        memory.unlink()
+        if memory is not self._memory:
+            memory.close()
+        self.created = False
+
+    def _create(self, table: IconTable) -> shared_memory.SharedMemory:
+        rows = sorted(set(icon_rows(self.icons)))
+        count = len(table)
+        index = _HEADER.size + _OFFSET.size * count
+        size = sum(len(table.data(row)) for row in rows)
+        memory = shared_memory.SharedMemory(self.name, create=True, size=index + size)
+        buffer = _view(memory)
+        try:
+            offsets = array.array("q", [-1]) * count
+            position = index
+            for row in rows:
+                data = table.data(row)
+                buffer[position : position + len(data)] = data
+                offsets[row] = position - index
+                position += len(data)
+            buffer[_HEADER.size : index] = offsets.tobytes()
+            header = _HEADER.pack(MAGIC, VERSION, table_digest(table), count)
+            buffer[4 : _HEADER.size] = header[4:]
+            buffer[:4] = MAGIC  # Populated.
+        except BaseException:
+            memory.close()
+            memory.unlink()
+            raise
+        self.created = True
+        return memory
+
+    def _wait(self, memory: shared_memory.SharedMemory, table: IconTable) -> int:
+        deadline = time.monotonic() + self.timeout
+        while bytes(_view(memory)[:4]) == bytes(4):
+            if time.monotonic() > deadline:
+                msg = f"Timed out waiting for shared icon cache {self.name!r}"
+                raise TimeoutError(msg)
+            time.sleep(_POLL_INTERVAL)
+
+        magic, version, digest, count = _HEADER.unpack_from(_view(memory))
+        if magic != MAGIC or version != VERSION or digest != table_digest(table):
+            msg = f"Shared memory segment {self.name!r} is not a cache of these icons"
+            raise ValueError(msg)
+        return int(count)
+
+
+def table_digest(table: IconTable) -> bytes:
+    """Return a digest of the icons content in ``table``."""
+    return hashlib.blake2b(table["hash"].tobytes(), digest_size=8).digest()
+
+
+# Until Python 3.13 (python/cpython#82300), attaching to a segment registers it
+# with the resource tracker, which removes it when the process exits.
+_UNTRACKED = sys.version_info < (3, 13) and os.name == "posix"
+
+
+def _view(memory: shared_memory.SharedMemory) -> memoryview:
+    return cast("memoryview", memory.buf)  # Only `None` once closed.
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name, track=False)
+    if not _UNTRACKED:
+        return shared_memory.SharedMemory(name)
+    # Unregistering after attaching would also unregister the segment created
+    # by a parent process sharing the same resource tracker.
+    register = resource_tracker.register
+    resource_tracker.register = lambda *_: None
+    try:
+        return shared_memory.SharedMemory(name)
+    finally:
+        resource_tracker.register = register
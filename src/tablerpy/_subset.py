@@ -0,0 +1,186 @@
+"""Build tablerpy distributions restricted to a subset of icons."""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import logging
+import shutil
+import tempfile
+import zipfile
+from importlib import metadata as importlib_metadata
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable
+
+from tablerpy._build import (
+    IconMetadata,
+    collect_icons,
+    compile_artifacts,
+    render_enum,
+    write_artifacts,
+)
+from tablerpy._scan import scan_paths
+from tablerpy._table import ENUMS, load_table
+from tablerpy._tags import load_category_index, load_tag_index
+
+if TYPE_CHECKING:
+    from _typeshed import StrPath
+
+    from tablerpy.filled import FilledIcon
+    from tablerpy.outline import OutlineIcon
+
+logger = logging.getLogger(__name__)
+
+PACKAGE = Path(__file__).parent
+
+_GENERATED = ("__pycache__", "icons", "data", "outline.py", "filled.py")
+_ZIP_DATE = (1980, 1, 1, 0, 0, 0)
+
+
+class SubsetError(Exception):
+    """Raised when a subset excludes icons referenced by the code."""
+
+
+def build_subset(
+    icons: Iterable[FilledIcon | OutlineIcon],
+    output: StrPath,
+    *,
+    check: Iterable[StrPath] = (),
+    wheel: bool = False,
+) -> Path:
+    """Build a tablerpy distribution containing only ``icons``.
+
+    The icons tree, the enums and the runtime artifacts (table, indexes and
+    bundles) are restricted to ``icons``, the rest of the package is copied
+    from the installed tablerpy.
+
+    Args:
+        icons: Icons to keep.
+        output: Directory to write the ``tablerpy`` package or the wheel to.
+        check: Python files or directories whose icon references must all be
+            kept (see `scan_paths`).
+        wheel: Build a wheel instead of a vendored package directory.
+
+    Returns:
+        Path of the package directory or of the wheel.
+
+    Raises:
+        SubsetError: ``check`` references icons not in ``icons``.
+        FileExistsError: The package directory or wheel already exists.
+    """
+    selected = set(icons)
+    excluded = [
+        reference
+        for reference in scan_paths(check)
+        if reference.icon is None or reference.icon not in selected
+    ]
+    if excluded:
+        lines = "\n".join(f"  {reference}" for reference in excluded)
+        msg = f"{len(excluded)} references to icons excluded from the subset:\n{lines}"
+        raise SubsetError(msg)
+
+    output = Path(output)
+    if not wheel:
+        return _build_package(selected, output / "tablerpy")
+
+    try:
+        version = f"{importlib_metadata.version('tablerpy')}+subset"
+    except importlib_metadata.PackageNotFoundError:
+        version = "0+subset"
+    path = output / f"tablerpy-{version}-py3-none-any.whl"
+    if path.exists():
+        raise FileExistsError(path)
+    with tempfile.TemporaryDirectory() as tmp:
+        package = _build_package(selected, Path(tmp, "tablerpy"))
+        output.mkdir(parents=True, exist_ok=True)
+        _write_wheel(package, path, version)
+    return path
+
+
+def _build_package(icons: set[FilledIcon | OutlineIcon], target: Path) -> Path:
+    if target.exists():
+        raise FileExistsError(target)
+    logger.info("Building subset of %d icons in '%s'", len(icons), target)
+    shutil.copytree(PACKAGE, target, ignore=shutil.ignore_patterns(*_GENERATED))
+
+    table = load_table()
+    rows = sorted(table.row(icon) for icon in icons)
+    for style, enum in ENUMS.items():
+        (target / "icons" / style).mkdir(parents=True)
+        names = [table.name(row) for row in rows if table.style(row) == style]
+        (target / f"{style}.py").write_text(
+            render_enum(enum.__name__, names),
+            encoding="utf-8",
+        )
+    for row in rows:
+        path = target / "icons" / table.style(row) / f"{table.name(row)}.svg"
+        path.write_bytes(table.data(row).tobytes())
+
+    records = collect_icons(target / "icons")
+    write_artifacts(target, compile_artifacts(records, installed_metadata()))
+    return target
+
+
+def installed_metadata() -> dict[str, IconMetadata]:
+    """Return icons metadata, read back from the installed tags indexes."""
+    table = load_table()
+    categories: dict[str, str] = {}
+    tags: dict[str, set[str]] = {}
+    category_index, tag_index = load_category_index(), load_tag_index()
+    for category in category_index.terms():
+        for row in category_index.rows(category):
+            categories[table.name(row)] = category
+    for tag in tag_index.terms():
+        for row in tag_index.rows(tag):
+            tags.setdefault(table.name(row), set()).add(tag)
+    return {
+        name: IconMetadata(categories.get(name, ""), tuple(sorted(tags.get(name, ()))))
+        for name in sorted(categories.keys() | tags.keys())
+    }
+
+
+def _write_wheel(package: Path, path: Path, version: str) -> None:
+    dist_info = f"tablerpy-{version}.dist-info"
+    files = {
+        file.relative_to(package.parent).as_posix(): file.read_bytes()
+        for file in sorted(package.rglob("*"))
+        if file.is_file()
+    }
+    files[f"{dist_info}/METADATA"] = _distribution_metadata(version)
+    files[f"{dist_info}/WHEEL"] = (
+        b"Wheel-Version: 1.0\n"
+        b"Generator: tablerpy\n"
+        b"Root-Is-Purelib: true\n"
+        b"Tag: py3-none-any\n"
+    )
+    record = [
+        f"{name},sha256={_record_digest(data)},{len(data)}"
+        for name, data in files.items()
+    ]
+    record.append(f"{dist_info}/RECORD,,")
+    files[f"{dist_info}/RECORD"] = ("\n".join(record) + "\n").encode("utf-8")
+
+    logger.info("Writing wheel '%s' (%d files)", path, len(files))
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, data in files.items():
+            info = zipfile.ZipInfo(name, _ZIP_DATE)
+            info.external_attr = 0o644 << 16
+            info.compress_type = zipfile.ZIP_DEFLATED
+            archive.writestr(info, data)
+
+
+def _distribution_metadata(version: str) -> bytes:
+    lines = [
+        "Metadata-Version: 2.1",
+        "Name: tablerpy",
+        f"Version: {version}",
+        "Summary: Tabler Icons library for Python (icons subset)",
+        "Requires-Python: >=3.8",
+        "Requires-Dist: importlib_resources ; python_version < '3.10'",
+    ]
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def _record_digest(data: bytes) -> str:
+    digest = hashlib.sha256(data).digest()
+    return base64.urlsafe_b64encode(digest).rstrip(b"=").decode("ascii")
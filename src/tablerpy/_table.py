@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import array
+from functools import lru_cache
+from typing import Any, Iterable, Sequence
+
+from tablerpy._artifact import (
+    BUNDLE,
+    STYLES,
+    TABLE,
+    Artifact,
+    import_numpy,
+    load_artifact,
+    open_resource,
+)
+from tablerpy.filled import FilledIcon
+from tablerpy.outline import OutlineIcon
+
+ENUMS: dict[str, type[FilledIcon | OutlineIcon]] = {
+    "outline": OutlineIcon,
+    "filled": FilledIcon,
+}
+
+
+class IconTable:
+    """Columnar metadata table, one row per icon.
+
+    Rows are ordered by style (see `IconTable.styles`), then by file name.
+    Columns are zero-copy views over the memory-mapped table: NumPy arrays
+    when NumPy is installed, `memoryview` otherwise.
+
+    Columns:
+        id: Row index.
+        style: Index of the icon style in `IconTable.styles`.
+        name_offset: Offset of the icon name in the names blob.
+        name_length: Length in bytes of the icon name.
+        offset: Offset of the svg data in the bundle.
+        length: Length in bytes of the svg data.
+        hash: First 8 bytes of the svg data SHA-256, as a big-endian integer.
+        elements: Number of shape elements.
+        paths: Number of ``<path>`` elements.
+        commands: Number of path drawing commands.
+    """
+
+    columns = (
+        "id",
+        "style",
+        "name_offset",
+        "name_length",
+        "offset",
+        "length",
+        "hash",
+        "elements",
+        "paths",
+        "commands",
+    )
+    styles = STYLES
+
+    def __init__(self, artifact: Artifact) -> None:
+        self._artifact = artifact
+        self._columns = {name: artifact.column(name) for name in self.columns}
+        self._names = artifact.section("names")
+        # Plain views, indexed faster than NumPy columns.
+        self._offsets = artifact.section("offset")
+        self._lengths = artifact.section("length")
+        self._bundle: memoryview | None = None
+        self._rows: dict[FilledIcon | OutlineIcon, int] | None = None
+        self._preloaded: tuple[memoryview, Sequence[int]] | None = None
+
+    def __len__(self) -> int:
+        return len(self._columns["id"])
+
+    def __getitem__(self, column: str) -> Any:  # noqa: ANN401
+        return self._columns[column]
+
+    def name(self, row: int) -> str:
+        """Return icon name at ``row`` (e.g. ``brand-github``)."""
+        offset = int(self._columns["name_offset"][row])
+        length = int(self._columns["name_length"][row])
+        return self._names[offset : offset + length].tobytes().decode("utf-8")
+
+    def style(self, row: int) -> str:
+        """Return icon style at ``row``."""
+        return self.styles[self._columns["style"][row]]
+
+    def icon(self, row: int) -> FilledIcon | OutlineIcon:
+        """Return icon enum member at ``row``."""
+        return ENUMS[self.style(row)](f"{self.name(row)}.svg")
+
+    def row(self, icon: FilledIcon | OutlineIcon) -> int:
+        """Return ``icon`` row index."""
+        if self._rows is None:
+            self._rows = {self.icon(row): row for row in range(len(self))}
+        return self._rows[icon]
+
+    def data(self, row: int) -> memoryview:
+        """Return svg data at ``row``, as a view over the preloaded data or bundle."""
+        length = self._lengths[row]
+        if self._preloaded is not None:
+            buffer, offsets = self._preloaded
+            offset = offsets[row]
+            if offset >= 0:
+                return buffer[offset : offset + length]
+        if self._bundle is None:
+            self._bundle = memoryview(open_resource(BUNDLE))
+        offset = self._offsets[row]
+        return self._bundle[offset : offset + length]
+
+    def preload(self, rows: Iterable[int]) -> int:
+        """Copy svg data at ``rows`` into memory, replacing previously preloaded data.
+
+        Data is copied into a single `bytes` object, with offsets in an `array`,
+        so reading it only creates new views and never writes to its pages,
+        which stay shared with processes forked afterwards.
+
+        Returns:
+            Size of the preloaded data, in bytes.
+        """
+        offsets = array.array("q", [-1]) * len(self)
+        chunks = []
+        size = 0
+        for row in sorted(set(rows)):
+            data = self.data(row)
+            offsets[row] = size
+            chunks.append(data)
+            size += len(data)
+        self.use_data(b"".join(chunks), offsets)
+        return size
+
+    def use_data(
+        self,
+        buffer: bytes | memoryview | None,
+        offsets: Sequence[int] = (),
+    ) -> None:
+        """Read svg data from ``buffer`` instead of the bundle, or stop if `None`.
+
+        Args:
+            buffer: Svg data of some icons.
+            offsets: Offset of the svg data in ``buffer``, indexed by row,
+                negative for icons read from the bundle.
+        """
+        if buffer is None:
+            self._preloaded = None
+        else:
+            view = buffer if isinstance(buffer, memoryview) else memoryview(buffer)
+            self._preloaded = (view, offsets)
+
+    @property
+    def data_buffer(self) -> memoryview | None:
+        """Buffer svg data is read from (see `use_data`), `None` for the bundle."""
+        return None if self._preloaded is None else self._preloaded[0]
+
+    def to_numpy(self) -> Any:  # noqa: ANN401
+        """Return the table as a NumPy structured array (copy).
+
+        Raises:
+            ImportError: NumPy is not installed.
+        """
+        np = import_numpy()
+        if np is None:
+            msg = "IconTable.to_numpy requires NumPy"
+            raise ImportError(msg)
+
+        columns = {name: np.asarray(self._columns[name]) for name in self.columns}
+        dtype = [(name, column.dtype) for name, column in columns.items()]
+        records = np.empty(len(self), dtype=dtype)
+        for name, column in columns.items():
+            records[name] = column
+        return records
+
+
+@lru_cache(maxsize=None)
+def load_table() -> IconTable:
+    """Return the icons metadata table, loaded once from ``tablerpy/data``."""
+    return IconTable(load_artifact(TABLE))
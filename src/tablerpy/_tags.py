@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterable
+
+from tablerpy._artifact import TAGS, Artifact, load_artifact, style_code
+from tablerpy._table import load_table
+
+if TYPE_CHECKING:
+    from tablerpy.filled import FilledIcon
+    from tablerpy.outline import OutlineIcon
+
+
+class InvertedIndex:
+    """Map lowercase terms to sorted table rows, built by the generator."""
+
+    def __init__(self, artifact: Artifact, name: str) -> None:
+        bounds = artifact.section(f"{name}_index")
+        self._rows = artifact.section(f"{name}_rows")
+        self._terms = {
+            term: (bounds[index], bounds[index + 1])
+            for index, term in enumerate(artifact.strings(name))
+        }
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def __contains__(self, term: object) -> bool:
+        return isinstance(term, str) and term.strip().lower() in self._terms
+
+    def terms(self) -> list[str]:
+        """Return indexed terms, sorted."""
+        return list(self._terms)
+
+    def rows(self, term: str) -> memoryview:
+        """Return sorted table rows indexed under ``term``."""
+        start, end = self._terms.get(term.strip().lower(), (0, 0))
+        return self._rows[start:end]
+
+    def intersection(self, terms: Iterable[str]) -> list[int]:
+        """Return sorted table rows indexed under every term of ``terms``."""
+        postings = sorted((self.rows(term) for term in terms), key=len)
+        if not postings:
+            return []
+        rows = set(postings[0])
+        for other in postings[1:]:
+            if not rows:
+                break
+            rows.intersection_update(other)
+        return sorted(rows)
+
+
+@lru_cache(maxsize=None)
+def load_tag_index() -> InvertedIndex:
+    """Return the tags inverted index, loaded once from ``tablerpy/data``."""
+    return InvertedIndex(load_artifact(TAGS), "tag")
+
+
+@lru_cache(maxsize=None)
+def load_category_index() -> InvertedIndex:
+    """Return the categories inverted index, loaded once from ``tablerpy/data``."""
+    return InvertedIndex(load_artifact(TAGS), "category")
+
+
+def icons_by_tag(
+    *tags: str,
+    style: str | None = None,
+) -> list[FilledIcon | OutlineIcon]:
+    """Return icons tagged with every tag of ``tags``, case insensitive.
+
+    Args:
+        tags: Tags an icon must all have (e.g. ``"money"``).
+        style: Optional style to restrict results to (``outline`` or ``filled``).
+
+    Raises:
+        ValueError: ``style`` is not a valid style.
+    """
+    return _icons(load_tag_index().intersection(tags), style)
+
+
+def icons_by_category(
+    category: str,
+    style: str | None = None,
+) -> list[FilledIcon | OutlineIcon]:
+    """Return icons in ``category``, case insensitive.
+
+    Args:
+        category: Tabler category (e.g. ``"Arrows"``).
+        style: Optional style to restrict results to (``outline`` or ``filled``).
+
+    Raises:
+        ValueError: ``style`` is not a valid style.
+    """
+    return _icons(load_category_index().rows(category), style)
+
+
+def _icons(rows: Iterable[int], style: str | None) -> list[FilledIcon | OutlineIcon]:
+    table = load_table()
+    if style is None:
+        return [table.icon(row) for row in rows]
+    code = style_code(style)
+    styles = table["style"]
+    return [table.icon(row) for row in rows if styles[row] == code]
@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import sys
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator, Mapping
+
+from tablerpy._table import ENUMS, load_table
+
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from _typeshed import StrPath
+
+    from tablerpy.filled import FilledIcon
+    from tablerpy.outline import OutlineIcon
+
+MANIFEST_VERSION = 1
+
+_recorder: UsageRecorder | None = None
+
+
+class UsageRecorder:
+    """Count icons accessed through tablerpy and flush them to a manifest.
+
+    While started, `get_icon`, `render`, `icon_url`, `gzip_data`, `stream_zip`
+    and the WSGI and ASGI applications count every icon they access, with a
+    list increment. Counts are written periodically from a background thread,
+    at exit and on `stop`, merged with the counts already in the manifest.
+
+    Processes forked while recording (e.g. gunicorn or `multiprocessing`
+    workers) start counting from zero, with their own background thread, and
+    share the manifest: merges hold an exclusive lock on a ``.<name>.lock``
+    file next to it. Workers exiting without running `atexit` handlers lose
+    the counts recorded since their last flush, unless they `stop` the
+    recorder first (e.g. from gunicorn ``worker_exit`` hook).
+
+    Counts may be slightly off when several threads access the same icon
+    simultaneously, as increments are not locked.
+
+    Args:
+        path: Usage manifest path, read with `read_usage`.
+        interval: Seconds between two flushes, or `None` to only flush on `stop`,
+            at exit or explicitly.
+    """
+
+    def __init__(self, path: StrPath, interval: float | None = 60.0) -> None:
+        self.path = Path(path)
+        self.interval = interval
+        self._hits = [0] * len(load_table())
+        self._flushed = list(self._hits)
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def __enter__(self) -> UsageRecorder:  # noqa: PYI034
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        """Start recording, replacing the active recorder if any."""
+        global _recorder  # noqa: PLW0603
+        if _recorder is not None and _recorder is not self:
+            _recorder.stop()
+        _recorder = self
+        atexit.register(self.flush)
+        self._start_thread()
+
+    def stop(self) -> None:
+        """Stop recording and flush counts."""
+        global _recorder  # noqa: PLW0603
+        if _recorder is self:
+            _recorder = None
+        atexit.unregister(self.flush)
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def record(self, row: int) -> None:
+        """Count an access to icon at table ``row``."""
+        self._hits[row] += 1
+
+    def counts(self) -> dict[FilledIcon | OutlineIcon, int]:
+        """Return icons accessed since the recorder was created, and their count."""
+        table = load_table()
+        return {table.icon(row): hits for row, hits in enumerate(self._hits) if hits}
+
+    def flush(self) -> None:
+        """Add counts recorded since the last flush to the manifest."""
+        with self._lock:
+            hits = list(self._hits)
+            delta = {
+                row: count - flushed
+                for row, (count, flushed) in enumerate(zip(hits, self._flushed))
+                if count != flushed
+            }
+            if not delta and self.path.exists():
+                return
+            table = load_table()
+            with _file_lock(self.path.with_name(f".{self.path.name}.lock")):
+                usage = read_usage(self.path) if self.path.exists() else {}
+                for row, count in delta.items():
+                    icon = table.icon(row)
+                    usage[icon] = usage.get(icon, 0) + count
+                write_usage(self.path, usage)
+            self._flushed = hits
+
+    def _start_thread(self) -> None:
+        if self.interval is not None:
+            self._stopped.clear()
+            self._thread = threading.Thread(
+                target=self._run,
+                name="tablerpy-usage",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            self.flush()
+
+    def _after_fork(self) -> None:
+        # Counts recorded before forking are flushed by the parent process,
+        # and its lock may have been held by its background thread.
+        self._hits = [0] * len(self._hits)
+        self._flushed = list(self._hits)
+        self._lock = threading.Lock()
+        self._thread = None
+        self._start_thread()
+
+
+def _after_fork() -> None:
+    if _recorder is not None:
+        _recorder._after_fork()  # noqa: SLF001
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork)
+
+
+@contextmanager
+def _file_lock(path: Path) -> Iterator[None]:
+    """Hold an exclusive lock on ``path``, shared between processes."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a+b") as file:
+        if sys.platform == "win32":
+            msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(file, fcntl.LOCK_UN)
+
+
+def record(icon: FilledIcon | OutlineIcon) -> None:
+    """Count an access to ``icon`` if a `UsageRecorder` is started."""
+    recorder = _recorder
+    if recorder is not None:
+        recorder.record(load_table().row(icon))
+
+
+def record_row(row: int) -> None:
+    """Count an access to icon at table ``row`` if a `UsageRecorder` is started."""
+    recorder = _recorder
+    if recorder is not None:
+        recorder.record(row)
+
+
+def read_usage(path: StrPath) -> dict[FilledIcon | OutlineIcon, int]:
+    """Return icons listed in usage manifest ``path`` and their count.
+
+    Icons missing from this version of tablerpy are ignored.
+
+    Raises:
+        ValueError: ``path`` is not a usage manifest.
+    """
+    content = json.loads(Path(path).read_text(encoding="utf-8"))
+    if not isinstance(content, dict) or content.get("version") != MANIFEST_VERSION:
+        msg = f"Unsupported usage manifest '{path}'"
+        raise ValueError(msg)
+    usage: dict[FilledIcon | OutlineIcon, int] = {}
+    for entry in content["icons"]:
+        try:
+            icon = ENUMS[entry["style"]](f"{entry['icon']}.svg")
+        except (KeyError, ValueError):
+            continue
+        usage[icon] = usage.get(icon, 0) + int(entry["hits"])
+    return usage
+
+
+def write_usage(path: StrPath, usage: Mapping[FilledIcon | OutlineIcon, int]) -> None:
+    """Write usage manifest ``path``, listing ``usage`` icons by descending count."""
+    path = Path(path)
+    table = load_table()
+    ranked = sorted((-hits, table.row(icon)) for icon, hits in usage.items())
+    entries = [
+        {"icon": table.name(row), "style": table.style(row), "hits": -hits}
+        for hits, row in ranked
+    ]
+    content = json.dumps({"version": MANIFEST_VERSION, "icons": entries}, indent=1)
+    # Not imported with the package, only needed when writing.
+    from tablerpy._build import write_if_changed  # noqa: PLC0415
+
+    write_if_changed(path, f"{content}\n".encode())
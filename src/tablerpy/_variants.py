@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, TypeVar
+
+from tablerpy._artifact import MISSING, VARIANTS, Artifact, load_artifact
+from tablerpy._table import load_table
+
+if TYPE_CHECKING:
+    from tablerpy.filled import FilledIcon
+    from tablerpy.outline import OutlineIcon
+
+Icon = TypeVar("Icon", "FilledIcon", "OutlineIcon")
+
+
+class VariantIndex:
+    """Precomputed relationships between icons, by table row."""
+
+    def __init__(self, artifact: Artifact) -> None:
+        self._counterpart = artifact.section("counterpart")
+        self._off = artifact.section("off")
+        self._base = artifact.section("base")
+        self._variant_index = artifact.section("variant_index")
+        self._variant_rows = artifact.section("variant_rows")
+        self._family_id = artifact.section("family_id")
+        self._family_index = artifact.section("family_index")
+        self._family_rows = artifact.section("family_rows")
+
+    def counterpart(self, row: int) -> int | None:
+        """Return row of the same icon in the other style."""
+        return _row(self._counterpart[row])
+
+    def off(self, row: int) -> int | None:
+        """Return row of the ``-off`` variant."""
+        return _row(self._off[row])
+
+    def base(self, row: int) -> int | None:
+        """Return row of the icon ``row`` is an ``-off`` or numbered variant of."""
+        return _row(self._base[row])
+
+    def variants(self, row: int) -> memoryview:
+        """Return rows of the ``-off`` and numbered variants of ``row``."""
+        start, end = self._variant_index[row], self._variant_index[row + 1]
+        return self._variant_rows[start:end]
+
+    def family(self, row: int) -> memoryview:
+        """Return rows sharing the first name segment of ``row``, in its style."""
+        family = self._family_id[row]
+        start, end = self._family_index[family], self._family_index[family + 1]
+        return self._family_rows[start:end]
+
+
+def _row(value: int) -> int | None:
+    return None if value == MISSING else value
+
+
+@lru_cache(maxsize=None)
+def load_variant_index() -> VariantIndex:
+    """Return the variant index, loaded once from ``tablerpy/data``."""
+    return VariantIndex(load_artifact(VARIANTS))
+
+
+def filled_counterpart(icon: FilledIcon | OutlineIcon) -> FilledIcon | None:
+    """Return the filled icon with the same name as ``icon``, if any.
+
+    ``FilledIcon`` members are returned as is.
+    """
+    return _counterpart(icon, "filled")  # type: ignore[return-value]
+
+
+def outline_counterpart(icon: FilledIcon | OutlineIcon) -> OutlineIcon | None:
+    """Return the outline icon with the same name as ``icon``, if any.
+
+    ``OutlineIcon`` members are returned as is.
+    """
+    return _counterpart(icon, "outline")  # type: ignore[return-value]
+
+
+def _counterpart(
+    icon: FilledIcon | OutlineIcon,
+    style: str,
+) -> FilledIcon | OutlineIcon | None:
+    table = load_table()
+    row = table.row(icon)
+    if table.style(row) == style:
+        return icon
+    counterpart = load_variant_index().counterpart(row)
+    return None if counterpart is None else table.icon(counterpart)
+
+
+def off_variant(icon: Icon) -> Icon | None:
+    """Return the ``-off`` variant of ``icon`` (e.g. ``HOME_OFF`` for ``HOME``)."""
+    table = load_table()
+    row = load_variant_index().off(table.row(icon))
+    return None if row is None else table.icon(row)  # type: ignore[return-value]
+
+
+def base_icon(icon: Icon) -> Icon:
+    """Return the icon ``icon`` is an ``-off`` or numbered variant of.
+
+    For instance ``ARMCHAIR_2`` for ``ARMCHAIR_2_OFF``, ``ARMCHAIR`` for
+    ``ARMCHAIR_2`` or ``A_B`` for ``A_B_2``. Numbers are only variants when no
+    ``_0`` or ``_1`` icon exists, ``NUMBER_1`` is not a variant of ``NUMBER``.
+    Icons that are not variants are returned as is. Calling `base_icon` again
+    reaches the root of numbered ``-off`` variants.
+    """
+    table = load_table()
+    row = load_variant_index().base(table.row(icon))
+    return icon if row is None else table.icon(row)  # type: ignore[return-value]
+
+
+def variants(icon: Icon) -> list[Icon]:
+    """Return the ``-off`` and numbered variants of ``icon``."""
+    table = load_table()
+    rows = load_variant_index().variants(table.row(icon))
+    return [table.icon(row) for row in rows]  # type: ignore[misc]
+
+
+def family(icon: Icon) -> list[Icon]:
+    """Return icons sharing the first name segment of ``icon``, in its style.
+
+    For instance every ``BRAND_*`` icon for ``BRAND_GITHUB``.
+    """
+    table = load_table()
+    rows = load_variant_index().family(table.row(icon))
+    return [table.icon(row) for row in rows]  # type: ignore[misc]
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from tablerpy._http import (
+    CACHE_CONTROL,
+    CONTENT_TYPE,
+    IMMUTABLE_CACHE_CONTROL,
+    accepts_gzip,
+    etag_matches,
+    load_store,
+)
+from tablerpy._usage import record_row
+
+if TYPE_CHECKING:
+    from typing import Iterable
+
+    from _typeshed.wsgi import StartResponse, WSGIEnvironment
+
+
+class WSGIApp:
+    """WSGI application serving icons at ``/<style>/<name>.svg``.
+
+    Responses carry the icon strong ``ETag`` and a long-lived ``Cache-Control``,
+    and ``If-None-Match`` requests are answered with ``304 Not Modified``.
+    Routes and ETags are computed once, bodies are read from the memory-mapped
+    bundle: requests involve no parsing besides a dict lookup.
+
+    Icons are served gzip encoded, precompressed by the generator, to clients
+    accepting it. Fingerprinted paths (see `icon_url`) are served with an
+    ``immutable`` ``Cache-Control``.
+
+    Mount it under a prefix with the WSGI server or framework, which sets
+    ``SCRIPT_NAME``.
+
+    Args:
+        cache_control: ``Cache-Control`` header value of icon responses.
+    """
+
+    def __init__(self, cache_control: str = CACHE_CONTROL) -> None:
+        self.cache_control = cache_control
+        self._store = load_store()
+
+    def __call__(
+        self,
+        environ: WSGIEnvironment,
+        start_response: StartResponse,
+    ) -> Iterable[bytes]:
+        """Handle a WSGI request."""
+        method = environ["REQUEST_METHOD"]
+        if method not in {"GET", "HEAD"}:
+            start_response("405 Method Not Allowed", [("Allow", "GET, HEAD")])
+            return []
+
+        route = self._store.route(environ.get("PATH_INFO", ""))
+        if route is None:
+            start_response("404 Not Found", [("Content-Length", "0")])
+            return []
+
+        row, fingerprinted = route
+        record_row(row)
+        gzip = self._store.has_gzip(row) and accepts_gzip(
+            environ.get("HTTP_ACCEPT_ENCODING", ""),
+        )
+        etag = self._store.etag(row, gzip=gzip)
+        cache_control = IMMUTABLE_CACHE_CONTROL if fingerprinted else self.cache_control
+        headers = [("ETag", etag), ("Cache-Control", cache_control)]
+        if self._store.has_gzip(row):
+            headers.append(("Vary", "Accept-Encoding"))
+        if_none_match = environ.get("HTTP_IF_NONE_MATCH")
+        if if_none_match and etag_matches(if_none_match, etag):
+            start_response("304 Not Modified", headers)
+            return []
+
+        body = self._store.body(row, gzip=gzip)
+        headers.append(("Content-Type", CONTENT_TYPE))
+        if gzip:
+            headers.append(("Content-Encoding", "gzip"))
+        headers.append(("Content-Length", str(len(body))))
+        start_response("200 OK", headers)
+        return [] if method == "HEAD" else [body]
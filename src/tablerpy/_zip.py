@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import struct
+import zlib
+from typing import TYPE_CHECKING, Iterable, Iterator, Mapping, Union
+
+from tablerpy._artifact import style_code
+from tablerpy._gzip import load_gzip_bundle
+from tablerpy._lookup import lookup
+from tablerpy._render import Params, load_template
+from tablerpy._render import render_params as parse_render_params
+from tablerpy._table import load_table
+from tablerpy._usage import record_row
+
+if TYPE_CHECKING:
+    from tablerpy.filled import FilledIcon
+    from tablerpy.outline import OutlineIcon
+
+_Icon = Union["FilledIcon", "OutlineIcon", str]
+
+_LOCAL = struct.Struct("<4s5H3L2H")
+_CENTRAL = struct.Struct("<4s6H3L5H2L")
+_END = struct.Struct("<4s4H2LH")
+_VERSION = 20  # 2.0, deflate
+_UTF8 = 0x0800
+_STORED, _DEFLATED = 0, 8
+_DATE = (0 << 9) | (1 << 5) | 1  # 1980-01-01, for reproducible archives
+_ATTRIBUTES = 0o100644 << 16
+_GZIP_HEADER = 10
+_GZIP_TRAILER = 8
+
+
+def stream_zip(
+    icons: Iterable[_Icon],
+    *,
+    style: str | None = None,
+    render_params: Mapping[str, float | str] | None = None,
+) -> Iterator[bytes]:
+    """Return a generator of zip archive chunks containing ``icons``.
+
+    Members are named ``<style>/<name>.svg`` and written from the stored icon
+    data as ``icons`` is consumed, without temporary files. Icons precompressed
+    by the generator reuse their deflate stream. Memory does not depend on the
+    icons data, only on the central directory written at the end.
+
+    Args:
+        icons: Icons, or icon names resolved with `lookup`. Duplicates are
+            written once.
+        style: Style of the icons given by name.
+        render_params: ``size``, ``color`` and ``stroke`` to `render` icons with.
+
+    Raises:
+        ValueError: ``style`` or ``render_params`` is invalid, or an icon name
+            is unknown (raised when reaching the icon).
+    """
+    values = dict(render_params or {})
+    color = values.pop("color", None)
+    params = parse_render_params(
+        values.pop("size", None),
+        None if color is None else str(color),
+        values.pop("stroke", None),
+    )
+    if values:
+        msg = f"Unknown render parameters: {', '.join(map(repr, values))}"
+        raise ValueError(msg)
+    if style is not None:
+        style_code(style)
+    return _stream(icons, style, params)
+
+
+def _stream(
+    icons: Iterable[_Icon],
+    style: str | None,
+    params: Params,
+) -> Iterator[bytes]:
+    table = load_table()
+    rendered = any(value is not None for value in params)
+    central = bytearray()
+    rows: set[int] = set()
+    offset = 0
+
+    for icon in icons:
+        row = table.row(_resolve(icon, style))
+        if row in rows:
+            continue
+        rows.add(row)
+        record_row(row)
+
+        name = f"{table.style(row)}/{table.name(row)}.svg".encode()
+        if rendered:
+            method, crc, size, data = _compress(load_template(row).render(params))
+        else:
+            method, crc, size, data = _precompressed(row)
+        fields = (_DATE, crc, len(data), size, len(name))
+        header = _LOCAL.pack(b"PK\x03\x04", _VERSION, _UTF8, method, 0, *fields, 0)
+        central += _CENTRAL.pack(
+            b"PK\x01\x02",
+            _VERSION,
+            _VERSION,
+            _UTF8,
+            method,
+            0,
+            *fields,
+            0,
+            0,
+            0,
+            0,
+            _ATTRIBUTES,
+            offset,
+        )
+        central += name
+        yield header + name
+        yield data
+        offset += len(header) + len(name) + len(data)
+
+    yield bytes(central)
+    count = len(rows)
+    yield _END.pack(b"PK\x05\x06", 0, 0, count, count, len(central), offset, 0)
+
+
+def _resolve(icon: _Icon, style: str | None) -> FilledIcon | OutlineIcon:
+    if not isinstance(icon, str):
+        return icon
+    resolved = lookup(icon, style=style)
+    if resolved is None:
+        msg = f"Unknown icon {icon!r}"
+        raise ValueError(msg)
+    return resolved
+
+
+def _precompressed(row: int) -> tuple[int, int, int, bytes]:
+    member = load_gzip_bundle().data(row)
+    if member is None:
+        data = load_table().data(row).tobytes()
+        return _STORED, zlib.crc32(data), len(data), data
+    crc, size = struct.unpack_from("<2L", member, len(member) - _GZIP_TRAILER)
+    return _DEFLATED, crc, size, member[_GZIP_HEADER:-_GZIP_TRAILER].tobytes()
+
+
+def _compress(data: bytes) -> tuple[int, int, int, bytes]:
+    compressor = zlib.compressobj(9, zlib.DEFLATED, -zlib.MAX_WBITS)
+    compressed = compressor.compress(data) + compressor.flush()
+    if len(compressed) < len(data):
+        return _DEFLATED, zlib.crc32(data), len(data), compressed
+    return _STORED, zlib.crc32(data), len(data), data
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import asyncio
+import gzip
+from typing import TYPE_CHECKING, Any, Dict, MutableMapping, Tuple
+
+import pytest
+
+from tablerpy import ASGIApp, OutlineIcon, get_icon, render
+
+if TYPE_CHECKING:
+    from tablerpy._render import Params
+
+Response = Tuple[int, Dict[str, str], bytes]
+
+
+async def request(
+    app: ASGIApp,
+    path: str,
+    query: str = "",
+    method: str = "GET",
+    *,
+    headers: dict[str, str] | None = None,
+    root_path: str = "",
+) -> Response:
+    scope = {
+        "type": "http",
+        "method": method,
+        "path": root_path + path,
+        "root_path": root_path,
+        "query_string": query.encode("latin-1"),
+        "headers": [
+            (name.lower().encode("latin-1"), value.encode("latin-1"))
+            for name, value in (headers or {}).items()
+        ],
+    }
+    messages: list[MutableMapping[str, Any]] = []
+
+    async def receive() -> MutableMapping[str, Any]:  # pragma: no cover
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: MutableMapping[str, Any]) -> None:
+        messages.append(message)
+
+    await app(scope, receive, send)
+    start, body = messages
+    response_headers = {
+        name.decode("latin-1"): value.decode("latin-1")
+        for name, value in start["headers"]
+    }
+    return start["status"], response_headers, body["body"]
+
+
+def test_asgi_get() -> None:
+    status, headers, body = asyncio.run(request(ASGIApp(), "/outline/home.svg"))
+    assert status == 200
+    assert body == get_icon(OutlineIcon.HOME).read_bytes()
+    assert headers["content-type"] == "image/svg+xml"
+    assert headers["content-length"] == str(len(body))
+
+
+def test_asgi_render() -> None:
+    app = ASGIApp()
+    query = "size=32&color=%23f00&stroke=1.5"
+
+    async def main() -> tuple[Response, Response, Response]:
+        return (
+            await request(app, "/outline/home.svg"),
+            await request(app, "/outline/home.svg", query),
+            await request(
+                app,
+                "/outline/home.svg",
+                "stroke=1.50&size=32.0&color=%23F00",
+            ),
+        )
+
+    (_, plain, _), (status, headers, body), (_, same, _) = asyncio.run(main())
+    assert status == 200
+    assert body == render(OutlineIcon.HOME, size=32, color="#f00", stroke=1.5)
+    assert headers["etag"] not in {plain["etag"], ""}
+    assert same["etag"] == headers["etag"]
+
+
+def test_asgi_root_path() -> None:
+    status, _, _ = asyncio.run(
+        request(ASGIApp(), "/outline/home.svg", "size=32", root_path="/icons"),
+    )
+    assert status == 200
+
+
+def test_asgi_not_modified() -> None:
+    app = ASGIApp()
+
+    async def main() -> tuple[Response, Response]:
+        _, headers, _ = await request(app, "/outline/home.svg", "size=32")
+        conditional = {"If-None-Match": headers["etag"]}
+        return (
+            await request(app, "/outline/home.svg", "size=32", headers=conditional),
+            await request(app, "/outline/home.svg", "size=33", headers=conditional),
+        )
+
+    (status, headers, body), (other, _, _) = asyncio.run(main())
+    assert status == 304
+    assert "etag" in headers
+    assert body == b""
+    assert other == 200
+
+
+@pytest.mark.parametrize(
+    ("path", "query", "method", "expected"),
+    [
+        ("/outline/not-an-icon.svg", "", "GET", 404),
+        ("/outline/home.svg", "color=red;", "GET", 400),
+        ("/outline/home.svg", "", "POST", 405),
+    ],
+)
+def test_asgi_errors(path: str, query: str, method: str, expected: int) -> None:
+    status, _, _ = asyncio.run(request(ASGIApp(), path, query, method))
+    assert status == expected
+
+
+def test_asgi_gzip() -> None:
+    app = ASGIApp()
+    accept = {"Accept-Encoding": "gzip"}
+
+    async def main() -> tuple[Response, Response]:
+        return (
+            await request(app, "/outline/home.svg", headers=accept),
+            await request(app, "/outline/home.svg", "size=32", headers=accept),
+        )
+
+    (status, headers, body), (_, rendered, _) = asyncio.run(main())
+    assert status == 200
+    assert headers["content-encoding"] == "gzip"
+    assert headers["vary"] == "Accept-Encoding"
+    assert gzip.decompress(body) == get_icon(OutlineIcon.HOME).read_bytes()
+    # Rendered variants are not precompressed.
+    assert "content-encoding" not in rendered
+
+
+def test_asgi_head() -> None:
+    status, headers, body = asyncio.run(
+        request(ASGIApp(), "/outline/home.svg", "size=32", method="HEAD"),
+    )
+    assert status == 200
+    assert int(headers["content-length"]) > 0
+    assert body == b""
+
+
+def test_asgi_coalesce(monkeypatch: pytest.MonkeyPatch) -> None:
+    renders: list[Params] = []
+
+    def counted(row: int, params: Params) -> bytes:
+        renders.append(params)
+        return f"{row}".encode()
+
+    monkeypatch.setattr("tablerpy._asgi._render", counted)
+    app = ASGIApp(maxsize=2)
+
+    async def main() -> list[Response]:
+        return await asyncio.gather(
+            *(request(app, "/outline/home.svg", "size=32") for _ in range(10)),
+        )
+
+    responses = asyncio.run(main())
+    assert len(renders) == 1
+    assert {body for _, _, body in responses} == {responses[0][2]}
+
+    # Bounded cache evicts the least recently used variant.
+    for size in (32, 33, 34, 32):
+        asyncio.run(request(app, "/outline/home.svg", f"size={size}"))
+    assert [params[0] for params in renders] == ["32", "33", "34", "32"]
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import tablerpy
+from tablerpy._build import (
+    compile_artifacts,
+    read_package,
+    render_enum,
+    source_digest,
+    write_if_changed,
+)
+
+PACKAGE = Path(tablerpy.__file__).parent
+ROOT = Path(__file__).parent.parent
+
+
+def test_committed_artifacts_up_to_date() -> None:
+    artifacts = compile_artifacts(*read_package(PACKAGE))
+    for filename, content in artifacts.items():
+        assert (PACKAGE / "data" / filename).read_bytes() == content, filename
+
+
+def test_write_if_changed(tmp_path: Path) -> None:
+    path = tmp_path / "data" / "table.bin"
+    assert write_if_changed(path, b"table")
+    os.utime(path, (0, 0))
+    assert not write_if_changed(path, b"table")
+    assert path.stat().st_mtime == 0
+    path.chmod(0o600)
+    assert write_if_changed(path, b"changed")
+    assert path.read_bytes() == b"changed"
+    assert path.stat().st_mode & 0o777 == 0o600
+    assert [p.name for p in path.parent.iterdir()] == ["table.bin"]
+
+
+def test_render_enum() -> None:
+    assert render_enum("OutlineIcon", ["home", "a-b-2"]) == (
+        "import enum\n\n\n"
+        "class OutlineIcon(enum.Enum):\n"
+        '    A_B_2 = "a-b-2.svg"\n'
+        '    HOME = "home.svg"\n'
+    )
+    assert render_enum("FilledIcon", []).endswith("    pass\n")
+
+
+def test_source_digest(tmp_path: Path) -> None:
+    package = tmp_path / "tablerpy"
+    (package / "icons" / "outline").mkdir(parents=True)
+    shutil.copy(
+        PACKAGE / "icons" / "outline" / "home.svg",
+        package / "icons" / "outline",
+    )
+    for module in ("_artifact.py", "_build.py", "_search.py"):
+        shutil.copy(PACKAGE / module, package / module)
+
+    digest = source_digest(package)
+    (package / "outline.py").write_text("")
+    assert source_digest(package) == digest
+
+    (package / "icons" / "outline" / "home.svg").write_text("<svg/>")
+    modified = source_digest(package)
+    assert modified != digest
+    (package / "icons" / "outline" / "home.svg").rename(package / "icons" / "x.svg")
+    assert source_digest(package) != modified
+
+
+def test_build_package_data(tmp_path: Path) -> None:
+    pytest.importorskip("setuptools_scm")
+    subprocess.run(  # noqa: S603
+        [sys.executable, "setup.py", "-q", "build", "--build-base", str(tmp_path)],
+        cwd=ROOT,
+        capture_output=True,
+        check=True,
+    )
+    package = tmp_path / "lib" / "tablerpy"
+    assert (package / "icons" / "outline" / "home.svg").is_file()
+    assert (package / "data" / "table.bin").is_file()
+    assert not (package / "icons" / "manifest.json").exists()
+    assert not (package / "icons" / "metadata.json").exists()
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+
+import pytest
+
+import tablerpy
+from tablerpy import FilledIcon, OutlineIcon, get_icon, icon_url
+from tablerpy._artifact import FINGERPRINTS
+
+
+@pytest.mark.parametrize("icon", [OutlineIcon.HOME, FilledIcon.BRAND_GITHUB])
+def test_icon_url(icon: FilledIcon | OutlineIcon) -> None:
+    style = "filled" if isinstance(icon, FilledIcon) else "outline"
+    name = icon.value[:-4]
+    digest = hashlib.sha256(get_icon(icon).read_bytes()).hexdigest()
+    expected = f"{style}/{name}.{digest[:6]}.svg"
+    assert icon_url(icon) == f"/{expected}"
+    assert icon_url(icon, base="https://cdn.test/icons/") == (
+        f"https://cdn.test/icons/{expected}"
+    )
+
+
+def test_fingerprints_manifest() -> None:
+    path = Path(tablerpy.__file__).parent / "data" / FINGERPRINTS
+    manifest = json.loads(path.read_text(encoding="utf-8"))
+    assert len(manifest) == len(OutlineIcon) + len(FilledIcon)
+    for icon in (OutlineIcon.HOME, FilledIcon.HOME):
+        style = "filled" if isinstance(icon, FilledIcon) else "outline"
+        assert f"/{manifest[f'{style}/{icon.value}']}" == icon_url(icon)
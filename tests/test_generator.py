@@ -0,0 +1,560 @@
+from __future__ import annotations
+
+import hashlib
+import http.server
+import importlib.util
+import json
+import os
+import re
+import sys
+import tarfile
+import threading
+import zipfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator
+from urllib.error import HTTPError
+
+import pytest
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+GENERATOR = Path(__file__).parent.parent / "scripts" / "generator.py"
+
+
+@pytest.fixture(scope="module")
+def generator() -> ModuleType:
+    spec = importlib.util.spec_from_file_location("generator", GENERATOR)
+    assert spec
+    assert spec.loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def archive(tmp_path: Path) -> Path:
+    path = tmp_path / "tabler-icons.zip"
+    with zipfile.ZipFile(path, "w") as openzip:
+        openzip.writestr("svg/outline/home.svg", "<svg>outline</svg>")
+        openzip.writestr("svg/outline/home-off.svg", "<svg>off</svg>")
+        openzip.writestr("svg/filled/home.svg", "<svg>filled</svg>")
+        openzip.writestr("svg/outline/nested/other.svg", "<svg/>")
+        openzip.writestr("png/outline/home.png", b"\x89PNG")
+        openzip.writestr("webfont/fonts/tabler-icons.woff", b"woff")
+    return path
+
+
+class Server(http.server.ThreadingHTTPServer):
+    """Local file server supporting range requests, with injectable failures."""
+
+    root: Path
+
+    requests: list[str]
+    """Path of each ``GET`` request."""
+
+    ranges: list[str | None]
+    """``Range`` header of each ``GET`` request."""
+
+    failures: list[str]
+    """Failures injected in the next ``GET`` responses: an HTTP status code,
+    ``drop`` to close the connection mid-body or ``ignore-range``."""
+
+    @property
+    def url(self) -> str:
+        """Server base url."""
+        host, port = self.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    """Serve ``Server.root`` files."""
+
+    server: Server
+
+    def do_HEAD(self) -> None:
+        """Send file headers."""
+        content = self._content()
+        if content is not None:
+            self._send_headers(200, len(content))
+
+    def do_GET(self) -> None:
+        """Send file, or the requested range of it."""
+        self.server.requests.append(self.path)
+        self.server.ranges.append(self.headers.get("Range"))
+        failure = self.server.failures.pop(0) if self.server.failures else ""
+        content = self._content()
+        if content is None:
+            return
+        if failure.isdigit():
+            self.send_error(int(failure))
+            return
+
+        size = len(content)
+        status, start, stop = 200, 0, size
+        match = re.fullmatch(r"bytes=(\d+)-(\d*)", self.headers.get("Range", ""))
+        if_range = self.headers.get("If-Range")
+        if match and failure != "ignore-range" and if_range in {None, self._etag()}:
+            status, start = 206, int(match[1])
+            stop = int(match[2]) + 1 if match[2] else size
+        self._send_headers(status, stop - start, f"bytes {start}-{stop - 1}/{size}")
+        if failure == "drop":
+            stop = start + (stop - start) // 2
+        self.wfile.write(content[start:stop])
+
+    def _content(self) -> bytes | None:
+        path = self.server.root / self.path.lstrip("/")
+        if not path.is_file():
+            self.send_error(404)
+            return None
+        return path.read_bytes()
+
+    def _etag(self) -> str:
+        path = self.server.root / self.path.lstrip("/")
+        return f'"{path.stat().st_mtime_ns}"'
+
+    def _send_headers(self, status: int, length: int, content_range: str = "") -> None:
+        self.send_response(status)
+        self.send_header("Content-Length", str(length))
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("ETag", self._etag())
+        if status == 206:
+            self.send_header("Content-Range", content_range)
+        self.end_headers()
+
+    def log_message(self, *args: object) -> None:
+        """Silence request logs."""
+
+
+@pytest.fixture
+def server(tmp_path: Path) -> Iterator[Server]:
+    httpd = Server(("127.0.0.1", 0), Handler)
+    httpd.root = tmp_path / "www"
+    httpd.root.mkdir()
+    httpd.requests = []
+    httpd.ranges = []
+    httpd.failures = []
+    thread = threading.Thread(
+        target=httpd.serve_forever,
+        kwargs={"poll_interval": 0.01},
+        daemon=True,
+    )
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+    thread.join()
+
+
+@pytest.fixture
+def packs(generator: ModuleType, tmp_path: Path) -> list:
+    package = tmp_path / "tablerpy"
+    return [
+        generator.IconPack(
+            icons_archive_dir=Path("svg", style),
+            icons_extract_dir=package / "icons" / style,
+            enum_name=f"{style.capitalize()}Icon",
+            enum_py=package / f"{style}.py",
+            icons_npm_dir=Path("icons", style),
+        )
+        for style in ("filled", "outline")
+    ]
+
+
+def test_extract_icons(
+    generator: ModuleType,
+    archive: Path,
+    packs: list,
+    tmp_path: Path,
+) -> None:
+    filled, outline = (pack.icons_extract_dir for pack in packs)
+    outline.mkdir(parents=True)
+    (outline / "removed.svg").write_text("<svg/>")
+
+    progression: list[tuple[int, int]] = []
+    generator.extract_icons(
+        archive,
+        packs,
+        tmp_path / "manifest.json",
+        progression=lambda *args: progression.append(args),
+    )
+
+    assert sorted(p.name for p in outline.iterdir()) == ["home-off.svg", "home.svg"]
+    assert [p.name for p in filled.iterdir()] == ["home.svg"]
+    assert (filled / "home.svg").read_text() == "<svg>filled</svg>"
+    assert not (archive.parent / "svg").exists()
+    assert progression[-1][0] == progression[-1][1]
+    assert len(progression) == 3
+
+
+@pytest.fixture
+def npm_package(tmp_path: Path) -> Path:
+    root = tmp_path / "npm" / "package"
+    for name, content in {
+        "icons/outline/home.svg": "<svg>outline</svg>",
+        "icons/outline/home-off.svg": "<svg>off</svg>",
+        "icons/filled/home.svg": "<svg>filled</svg>",
+        "icons.json": '{"home": {"category": "Buildings", "tags": ["house"]}}',
+        "tabler-sprite.svg": "<svg/>",
+    }.items():
+        (root / name).parent.mkdir(parents=True, exist_ok=True)
+        (root / name).write_text(content)
+    return root
+
+
+@pytest.mark.parametrize("kind", ["tgz", "directory", "release-directory"])
+def test_extract_icons_sources(  # noqa: PLR0917
+    generator: ModuleType,
+    archive: Path,
+    npm_package: Path,
+    packs: list,
+    tmp_path: Path,
+    kind: str,
+) -> None:
+    if kind == "tgz":
+        source = tmp_path / "tabler-icons-3.30.0.tgz"
+        with tarfile.open(source, "w:gz") as opentar:
+            opentar.add(npm_package, arcname="package")
+    elif kind == "directory":
+        source = npm_package.parent
+    else:
+        source = tmp_path / "release"
+        with zipfile.ZipFile(archive) as openzip:
+            openzip.extractall(source)  # noqa: S202
+
+    report = generator.extract_icons(source, packs, tmp_path / "manifest.json")
+    assert report.summary() == "3 added, 0 removed, 0 modified"
+    outline = packs[1].icons_extract_dir
+    assert (outline / "home-off.svg").read_text() == "<svg>off</svg>"
+    metadata = generator.read_source_metadata(source)
+    if kind == "release-directory":
+        assert metadata is None
+    else:
+        assert json.loads(metadata)["home"]["tags"] == ["house"]
+
+
+def test_extract_icons_invalid_source(
+    generator: ModuleType,
+    packs: list,
+    tmp_path: Path,
+) -> None:
+    source = tmp_path / "icons.txt"
+    source.write_text("not an archive")
+    with pytest.raises(ValueError, match="Unsupported icons source"):
+        generator.extract_icons(source, packs, tmp_path / "manifest.json")
+
+
+@pytest.mark.parametrize("processes", [False, True])
+def test_extract_icons_workers(
+    generator: ModuleType,
+    archive: Path,
+    packs: list,
+    processes: bool,  # noqa: FBT001
+) -> None:
+    workers = generator.Workers(jobs=3, processes=processes)
+    manifest = archive.parent / "manifest.json"
+    generator.extract_icons(archive, packs, manifest, workers=workers)
+    outline = packs[1].icons_extract_dir
+    assert (outline / "home-off.svg").read_text() == "<svg>off</svg>"
+
+
+def test_extract_icons_incremental(
+    generator: ModuleType,
+    archive: Path,
+    packs: list,
+    tmp_path: Path,
+) -> None:
+    manifest = tmp_path / "manifest.json"
+    report = generator.extract_icons(archive, packs, manifest)
+    assert json.loads(report.to_json())["added"] == {
+        "filled": ["home.svg"],
+        "outline": ["home-off.svg", "home.svg"],
+    }
+
+    outline = packs[1].icons_extract_dir
+    unchanged = outline / "home-off.svg"
+    os.utime(unchanged, (0, 0))
+    with zipfile.ZipFile(archive, "w") as openzip:
+        openzip.writestr("svg/outline/home.svg", "<svg>changed</svg>")
+        openzip.writestr("svg/outline/home-off.svg", "<svg>off</svg>")
+        openzip.writestr("svg/outline/new.svg", "<svg>new</svg>")
+
+    report = generator.extract_icons(archive, packs, manifest)
+    assert json.loads(report.to_json()) == {
+        "added": {"outline": ["new.svg"]},
+        "removed": {"filled": ["home.svg"]},
+        "modified": {"outline": ["home.svg"]},
+    }
+    assert report.summary() == "1 added, 1 removed, 1 modified"
+    assert unchanged.stat().st_mtime == 0
+    assert (outline / "home.svg").read_text() == "<svg>changed</svg>"
+    assert not (packs[0].icons_extract_dir / "home.svg").exists()
+    assert generator.read_manifest(manifest)["outline"]["new.svg"] == (
+        hashlib.sha256(b"<svg>new</svg>").hexdigest()
+    )
+
+
+def test_workers_map_ordered(generator: ModuleType) -> None:
+    workers = generator.Workers(jobs=4)
+    items = list(range(100))
+    chunks = workers.chunks(items)
+    assert len(chunks) <= 16
+    assert [i for chunk in chunks for i in chunk] == items
+    assert list(workers.map(str, items)) == [str(i) for i in items]
+
+
+def test_write_enum_if_changed(
+    generator: ModuleType,
+    archive: Path,
+    packs: list,
+) -> None:
+    generator.extract_icons(archive, packs, archive.parent / "manifest.json")
+    outline = packs[1]
+    assert generator.write_enums(packs) == [pack.enum_py for pack in packs]
+    assert outline.enum_py.read_text() == (
+        "import enum\n\n\nclass OutlineIcon(enum.Enum):\n"
+        '    HOME_OFF = "home-off.svg"\n'
+        '    HOME = "home.svg"\n'
+    )
+
+    os.utime(outline.enum_py, (0, 0))
+    assert generator.write_enums(packs) == []
+    assert outline.enum_py.stat().st_mtime == 0
+    (outline.icons_extract_dir / "home-off.svg").unlink()
+    assert generator.write_enums(packs) == [outline.enum_py]
+    assert [p.name for p in outline.enum_py.parent.glob(".*")] == []
+
+
+@pytest.mark.parametrize("mode", ["checked", "unchecked"])
+def test_compile_pyc(generator: ModuleType, tmp_path: Path, mode: str) -> None:
+    module = tmp_path / "module.py"
+    module.write_text("X = 1\n")
+    generator.compile_pyc(module, mode)
+    pyc = Path(importlib.util.cache_from_source(str(module)))
+    flags = int.from_bytes(pyc.read_bytes()[4:8], "little")
+    assert flags == {"checked": 0b11, "unchecked": 0b01}[mode]
+
+
+def test_cached_download(generator: ModuleType, server: Server, tmp_path: Path) -> None:
+    content = os.urandom(100_000)
+    (server.root / "asset.zip").write_bytes(content)
+    url = f"{server.url}/asset.zip"
+    cache = tmp_path / "cache" / "1.0.0"
+    digest = hashlib.sha256(content).hexdigest()
+
+    path = generator.cached_download(url, cache, "asset.zip")
+    assert path.read_bytes() == content
+    assert (cache / "asset.zip.sha256").read_text().strip() == digest
+    assert not (cache / "asset.zip.part").exists()
+
+    assert generator.cached_download(url, cache, "asset.zip", sha256=digest) == path
+    assert server.requests == ["/asset.zip"]
+
+    # Corrupt cache entry is replaced.
+    path.write_bytes(content[:1000])
+    assert generator.cached_download(url, cache, "asset.zip").read_bytes() == content
+    assert len(server.requests) == 2
+
+
+def test_cached_download_checksum_error(
+    generator: ModuleType,
+    server: Server,
+    tmp_path: Path,
+) -> None:
+    (server.root / "asset.zip").write_bytes(b"content")
+    cache = tmp_path / "cache"
+    (cache / "asset.zip.part").parent.mkdir()
+    (cache / "asset.zip.part").write_bytes(b"partial")
+
+    with pytest.raises(generator.ChecksumError):
+        generator.cached_download(
+            f"{server.url}/asset.zip",
+            cache,
+            "asset.zip",
+            sha256="0" * 64,
+        )
+    assert list(cache.iterdir()) == []
+
+
+@pytest.fixture
+def asset(server: Server) -> bytes:
+    content = os.urandom(300_000)
+    (server.root / "asset.zip").write_bytes(content)
+    return content
+
+
+def test_download_resume(
+    generator: ModuleType,
+    server: Server,
+    asset: bytes,
+    tmp_path: Path,
+) -> None:
+    server.failures = ["drop", "500", "drop"]
+    policy = generator.DownloadPolicy(backoff=0)
+    progression: list[tuple[int, int]] = []
+    path = generator.download(
+        f"{server.url}/asset.zip",
+        tmp_path,
+        policy=policy,
+        progression=lambda *args: progression.append(args),
+    )
+    assert path.read_bytes() == asset
+    assert server.ranges[:2] == [None, f"bytes={len(asset) // 2}-"]
+    assert len(server.requests) == 4
+    assert progression[-1] == (len(asset), len(asset))
+
+
+def test_download_range_ignored(
+    generator: ModuleType,
+    server: Server,
+    asset: bytes,
+    tmp_path: Path,
+) -> None:
+    server.failures = ["drop", "ignore-range"]
+    policy = generator.DownloadPolicy(backoff=0)
+    path = generator.download(f"{server.url}/asset.zip", tmp_path, policy=policy)
+    assert path.read_bytes() == asset
+    assert len(server.requests) == 2
+
+
+@pytest.mark.parametrize(
+    ("failures", "requests"),
+    [(["503", "503", "503"], 3), (["404"], 1), (["204"], 1)],
+)
+def test_download_errors(  # noqa: PLR0917
+    generator: ModuleType,
+    server: Server,
+    asset: bytes,  # noqa: ARG001
+    tmp_path: Path,
+    failures: list[str],
+    requests: int,
+) -> None:
+    server.failures = failures
+    policy = generator.DownloadPolicy(retries=2, backoff=0)
+    with pytest.raises((generator.DownloadError, HTTPError)):
+        generator.download(f"{server.url}/asset.zip", tmp_path, policy=policy)
+    assert len(server.requests) == requests
+
+
+def test_download_segments(
+    generator: ModuleType,
+    server: Server,
+    asset: bytes,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(generator, "MIN_SEGMENT_SIZE", 1024)
+    server.failures = ["drop"]
+    policy = generator.DownloadPolicy(backoff=0, segments=3)
+    path = generator.download(f"{server.url}/asset.zip", tmp_path, policy=policy)
+    assert path.read_bytes() == asset
+    assert len(server.requests) == 4
+    assert {"bytes=0-99999", "bytes=100000-199999", "bytes=200000-299999"} <= set(
+        server.ranges,
+    )
+
+
+def test_metrics(
+    generator: ModuleType,
+    archive: Path,
+    packs: list,
+    tmp_path: Path,
+) -> None:
+    metrics = generator.Metrics()
+    manifest = tmp_path / "manifest.json"
+    for _ in range(2):
+        with metrics.phase("extract") as phase:
+            generator.extract_icons(archive, packs, manifest, metrics=phase)
+
+    first, second = json.loads(metrics.to_json())["phases"]
+    assert first["name"] == "extract"
+    assert first["files_in"] == second["files_in"] == 3
+    assert first["bytes_in"] == len("<svg>outline</svg><svg>off</svg><svg>filled</svg>")
+    assert (first["files_out"], second["files_out"]) == (3, 0)
+    assert first["wall_time"] > 0
+    assert first["peak_memory"] is None or first["peak_memory"] > 0
+
+
+OUTLINE = (
+    '<svg xmlns="http://www.w3.org/2000/svg" width="24" height="24" '
+    'viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" '
+    'stroke-linecap="round" stroke-linejoin="round" '
+    'class="icon icon-tabler icons-tabler-outline icon-tabler-home">'
+    '<path stroke="none" d="M0 0h24v24H0z" fill="none"/>{}</svg>'
+)
+
+
+@pytest.mark.parametrize(
+    ("content", "violations"),
+    [
+        (OUTLINE.format('<circle cx="12" cy="12" r="3"/>'), []),
+        ("<svg", ["Malformed svg: unclosed token: line 1, column 0"]),
+        (
+            OUTLINE.replace("0 0 24 24", "0 0 20 20"),
+            ["<svg> viewBox is '0 0 20 20', expected '0 0 24 24'"],
+        ),
+        (
+            OUTLINE.replace("icon-tabler-home", "icon-tabler-house"),
+            ["<svg> class is missing 'icon-tabler-home'"],
+        ),
+        (
+            OUTLINE.format('<script/><path style="x" stroke="#000" d="M0 0"/>'),
+            [
+                "Unexpected element <{http://www.w3.org/2000/svg}script>",
+                "Unexpected attribute 'style' on <path>",
+                "Hardcoded stroke '#000' on <path>",
+            ],
+        ),
+    ],
+)
+def test_validate_icon(
+    generator: ModuleType,
+    content: str,
+    violations: list[str],
+) -> None:
+    assert generator.validate_icon(content.encode(), "outline", "home") == violations
+
+
+def test_validate_icons(generator: ModuleType, packs: list) -> None:
+    outline = packs[1].icons_extract_dir
+    outline.mkdir(parents=True)
+    (outline / "home.svg").write_text(OUTLINE.format(""))
+    (outline / "home-off.svg").write_text(OUTLINE.format(""))
+
+    report = generator.validate_icons(packs, workers=generator.Workers(jobs=2))
+    assert report.summary() == "2 icons, 1 invalid, 1 violations"
+    assert json.loads(report.to_json())["violations"] == {
+        "outline": {"home-off.svg": ["<svg> class is missing 'icon-tabler-home-off'"]},
+    }
+
+
+def test_main_invalid_icons(
+    generator: ModuleType,
+    packs: list,
+    tmp_path: Path,
+) -> None:
+    source = tmp_path / "source"
+    icons = source / "package" / "icons" / "outline"
+    icons.mkdir(parents=True)
+    (icons / "home.svg").write_text(OUTLINE.format(""))
+    (icons / "home-off.svg").write_text(
+        OUTLINE.format("").replace("tabler-home", "tabler-home-off"),
+    )
+    package = packs[0].enum_py.parent
+    generator.extract_icons(source, packs, package / "icons" / "manifest.json")
+    generator.write_enums(packs)
+    before = {path: path.read_bytes() for path in package.rglob("*") if path.is_file()}
+
+    (icons / "home-off.svg").unlink()
+    (icons / "home.svg").write_text(OUTLINE.format('<path stroke="red" d="M0 0"/>'))
+    (icons / "star.svg").write_text(OUTLINE.format("").replace("home", "star"))
+    validation = tmp_path / "validation.json"
+    args = ["--source", str(source), "--package", str(package)]
+    assert generator.main([*args, "--validation-report", str(validation)]) == 1
+
+    after = {path: path.read_bytes() for path in package.rglob("*") if path.is_file()}
+    assert after == before
+    assert json.loads(validation.read_text())["violations"] == {
+        "outline": {"home.svg": ["Hardcoded stroke 'red' on <path>"]},
+    }
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import gzip
+
+import pytest
+
+from tablerpy import FilledIcon, OutlineIcon, get_icon, gzip_data, gzip_length
+from tablerpy._http import accepts_gzip
+
+
+@pytest.mark.parametrize("icon", [OutlineIcon.HOME, FilledIcon.BRAND_GITHUB])
+def test_gzip_data(icon: FilledIcon | OutlineIcon) -> None:
+    data = gzip_data(icon)
+    assert data is not None
+    assert len(data) == gzip_length(icon)
+    assert gzip_length(icon) < len(get_icon(icon).read_bytes())
+    assert gzip.decompress(data) == get_icon(icon).read_bytes()
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        ("gzip, deflate, br", True),
+        ("br;q=1.0, gzip;q=0.8", True),
+        ("x-gzip", True),
+        ("*", True),
+        ("", False),
+        ("identity", False),
+        ("gzip;q=0", False),
+        ("gzip;q=0, *", False),
+        ("br, *;q=0.1", True),
+    ],
+)
+def test_accepts_gzip(header: str, *, expected: bool) -> None:
+    assert accepts_gzip(header) is expected
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import pytest
+
+from tablerpy import FilledIcon, OutlineIcon, lookup, lookup_many
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "brand-github",
+        "BRAND_GITHUB",
+        "brand_github",
+        "brand-github.svg",
+        "brand_github.svg",
+        "outline/brand-github",
+        "outline/brand-github.svg",
+        " Brand-GitHub.SVG ",
+        "OUTLINE/BRAND_GITHUB",
+    ],
+)
+def test_lookup(name: str) -> None:
+    assert lookup(name) is OutlineIcon.BRAND_GITHUB
+
+
+def test_lookup_style() -> None:
+    assert lookup("home", style="filled") is FilledIcon.HOME
+    assert lookup("filled/home") is FilledIcon.HOME
+    assert lookup("filled/home", style="outline") is None
+    assert lookup("home-off", style="filled") is None
+
+
+def test_lookup_missing() -> None:
+    assert lookup("unknown") is None
+    assert lookup("") is None
+
+
+def test_lookup_invalid_style() -> None:
+    with pytest.raises(ValueError, match="nope"):
+        lookup("home", style="nope")
+
+
+def test_lookup_many() -> None:
+    assert lookup_many(["home", "filled/home.svg", "unknown"]) == [
+        OutlineIcon.HOME,
+        FilledIcon.HOME,
+        None,
+    ]
+    assert lookup_many(["HOME", "home-off"], style="filled") == [FilledIcon.HOME, None]
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Iterator
+
+import pytest
+
+from tablerpy import FilledIcon, OutlineIcon, get_icon, load_table, preload
+from tablerpy._http import load_store
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture(autouse=True)
+def _reset() -> Iterator[None]:
+    yield
+    load_table().preload(())
+
+
+def test_preload_icons() -> None:
+    table = load_table()
+    icons: list[FilledIcon | OutlineIcon] = [OutlineIcon.HOME, FilledIcon.STAR]
+    size = preload(icons)
+    assert size == sum(len(get_icon(icon).read_bytes()) for icon in icons)
+    for icon in icons:
+        data = table.data(table.row(icon))
+        assert isinstance(data.obj, bytes)
+        assert len(data.obj) == size
+        assert data.tobytes() == get_icon(icon).read_bytes()
+
+    data = table.data(table.row(OutlineIcon.USER))
+    assert not isinstance(data.obj, bytes)
+    assert data.tobytes() == get_icon(OutlineIcon.USER).read_bytes()
+
+
+def test_preload_manifest(tmp_path: Path) -> None:
+    manifest = tmp_path / "usage.json"
+    manifest.write_text(
+        json.dumps(
+            {"version": 1, "icons": [{"icon": "home", "style": "filled", "hits": 4}]},
+        ),
+        encoding="utf-8",
+    )
+    assert preload(manifest) == len(get_icon(FilledIcon.HOME).read_bytes())
+
+
+def test_preload_all() -> None:
+    table = load_table()
+    assert preload() == sum(table["length"].tolist())
+    store = load_store()
+    row = table.row(OutlineIcon.HOME)
+    assert store.route("/outline/home.svg") == (row, False)
+    assert store.body(row) == get_icon(OutlineIcon.HOME).read_bytes()
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import pytest
+
+from tablerpy import FilledIcon, OutlineIcon, get_icon, render
+
+
+def test_render_defaults() -> None:
+    assert render(OutlineIcon.HOME) == get_icon(OutlineIcon.HOME).read_bytes()
+
+
+def test_render_outline() -> None:
+    svg = render(OutlineIcon.HOME, size=32, color="#F00", stroke="1.50")
+    assert b'width="32"' in svg
+    assert b'height="32"' in svg
+    assert b'stroke="#f00"' in svg
+    assert b'stroke-width="1.5"' in svg
+    # Child elements are left untouched.
+    assert b'<path stroke="none" d="M0 0h24v24H0z" fill="none"/>' in svg
+
+
+def test_render_child_color() -> None:
+    svg = render(OutlineIcon.ACCESSIBLE, color="#f00")
+    assert b"currentColor" not in svg
+    assert b'<circle cx="12" cy="7.5" r=".5" fill="#f00" />' in svg
+
+    svg = render(FilledIcon.LOCK_SQUARE_ROUNDED, color="red")
+    assert b"currentColor" not in svg
+    assert svg.count(b'fill="red"') == 2
+
+
+def test_render_filled() -> None:
+    svg = render(FilledIcon.HOME, size="48", color="Red", stroke=3)
+    assert b'width="48"' in svg
+    assert b'fill="red"' in svg
+    assert b"stroke-width" not in svg
+
+
+@pytest.mark.parametrize(
+    ("size", "color", "stroke"),
+    [
+        ("-1", None, None),
+        ("1e3", None, None),
+        (None, "#ff", None),
+        (None, "red;", None),
+        (None, '" onload="', None),
+        (None, None, "thick"),
+    ],
+)
+def test_render_invalid(
+    size: str | None,
+    color: str | None,
+    stroke: str | None,
+) -> None:
+    with pytest.raises(ValueError, match="Invalid"):
+        render(OutlineIcon.HOME, size=size, color=color, stroke=stroke)
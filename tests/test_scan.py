@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import logging
+import re
+from typing import TYPE_CHECKING
+
+import pytest
+
+from tablerpy import FilledIcon, OutlineIcon, read_usage
+from tablerpy.__main__ import main
+from tablerpy._scan import scan_file, scan_paths, scan_source, scan_text
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+SOURCE = """\
+from tablerpy import FilledIcon, OutlineIcon, lookup, lookup_many
+
+a = OutlineIcon["STAR"]
+b = FilledIcon("home.svg")
+c = lookup("filled/heart")
+d = lookup("user", style="outline")
+e = lookup_many(["home", "not-an-icon"], "filled")
+f = lookup(name, style=style)
+g = OutlineIcon(value)
+"""
+ZOOM = "from tablerpy import OutlineIcon\nx = OutlineIcon.ZOOM\n"
+
+
+def test_scan_source_lookups() -> None:
+    references = scan_source(SOURCE)
+    assert [(reference.text, reference.icon) for reference in references] == [
+        ("OutlineIcon['STAR']", OutlineIcon.STAR),
+        ("FilledIcon('home.svg')", FilledIcon.HOME),
+        ("'filled/heart'", FilledIcon.HEART),
+        ("'user'", OutlineIcon.USER),
+        ("'home'", FilledIcon.HOME),
+        ("'not-an-icon'", None),
+    ]
+
+
+def test_scan_source_resolves_imports() -> None:
+    source = """\
+import codecs
+import tablerpy as tp
+import tablerpy.filled
+from tablerpy import OutlineIcon as Icon, lookup as find
+from tablerpy.outline import OutlineIcon
+
+codecs.lookup("utf-8")
+registry.lookup("user")
+lookup("home")
+other.OutlineIcon.HOME
+find("star")
+tp.FilledIcon.HOME
+tablerpy.filled.FilledIcon["STAR"]
+Icon.USER
+OutlineIcon("bell.svg")
+"""
+    assert [reference.icon for reference in scan_source(source)] == [
+        OutlineIcon.STAR,
+        FilledIcon.HOME,
+        FilledIcon.STAR,
+        OutlineIcon.USER,
+        OutlineIcon.BELL,
+    ]
+    assert scan_source('import codecs\ncodecs.lookup("utf-8")\nobj.lookup("x")') == []
+
+
+def test_scan_text() -> None:
+    text = '<p>\n{{ icon("home", style="filled") }}\n{{ icon("star") }}</p>'
+    patterns = [re.compile(r'icon\("(?P<name>[^"]+)"(?:, style="(?P<style>\w+)")?')]
+    references = scan_text(text, patterns, "page.html")
+    assert [str(reference) for reference in references] == [
+        "page.html:2: 'home'",
+        "page.html:3: 'star'",
+    ]
+    assert [reference.icon for reference in references] == [
+        FilledIcon.HOME,
+        OutlineIcon.STAR,
+    ]
+
+
+def test_scan_file_skips_unrelated_sources(tmp_path: Path) -> None:
+    path = tmp_path / "invalid.py"
+    path.write_text("def (", encoding="utf-8")
+    assert scan_file(path) == []
+    path.write_text("import tablerpy\ntablerpy.OutlineIcon.HOME(", encoding="utf-8")
+    with pytest.raises(SyntaxError):
+        scan_file(path)
+
+
+def test_scan_paths(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    for name in ("app", ".venv", "app/__pycache__"):
+        (tmp_path / name).mkdir()
+    (tmp_path / "app" / "main.py").write_text(SOURCE, encoding="utf-8")
+    (tmp_path / "app" / "broken.py").write_text("import tablerpy\n(", encoding="utf-8")
+    (tmp_path / "app" / "page.html").write_text("{{ icon('bell') }}", encoding="utf-8")
+    (tmp_path / ".venv" / "lib.py").write_text(ZOOM, encoding="utf-8")
+    files = [tmp_path / "app" / "__pycache__" / f"{i}.py" for i in range(300)]
+    for path in files:
+        path.write_text(ZOOM, encoding="utf-8")
+
+    with caplog.at_level(logging.WARNING):
+        references = scan_paths([tmp_path], patterns=[r"icon\('([^']+)'\)"])
+    assert {reference.icon for reference in references} == {
+        OutlineIcon.STAR,
+        OutlineIcon.USER,
+        OutlineIcon.BELL,
+        FilledIcon.HOME,
+        FilledIcon.HEART,
+        None,
+    }
+    assert "broken.py" in caplog.text
+
+    parallel = scan_paths(files, jobs=2)
+    assert len(parallel) == len(files)
+    assert {reference.icon for reference in parallel} == {OutlineIcon.ZOOM}
+
+
+@pytest.mark.parametrize(
+    ("pattern", "message"),
+    [
+        ("ti-[a-z-]+", "expected a 'name' group or a single group"),
+        ("(ti)-([a-z-]+)", "expected a 'name' group or a single group"),
+        ("ti-([a-z-]+", "missing ), unterminated subpattern"),
+    ],
+)
+def test_scan_invalid_pattern(
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+    pattern: str,
+    message: str,
+) -> None:
+    with pytest.raises(ValueError, match=re.escape(message)):
+        scan_paths([tmp_path], patterns=[pattern])
+    with pytest.raises(SystemExit) as exc_info:
+        main(["scan", str(tmp_path), "--pattern", pattern])
+    assert exc_info.value.code == 2
+    assert message in capsys.readouterr().err
+
+
+def test_scan_command(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    (tmp_path / "main.py").write_text(SOURCE, encoding="utf-8")
+    assert main(["scan", str(tmp_path)]) == 0
+    assert capsys.readouterr().out.split() == [
+        "outline/star",
+        "outline/user",
+        "filled/heart",
+        "filled/home",
+    ]
+
+    manifest = tmp_path / "usage.json"
+    assert main(["scan", str(tmp_path), "--output", str(manifest)]) == 0
+    assert read_usage(manifest) == {
+        OutlineIcon.STAR: 1,
+        OutlineIcon.USER: 1,
+        FilledIcon.HEART: 1,
+        FilledIcon.HOME: 2,
+    }
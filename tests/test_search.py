@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import pytest
+
+from tablerpy import FilledIcon, OutlineIcon, search
+
+
+def test_search_exact_first() -> None:
+    assert search("home", limit=2) == [OutlineIcon.HOME, FilledIcon.HOME]
+
+
+@pytest.mark.parametrize("query", ["BRAND_GITHUB", "brand github", "brand-github.svg"])
+def test_search_normalize(query: str) -> None:
+    assert search(query, style="outline", limit=1) == [OutlineIcon.BRAND_GITHUB]
+
+
+def test_search_prefix() -> None:
+    icons = search("brand-git", style="outline", limit=50)
+    assert icons[0] is OutlineIcon.BRAND_GIT
+    assert OutlineIcon.BRAND_GITLAB in icons
+
+
+def test_search_word_prefix() -> None:
+    icons = search("github", style="filled", limit=3)
+    assert icons[0] is FilledIcon.BRAND_GITHUB
+
+
+def test_search_fuzzy() -> None:
+    assert OutlineIcon.BRAND_GITHUB in search("githib", style="outline", limit=5)
+
+
+def test_search_style() -> None:
+    icons = search("arrow", style="filled", limit=100)
+    assert icons
+    assert all(isinstance(icon, FilledIcon) for icon in icons)
+
+
+def test_search_limit() -> None:
+    assert len(search("a", limit=7)) == 7
+    assert search("a", limit=0) == []
+    assert search("   ") == []
+
+
+def test_search_invalid_style() -> None:
+    with pytest.raises(ValueError, match="nope"):
+        search("home", style="nope")
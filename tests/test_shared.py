@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import contextlib
+import subprocess
+import sys
+import uuid
+from multiprocessing import shared_memory
+from typing import Iterator
+
+import pytest
+
+from tablerpy import FilledIcon, OutlineIcon, SharedIconCache, get_icon, load_table
+
+
+@pytest.fixture
+def name() -> Iterator[str]:
+    name = f"tablerpy-test-{uuid.uuid4().hex[:8]}"
+    yield name
+    with contextlib.suppress(FileNotFoundError):
+        shared_memory.SharedMemory(name).unlink()
+
+
+def test_shared_icon_cache(name: str) -> None:
+    table = load_table()
+    icons: list[FilledIcon | OutlineIcon] = [OutlineIcon.HOME, FilledIcon.STAR]
+    with SharedIconCache(icons, name=name) as cache:
+        assert cache.created
+        assert cache.size == sum(len(get_icon(icon).read_bytes()) for icon in icons)
+        for icon in icons:
+            data = table.data(table.row(icon))
+            assert data.obj is not table.data(0).obj
+            assert data.tobytes() == get_icon(icon).read_bytes()
+            del data
+        assert table.data_buffer is not None
+
+        code = (
+            "import tablerpy\n"
+            f"cache = tablerpy.SharedIconCache(name={name!r})\n"
+            "cache.open()\n"
+            "table = tablerpy.load_table()\n"
+            "data = table.data(table.row(tablerpy.OutlineIcon.HOME)).tobytes()\n"
+            "print(cache.created, cache.size, data.startswith(b'<svg'))\n"
+            "cache.close()\n"
+        )
+        output = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert output.stdout == f"False {cache.size} True\n"
+        assert output.stderr == ""
+
+        with SharedIconCache(name=name) as other:
+            assert not other.created
+            assert other.size == cache.size
+
+    assert table.data_buffer is None
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name)
+
+
+def test_shared_icon_cache_close_with_views(name: str) -> None:
+    table = load_table()
+    cache = SharedIconCache([OutlineIcon.HOME], name=name)
+    cache.open()
+    data = table.data(table.row(OutlineIcon.HOME))
+    with pytest.raises(BufferError):
+        cache.close()
+    del data
+    cache.close()
+    cache.unlink()
+
+
+def test_shared_icon_cache_invalid_segment(name: str) -> None:
+    memory = shared_memory.SharedMemory(name, create=True, size=64)
+    try:
+        with pytest.raises(TimeoutError):
+            SharedIconCache(name=name, timeout=0.05).open()
+        assert memory.buf is not None
+        memory.buf[:4] = b"ABCD"
+        with pytest.raises(ValueError, match="not a cache"):
+            SharedIconCache(name=name).open()
+    finally:
+        memory.close()
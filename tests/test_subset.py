@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+import zipfile
+from typing import TYPE_CHECKING
+
+import pytest
+
+from tablerpy import FilledIcon, OutlineIcon
+from tablerpy.__main__ import main
+from tablerpy._scan import scan_source
+from tablerpy._subset import SubsetError, build_subset
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+SOURCE = """\
+import tablerpy
+from tablerpy import OutlineIcon
+
+icon = OutlineIcon.HOME
+other = tablerpy.FilledIcon.BRAND_GITHUB.value
+members = OutlineIcon.__members__
+typo = OutlineIcon.HOMME
+"""
+
+
+def test_scan_source() -> None:
+    references = scan_source(SOURCE, "app.py")
+    assert [str(reference) for reference in references] == [
+        "app.py:4: OutlineIcon.HOME",
+        "app.py:5: FilledIcon.BRAND_GITHUB",
+        "app.py:7: OutlineIcon.HOMME",
+    ]
+    assert [reference.icon for reference in references] == [
+        OutlineIcon.HOME,
+        FilledIcon.BRAND_GITHUB,
+        None,
+    ]
+
+
+def test_build_subset(tmp_path: Path) -> None:
+    icons: set[FilledIcon | OutlineIcon] = {
+        OutlineIcon.HOME,
+        OutlineIcon.HOME_OFF,
+        FilledIcon.HOME,
+    }
+    package = build_subset(icons, tmp_path)
+    assert sorted(p.name for p in (package / "icons" / "outline").iterdir()) == [
+        "home-off.svg",
+        "home.svg",
+    ]
+    assert not (package / "icons" / "filled" / "star.svg").exists()
+
+    code = (
+        "import tablerpy\n"
+        "from tablerpy import OutlineIcon, FilledIcon\n"
+        "print(len(tablerpy.load_table()), [icon.name for icon in OutlineIcon],\n"
+        "      tablerpy.off_variant(OutlineIcon.HOME).name,\n"
+        "      tablerpy.filled_counterpart(OutlineIcon.HOME).name,\n"
+        "      tablerpy.get_icon(FilledIcon.HOME).is_file(),\n"
+        "      hasattr(FilledIcon, 'STAR'))\n"
+    )
+    output = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code],
+        cwd=tmp_path,
+        env={"PYTHONPATH": str(tmp_path)},
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    assert output == "3 ['HOME_OFF', 'HOME'] HOME_OFF HOME True False\n"
+
+    with pytest.raises(FileExistsError):
+        build_subset(icons, tmp_path)
+
+
+def test_build_subset_check(tmp_path: Path) -> None:
+    (tmp_path / "app").mkdir()
+    (tmp_path / "app" / "main.py").write_text(SOURCE, encoding="utf-8")
+    with pytest.raises(SubsetError, match=r"(?s)2 references.*BRAND_GITHUB.*HOMME"):
+        build_subset(
+            [OutlineIcon.HOME, OutlineIcon.STAR],
+            tmp_path / "dist",
+            check=[tmp_path / "app"],
+        )
+    assert not (tmp_path / "dist").exists()
+
+
+def test_subset_command(tmp_path: Path) -> None:
+    manifest = tmp_path / "usage.json"
+    manifest.write_text(
+        json.dumps(
+            {"version": 1, "icons": [{"icon": "star", "style": "filled", "hits": 4}]},
+        ),
+        encoding="utf-8",
+    )
+    args = ["subset", "outline/home", "--manifest", str(manifest), "--wheel"]
+    assert main([*args, "--output", str(tmp_path)]) == 0
+    (wheel,) = tmp_path.glob("*.whl")
+    with zipfile.ZipFile(wheel) as archive:
+        names = archive.namelist()
+        assert "tablerpy/icons/outline/home.svg" in names
+        assert "tablerpy/icons/filled/star.svg" in names
+        assert "tablerpy/icons/filled/home.svg" not in names
+        assert archive.read("tablerpy/filled.py").endswith(b'STAR = "star.svg"\n')
+        assert any(name.endswith(".dist-info/RECORD") for name in names)
+
+    assert main([*args, "--output", str(tmp_path)]) == 1
+    assert main(["subset", "not-an-icon", "--output", str(tmp_path)]) == 2
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import pytest
+
+from tablerpy import FilledIcon, OutlineIcon, get_icon, load_table
+from tablerpy._artifact import TABLE, Artifact, ArtifactError, load_artifact
+from tablerpy._table import IconTable
+
+
+def test_table_matches_enums() -> None:
+    table = load_table()
+    assert len(table) == len(OutlineIcon) + len(FilledIcon)
+    assert [table.icon(row) for row in range(len(table))] == [
+        *OutlineIcon,
+        *FilledIcon,
+    ]
+
+
+@pytest.mark.parametrize("icon", [FilledIcon.BRAND_GITHUB, OutlineIcon.BRAND_GITHUB])
+def test_table_row(icon: FilledIcon | OutlineIcon) -> None:
+    table = load_table()
+    row = table.row(icon)
+    assert table.icon(row) is icon
+    assert table.name(row) == "brand-github"
+    assert table.style(row) == ("filled" if isinstance(icon, FilledIcon) else "outline")
+    assert table.data(row) == get_icon(icon).read_bytes()
+    assert table["length"][row] == len(table.data(row))
+
+
+def test_table_without_numpy(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("tablerpy._artifact.import_numpy", lambda: None)
+    monkeypatch.setattr("tablerpy._table.import_numpy", lambda: None)
+    table = IconTable(load_artifact(TABLE))
+    column = table["paths"]
+    assert isinstance(column, memoryview)
+    assert column[table.row(OutlineIcon.HOME)] == 4
+    with pytest.raises(ImportError):
+        table.to_numpy()
+
+
+def test_table_numpy() -> None:
+    np = pytest.importorskip("numpy")
+    table = load_table()
+    assert isinstance(table["hash"], np.ndarray)
+    assert int(np.count_nonzero(table["style"] == 1)) == len(FilledIcon)
+    records = table.to_numpy()
+    assert records.shape == (len(table),)
+    assert records["length"].sum() == sum(table["length"])
+
+
+def test_artifact_invalid() -> None:
+    with pytest.raises(ArtifactError):
+        Artifact(b"nope")
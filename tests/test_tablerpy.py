@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import subprocess
+import sys
 from pathlib import Path
 
 import pytest
 
+import tablerpy
 from tablerpy import FilledIcon, OutlineIcon, get_icon
 
 
@@ -12,3 +15,22 @@ def test_get_icon(icon: FilledIcon | OutlineIcon) -> None:
     icon_path = get_icon(icon)
     assert isinstance(icon_path, Path)
     assert icon_path.exists()
+
+
+def test_lazy_imports() -> None:
+    code = (
+        "import sys, tablerpy\n"
+        "print(sorted({'asyncio', 'multiprocessing'} & set(sys.modules)))\n"
+        "tablerpy.ASGIApp\n"
+        "print(sorted({'asyncio', 'multiprocessing'} & set(sys.modules)))\n"
+    )
+    output = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert output.stdout == "[]\n['asyncio']\n"
+    assert tablerpy.SharedIconCache.__module__ == "tablerpy._shared"
+    with pytest.raises(AttributeError, match="no attribute 'missing'"):
+        tablerpy.missing  # noqa: B018
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+import tablerpy
+from tablerpy import FilledIcon, OutlineIcon, icons_by_category, icons_by_tag
+from tablerpy._artifact import Artifact
+from tablerpy._build import build_tag_index, collect_icons, read_metadata
+from tablerpy._tags import InvertedIndex
+
+METADATA = {
+    "cash": {"name": "cash", "category": "E-commerce", "tags": ["money", "pay"]},
+    "coin": {
+        "name": "coin",
+        "category": "Currencies",
+        "tags": ["Money", "usd", 1],
+    },
+    "home": {"name": "home", "category": "Buildings", "tags": ["house"]},
+}
+
+
+@pytest.fixture(scope="module")
+def tags_artifact(tmp_path_factory: pytest.TempPathFactory) -> Artifact:
+    path = tmp_path_factory.mktemp("metadata") / "icons.json"
+    path.write_text(json.dumps(METADATA))
+    records = collect_icons(Path(tablerpy.__file__).parent / "icons")
+    return Artifact(build_tag_index(records, read_metadata(path)))
+
+
+@pytest.fixture
+def _tags_index(monkeypatch: pytest.MonkeyPatch, tags_artifact: Artifact) -> None:
+    tags = InvertedIndex(tags_artifact, "tag")
+    categories = InvertedIndex(tags_artifact, "category")
+    monkeypatch.setattr("tablerpy._tags.load_tag_index", lambda: tags)
+    monkeypatch.setattr("tablerpy._tags.load_category_index", lambda: categories)
+
+
+def test_read_metadata_list(tmp_path: Path) -> None:
+    path = tmp_path / "icons.json"
+    path.write_text('[{"name": "home", "tags": [" House "], "category": null}]')
+    meta = read_metadata(path)["home"]
+    assert meta.tags == ("house",)
+    assert meta.category == ""
+
+
+@pytest.mark.usefixtures("_tags_index")
+def test_icons_by_tag() -> None:
+    assert icons_by_tag("MONEY", style="outline") == [
+        OutlineIcon.CASH,
+        OutlineIcon.COIN,
+    ]
+    assert icons_by_tag("money", "usd") == [
+        OutlineIcon.COIN,
+        FilledIcon.COIN,
+    ]
+    assert icons_by_tag("1") == [
+        OutlineIcon.COIN,
+        FilledIcon.COIN,
+    ]
+    assert icons_by_tag("money", "house") == []
+    assert icons_by_tag("unknown") == []
+    assert icons_by_tag() == []
+
+
+@pytest.mark.usefixtures("_tags_index")
+def test_icons_by_category() -> None:
+    assert icons_by_category("buildings") == [OutlineIcon.HOME, FilledIcon.HOME]
+    assert icons_by_category("Buildings", style="filled") == [FilledIcon.HOME]
+    assert icons_by_category("unknown") == []
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from tablerpy import (
+    FilledIcon,
+    OutlineIcon,
+    UsageRecorder,
+    get_icon,
+    icon_url,
+    read_usage,
+    render,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_usage_recorder(tmp_path: Path) -> None:
+    path = tmp_path / "usage.json"
+    get_icon(OutlineIcon.HOME)  # Not recorded.
+    with UsageRecorder(path, interval=None) as recorder:
+        get_icon(OutlineIcon.HOME)
+        get_icon(OutlineIcon.HOME)
+        render(FilledIcon.HOME, size=32)
+        icon_url(OutlineIcon.BRAND_GITHUB)
+        assert recorder.counts() == {
+            OutlineIcon.HOME: 2,
+            OutlineIcon.BRAND_GITHUB: 1,
+            FilledIcon.HOME: 1,
+        }
+        assert not path.exists()
+    get_icon(OutlineIcon.HOME)  # Not recorded.
+
+    assert json.loads(path.read_text(encoding="utf-8")) == {
+        "version": 1,
+        "icons": [
+            {"icon": "home", "style": "outline", "hits": 2},
+            {"icon": "brand-github", "style": "outline", "hits": 1},
+            {"icon": "home", "style": "filled", "hits": 1},
+        ],
+    }
+
+    # Counts are merged with the manifest, once per flush.
+    recorder = UsageRecorder(path, interval=None)
+    recorder.start()
+    get_icon(FilledIcon.HOME)
+    recorder.flush()
+    recorder.flush()
+    recorder.stop()
+    assert read_usage(path) == {
+        OutlineIcon.HOME: 2,
+        OutlineIcon.BRAND_GITHUB: 1,
+        FilledIcon.HOME: 2,
+    }
+
+
+def test_usage_recorder_interval(tmp_path: Path) -> None:
+    path = tmp_path / "usage.json"
+    recorder = UsageRecorder(path, interval=0.01)
+    recorder.start()
+    try:
+        get_icon(OutlineIcon.HOME)
+        for _ in range(200):
+            if path.exists():
+                break
+            time.sleep(0.01)
+        assert read_usage(path) == {OutlineIcon.HOME: 1}
+    finally:
+        recorder.stop()
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_usage_recorder_fork(tmp_path: Path) -> None:
+    path = tmp_path / "usage.json"
+    with UsageRecorder(path, interval=3600) as recorder:
+        get_icon(OutlineIcon.HOME)
+        pids = []
+        for _ in range(4):
+            pid = os.fork()
+            if pid == 0:  # pragma: no cover
+                threads = [thread.name for thread in threading.enumerate()]
+                for _ in range(20):
+                    get_icon(FilledIcon.STAR)
+                    recorder.flush()
+                os._exit(0 if "tablerpy-usage" in threads else 1)
+            pids.append(pid)
+        for pid in pids:
+            assert os.waitpid(pid, 0)[1] == 0
+
+    assert read_usage(path) == {OutlineIcon.HOME: 1, FilledIcon.STAR: 80}
+
+
+def test_read_usage_invalid(tmp_path: Path) -> None:
+    path = tmp_path / "usage.json"
+    path.write_text(
+        json.dumps(
+            {
+                "version": 1,
+                "icons": [
+                    {"icon": "home", "style": "outline", "hits": 3},
+                    {"icon": "removed-icon", "style": "outline", "hits": 1},
+                ],
+            },
+        ),
+        encoding="utf-8",
+    )
+    assert read_usage(path) == {OutlineIcon.HOME: 3}
+
+    path.write_text("[]", encoding="utf-8")
+    with pytest.raises(ValueError, match="Unsupported usage manifest"):
+        read_usage(path)
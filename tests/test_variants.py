@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from tablerpy import (
+    FilledIcon,
+    OutlineIcon,
+    base_icon,
+    family,
+    filled_counterpart,
+    off_variant,
+    outline_counterpart,
+    variants,
+)
+
+
+def test_counterparts() -> None:
+    assert filled_counterpart(OutlineIcon.HOME) is FilledIcon.HOME
+    assert filled_counterpart(FilledIcon.HOME) is FilledIcon.HOME
+    assert outline_counterpart(FilledIcon.HOME) is OutlineIcon.HOME
+    assert filled_counterpart(OutlineIcon.HOME_OFF) is None
+
+
+def test_off_variant() -> None:
+    assert off_variant(OutlineIcon.HOME) is OutlineIcon.HOME_OFF
+    assert off_variant(OutlineIcon.HOME_OFF) is None
+
+
+def test_base_icon() -> None:
+    assert base_icon(OutlineIcon.HOME_OFF) is OutlineIcon.HOME
+    assert base_icon(OutlineIcon.A_B_2) is OutlineIcon.A_B
+    assert base_icon(OutlineIcon.ARMCHAIR_2_OFF) is OutlineIcon.ARMCHAIR_2
+    assert base_icon(OutlineIcon.ARMCHAIR_2) is OutlineIcon.ARMCHAIR
+    assert base_icon(OutlineIcon.HOME) is OutlineIcon.HOME
+    # Numbers of sequences starting at 0 or 1 are values, not variants.
+    assert base_icon(OutlineIcon.NUMBER_1) is OutlineIcon.NUMBER_1
+    assert base_icon(OutlineIcon.BATTERY_2) is OutlineIcon.BATTERY_2
+
+
+def test_variants() -> None:
+    assert variants(OutlineIcon.ARMCHAIR) == [
+        OutlineIcon.ARMCHAIR_2,
+        OutlineIcon.ARMCHAIR_OFF,
+    ]
+    assert variants(OutlineIcon.ARMCHAIR_2) == [OutlineIcon.ARMCHAIR_2_OFF]
+    assert variants(OutlineIcon.NUMBER) == []
+
+
+def test_variants_inverse_off() -> None:
+    for icon in [*OutlineIcon, *FilledIcon]:
+        off = off_variant(icon)
+        if off is not None:
+            assert base_icon(off) is icon
+            assert off in variants(icon)
+
+
+def test_family() -> None:
+    icons = family(OutlineIcon.BRAND_GITHUB)
+    assert OutlineIcon.BRAND_GITLAB in icons
+    assert all(icon.name.startswith("BRAND_") for icon in icons)
+    assert len(icons) == sum(icon.name.startswith("BRAND_") for icon in OutlineIcon)
+    assert FilledIcon.BRAND_GITHUB in family(FilledIcon.BRAND_GITHUB)
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import gzip
+from typing import TYPE_CHECKING, Dict, Tuple
+from wsgiref.util import setup_testing_defaults
+
+import pytest
+
+from tablerpy import OutlineIcon, WSGIApp, get_icon, icon_url, load_table
+from tablerpy._http import etag_matches
+
+if TYPE_CHECKING:
+    from typing import Callable
+
+    from _typeshed import OptExcInfo
+    from _typeshed.wsgi import WSGIEnvironment
+
+Response = Tuple[str, Dict[str, str], bytes]
+
+
+def request(app: WSGIApp, path: str, **environ: str) -> Response:
+    env: WSGIEnvironment = {"PATH_INFO": path, **environ}
+    setup_testing_defaults(env)
+    response: dict[str, object] = {}
+
+    def start_response(
+        status: str,
+        headers: list[tuple[str, str]],
+        exc_info: OptExcInfo | None = None,  # noqa: ARG001
+    ) -> Callable[[bytes], object]:
+        response["status"] = status
+        response["headers"] = dict(headers)
+        return lambda _: None
+
+    body = b"".join(app(env, start_response))
+    return response["status"], response["headers"], body  # type: ignore[return-value]
+
+
+def test_wsgi_get() -> None:
+    status, headers, body = request(WSGIApp(), "/outline/home.svg")
+    table = load_table()
+    assert status == "200 OK"
+    assert body == get_icon(OutlineIcon.HOME).read_bytes()
+    assert headers["Content-Type"] == "image/svg+xml"
+    assert headers["Content-Length"] == str(len(body))
+    assert headers["Cache-Control"] == "public, max-age=31536000"
+    assert headers["ETag"] == f'"{table["hash"][table.row(OutlineIcon.HOME)]:016x}"'
+
+
+def test_wsgi_fingerprinted() -> None:
+    app = WSGIApp()
+    status, headers, body = request(app, icon_url(OutlineIcon.HOME))
+    assert status == "200 OK"
+    assert body == get_icon(OutlineIcon.HOME).read_bytes()
+    assert headers["Cache-Control"] == "public, max-age=31536000, immutable"
+
+    status, _, _ = request(app, "/outline/home.000000.svg")
+    assert status == "404 Not Found"
+
+
+def test_wsgi_gzip() -> None:
+    app = WSGIApp()
+    _, plain, _ = request(app, "/outline/home.svg")
+    status, headers, body = request(
+        app,
+        "/outline/home.svg",
+        HTTP_ACCEPT_ENCODING="gzip, br",
+    )
+    assert status == "200 OK"
+    assert headers["Content-Encoding"] == "gzip"
+    assert headers["Vary"] == plain["Vary"] == "Accept-Encoding"
+    assert headers["Content-Length"] == str(len(body))
+    assert gzip.decompress(body) == get_icon(OutlineIcon.HOME).read_bytes()
+    assert "Content-Encoding" not in plain
+    assert headers["ETag"] != plain["ETag"]
+
+    status, _, _ = request(
+        app,
+        "/outline/home.svg",
+        HTTP_ACCEPT_ENCODING="gzip",
+        HTTP_IF_NONE_MATCH=headers["ETag"],
+    )
+    assert status == "304 Not Modified"
+
+
+def test_wsgi_head() -> None:
+    status, headers, body = request(
+        WSGIApp(cache_control="no-cache"),
+        "/filled/home.svg",
+        REQUEST_METHOD="HEAD",
+    )
+    assert status == "200 OK"
+    assert headers["Cache-Control"] == "no-cache"
+    assert int(headers["Content-Length"]) > 0
+    assert body == b""
+
+
+def test_wsgi_not_modified() -> None:
+    app = WSGIApp()
+    _, headers, _ = request(app, "/outline/home.svg")
+    status, not_modified, body = request(
+        app,
+        "/outline/home.svg",
+        HTTP_IF_NONE_MATCH=f'"other", W/{headers["ETag"]}',
+    )
+    assert status == "304 Not Modified"
+    assert not_modified["ETag"] == headers["ETag"]
+    assert body == b""
+
+    status, _, _ = request(app, "/outline/home.svg", HTTP_IF_NONE_MATCH='"other"')
+    assert status == "200 OK"
+
+
+@pytest.mark.parametrize(
+    ("path", "method", "expected"),
+    [
+        ("/outline/not-an-icon.svg", "GET", "404 Not Found"),
+        ("/outline/home", "GET", "404 Not Found"),
+        ("/home.svg", "GET", "404 Not Found"),
+        ("/outline/home.svg", "POST", "405 Method Not Allowed"),
+    ],
+)
+def test_wsgi_errors(path: str, method: str, expected: str) -> None:
+    status, _, body = request(WSGIApp(), path, REQUEST_METHOD=method)
+    assert status == expected
+    assert body == b""
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        ('"abc"', True),
+        ('W/"abc"', True),
+        ('"xyz", "abc"', True),
+        ("*", True),
+        ('"xyz"', False),
+        ('"ab"', False),
+    ],
+)
+def test_etag_matches(header: str, *, expected: bool) -> None:
+    assert etag_matches(header, '"abc"') is expected
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import io
+import zipfile
+from typing import Iterator
+
+import pytest
+
+from tablerpy import FilledIcon, OutlineIcon, get_icon, render, stream_zip
+
+
+def read_zip(chunks: Iterator[bytes]) -> zipfile.ZipFile:
+    archive = zipfile.ZipFile(io.BytesIO(b"".join(chunks)))
+    assert archive.testzip() is None
+    return archive
+
+
+def test_stream_zip() -> None:
+    archive = read_zip(
+        stream_zip([OutlineIcon.HOME, "home", "brand-github", "home"], style="filled"),
+    )
+    assert archive.namelist() == [
+        "outline/home.svg",
+        "filled/home.svg",
+        "filled/brand-github.svg",
+    ]
+    info = archive.getinfo("filled/brand-github.svg")
+    assert info.compress_type == zipfile.ZIP_DEFLATED
+    assert info.date_time == (1980, 1, 1, 0, 0, 0)
+    assert archive.read(info) == get_icon(FilledIcon.BRAND_GITHUB).read_bytes()
+
+
+def test_stream_zip_render() -> None:
+    params: dict[str, float | str] = {"size": 32, "color": "#f00", "stroke": 1.5}
+    archive = read_zip(stream_zip([OutlineIcon.HOME], render_params=params))
+    expected = render(OutlineIcon.HOME, size=32, color="#f00", stroke=1.5)
+    assert archive.read("outline/home.svg") == expected
+
+
+def test_stream_zip_empty() -> None:
+    assert read_zip(stream_zip([])).namelist() == []
+
+
+def test_stream_zip_incremental() -> None:
+    consumed: list[OutlineIcon] = []
+
+    def icons() -> Iterator[OutlineIcon]:
+        for icon in OutlineIcon:
+            consumed.append(icon)
+            yield icon
+
+    chunks = stream_zip(icons())
+    next(chunks)
+    assert len(consumed) == 1
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"style": "bold"},
+        {"render_params": {"size": "huge"}},
+        {"render_params": {"weight": 2}},
+    ],
+)
+def test_stream_zip_invalid(kwargs: dict[str, object]) -> None:
+    with pytest.raises(ValueError, match=r"Invalid|Unknown"):
+        stream_zip([OutlineIcon.HOME], **kwargs)  # type: ignore[arg-type]
+
+
+def test_stream_zip_unknown_icon() -> None:
+    with pytest.raises(ValueError, match="Unknown icon"):
+        b"".join(stream_zip(["not-an-icon"]))